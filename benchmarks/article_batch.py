@@ -0,0 +1,121 @@
+"""
+Article container benchmark: the previous list of dict-backed Article
+dataclasses, copied field by field in prepare_articles, against slotted
+Article records moved once into a columnar ArticleBatch.
+
+Run from the repository root:
+
+    python -m benchmarks.article_batch --articles 100000
+"""
+import argparse
+import dataclasses
+import gc
+import random
+import re
+import tracemalloc
+from datetime import datetime, timedelta
+from time import perf_counter
+from helpers.article import Article
+from helpers.article_batch import ArticleBatch
+from helpers.text_scanner import TextScanner
+
+# Article as it was before __slots__: same fields, per-instance __dict__
+LegacyArticle = dataclasses.make_dataclass(
+    "LegacyArticle",
+    [(f.name, f.type, dataclasses.field(default=f.default)) for f in dataclasses.fields(Article)],
+)
+
+WORDS = "city council budget housing schools climate wildfire insurance price gas".split()
+
+
+def make_rows(count: int, rng: random.Random) -> list[tuple]:
+    start = datetime(2024, 1, 1)
+    return [
+        (
+            " ".join(rng.choices(WORDS, k=10)),
+            start + timedelta(minutes=i),
+            " ".join(rng.choices(WORDS, k=35)),
+            f"https://cdn.example.com/{i}.jpg",
+            f"https://example.com/article/{i}",
+        )
+        for i in range(count)
+    ]
+
+
+def collect(cls, rows: list[tuple]) -> list:
+    return [
+        cls(title=title, date=date, description=description, picture_filename=picture, url=url)
+        for title, date, description, picture, url in rows
+    ]
+
+
+def legacy_prepare(articles: list, phrase: str) -> list:
+    # prepare_articles before ArticleBatch: a new object per article, copied field by field
+    prepared = []
+    for article in articles:
+        art = LegacyArticle()
+        art.title = article.title
+        art.date = article.date
+        art.url = article.url
+        art.title_count_phrase = len(re.findall(re.escape(phrase), article.title.strip(), re.IGNORECASE))
+        art.description = article.description
+        art.description_count_phrase = len(
+            re.findall(re.escape(phrase), article.description.strip(), re.IGNORECASE)
+        )
+        art.find_money_title_description = bool(
+            re.findall(r"\$[0-9,.]+|\b\d+\s*(?:dollars|USD)\b", article.title)
+        )
+        art.picture_filename = article.picture_filename
+        prepared.append(art)
+    return prepared
+
+
+def batch_prepare(articles: list, phrase: str) -> ArticleBatch:
+    # The columnar steps of prepare_articles, without logging and images
+    batch = ArticleBatch.from_articles(articles)
+    batch.dedup()
+    scanner = TextScanner.for_phrases(phrase)
+    title_counts, title_money = scanner.scan_column(batch.title)
+    description_counts, description_money = scanner.scan_column(batch.description)
+    batch.title_count_phrase = title_counts[0]
+    batch.description_count_phrase = description_counts[0]
+    batch.find_money_title_description = [t or d for t, d in zip(title_money, description_money)]
+    batch.picture_local_path = [""] * len(batch)
+    return batch
+
+
+def measure(label: str, fun) -> object:
+    # Timed without tracemalloc, which slows allocation-heavy code down
+    gc.collect()
+    start = perf_counter()
+    fun()
+    seconds = perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    result = fun()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<38} {seconds:6.2f}s {current / 1_048_576:7.1f} MB held {peak / 1_048_576:7.1f} MB peak")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=100_000)
+    parser.add_argument("--phrase", default="wildfire")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rows = make_rows(args.articles, random.Random(args.seed))
+    print(f"{args.articles} articles (strings are shared, so memory is the containers)")
+
+    legacy = measure("collect, list of dict dataclasses", lambda: collect(LegacyArticle, rows))
+    slotted = measure("collect, list of slotted Article", lambda: collect(Article, rows))
+    legacy_prepared = measure("prepare, copy per article", lambda: legacy_prepare(legacy, args.phrase))
+    batch = measure("prepare, ArticleBatch columns", lambda: batch_prepare(slotted, args.phrase))
+    measure("export rows, asdict per article", lambda: [dataclasses.asdict(a) for a in legacy_prepared])
+    measure("export rows, ArticleBatch.iter_dicts", lambda: list(batch.iter_dicts()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Output sink benchmark: write throughput, file size and read-back time of
+each export format, then every format together in a single pass.
+
+Run from the repository root (the parquet sink needs pyarrow):
+
+    python -m benchmarks.export_sinks --articles 100000
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import tempfile
+from datetime import datetime, timedelta
+from time import perf_counter
+from openpyxl import load_workbook
+from helpers.article_batch import ArticleBatch
+from tasks_methods.export_sinks import SINKS, export_articles
+
+WORDS = "city council budget housing schools climate wildfire insurance price gas".split()
+
+
+def make_batch(count: int, rng: random.Random) -> ArticleBatch:
+    start = datetime(2024, 1, 1)
+    return ArticleBatch(
+        title=[" ".join(rng.choices(WORDS, k=10)) for _ in range(count)],
+        date=[start + timedelta(minutes=i) for i in range(count)],
+        description=[" ".join(rng.choices(WORDS, k=35)) for _ in range(count)],
+        picture_filename=[f"https://cdn.example.com/{i}.jpg" for i in range(count)],
+        picture_local_path=[f"output/images/article-{i:08x}.jpg" for i in range(count)],
+        title_count_phrase=[rng.randint(0, 2) for _ in range(count)],
+        description_count_phrase=[rng.randint(0, 5) for _ in range(count)],
+        find_money_title_description=[rng.random() < 0.1 for _ in range(count)],
+        url=[f"https://example.com/article/{i}" for i in range(count)],
+    )
+
+
+def read_back(path: str) -> int:
+    # Rows read by a downstream job, with the usual reader of each format
+    extension = path.rsplit(".", 1)[1]
+    if extension == "xlsx":
+        wb = load_workbook(path, read_only=True)
+        rows = sum(1 for ws in wb.worksheets for _ in ws.iter_rows(min_row=2, values_only=True))
+        wb.close()
+        return rows
+    if extension == "csv":
+        with open(path, encoding="utf-8", newline="") as file:
+            return sum(1 for _ in csv.reader(file)) - 1
+    if extension == "jsonl":
+        with open(path, encoding="utf-8") as file:
+            return sum(1 for line in file if json.loads(line))
+    import pyarrow.parquet as pq
+
+    return pq.read_table(path).num_rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=100_000)
+    parser.add_argument("--formats", default=",".join(SINKS))
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    batch = make_batch(args.articles, random.Random(args.seed))
+    formats = args.formats.replace(",", " ").split()
+    print(f"{args.articles} articles")
+    print(f"{'format':<10} {'write':>8} {'rows/s':>10} {'MB/s':>7} {'size MB':>8} {'read':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for extension in formats:
+            start = perf_counter()
+            paths = export_articles(batch, [extension], directory, name=f"Articles-{extension}")
+            seconds = perf_counter() - start
+            if extension not in paths:
+                print(f"{extension:<10} failed, see the log")
+                continue
+            size = os.path.getsize(paths[extension]) / 1_048_576
+            start = perf_counter()
+            rows = read_back(paths[extension])
+            read_seconds = perf_counter() - start
+            assert rows == len(batch), f"{extension}: {rows} rows read back"
+            print(
+                f"{extension:<10} {seconds:7.2f}s {len(batch) / seconds:10,.0f} "
+                f"{size / seconds:7.1f} {size:8.1f} {read_seconds:7.2f}s"
+            )
+
+        start = perf_counter()
+        paths = export_articles(batch, formats, directory, name="Articles-all")
+        seconds = perf_counter() - start
+        size = sum(os.path.getsize(path) for path in paths.values()) / 1_048_576
+        print(f"{'one pass':<10} {seconds:7.2f}s {len(batch) / seconds:10,.0f} {size / seconds:7.1f} {size:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Fuzzy matching benchmark: the previous difflib sort against FuzzyIndex.
+
+Run from the repository root:
+
+    python -m benchmarks.fuzzy_match --topics 5000 --queries 200
+"""
+import argparse
+import difflib
+import random
+import string
+from time import perf_counter
+from helpers.fuzzy_index import FuzzyIndex
+
+WORDS = [
+    "world", "business", "politics", "science", "health", "sports", "opinion",
+    "climate", "california", "entertainment", "technology", "food", "travel",
+    "local", "national", "economy", "housing", "education", "music", "film",
+]
+
+
+def ratio(candidate: str, target: str) -> float:
+    return difflib.SequenceMatcher(None, candidate.lower().strip(), target.lower().strip()).ratio()
+
+
+def difflib_best(candidates: list[str], target: str) -> str:
+    # The sort find_fuzzy and select_option used before FuzzyIndex
+    return sorted(candidates, key=lambda op: ratio(op, target))[-1]
+
+
+def make_topics(count: int, rng: random.Random) -> list[str]:
+    topics = set()
+    while len(topics) < count:
+        words = rng.sample(WORDS, rng.randint(1, 3))
+        suffix = "".join(rng.choices(string.ascii_lowercase, k=3))
+        topics.add(" ".join(words).title() + f" {suffix}")
+    return sorted(topics)
+
+
+def make_query(topic: str, rng: random.Random) -> str:
+    # A typo and a case change, like a section typed by hand in the input CSV
+    chars = list(topic.lower())
+    i = rng.randrange(len(chars))
+    chars[i] = rng.choice(string.ascii_lowercase)
+    return "".join(chars)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--topics", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    topics = make_topics(args.topics, rng)
+    queries = [make_query(rng.choice(topics), rng) for _ in range(args.queries)]
+
+    start = perf_counter()
+    expected = [difflib_best(topics, query) for query in queries]
+    difflib_seconds = perf_counter() - start
+
+    start = perf_counter()
+    index = FuzzyIndex.for_candidates(topics)
+    build_seconds = perf_counter() - start
+
+    start = perf_counter()
+    found = [FuzzyIndex.for_candidates(topics).best(query).value for query in queries]
+    index_seconds = perf_counter() - start
+
+    # Ties are broken differently (difflib keeps the last, the index the first)
+    agree = sum(ratio(a, q) == ratio(b, q) for a, b, q in zip(expected, found, queries))
+    print(f"{len(topics)} topics, {len(queries)} queries")
+    print(f"difflib sort : {difflib_seconds * 1000 / len(queries):9.3f} ms/query")
+    print(f"index build  : {build_seconds * 1000:9.3f} ms (once per candidate list)")
+    print(f"index lookup : {index_seconds * 1000 / len(queries):9.3f} ms/query (cached index)")
+    print(f"speedup      : {difflib_seconds / index_seconds:9.1f}x")
+    print(f"agreement    : {agree}/{len(queries)} best match as good as difflib")
+    print(f"ngrams       : {len(index._postings)}")
+
+
+if __name__ == "__main__":
+    main()
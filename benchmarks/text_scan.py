@@ -0,0 +1,101 @@
+"""
+Text analytics benchmark: the previous per-article regex calls of
+prepare_articles against TextScanner.
+
+Run from the repository root:
+
+    python -m benchmarks.text_scan --articles 100000
+"""
+import argparse
+import random
+import re
+from time import perf_counter
+from helpers.text_scanner import TextScanner
+
+WORDS = (
+    "the city council voted on a new budget for housing and schools while residents "
+    "asked about climate policy wildfire insurance and the price of gas in california"
+).split()
+MONEY = ["$1.5 million", "$250", "40 dollars", "12 USD", "$3,000"]
+
+
+def make_text(rng: random.Random, phrase: str, words: int) -> str:
+    tokens = rng.choices(WORDS, k=words)
+    for _ in range(rng.randint(0, 2)):
+        tokens.insert(rng.randrange(len(tokens) + 1), phrase.capitalize())
+    if rng.random() < 0.2:
+        tokens.insert(rng.randrange(len(tokens) + 1), rng.choice(MONEY))
+    return " ".join(tokens)
+
+
+def contains_money(text: str) -> bool:
+    # ExcelOtherMethods.__contains_money before TextScanner
+    pattern = r"\$[0-9,.]+|\b\d+\s*(?:dollars|USD)\b"
+    return bool(re.findall(pattern, text))
+
+
+def previous(articles: list[tuple[str, str]], phrase: str) -> list[tuple[int, int, bool]]:
+    return [
+        (
+            len(re.findall(re.escape(phrase), title.strip(), re.IGNORECASE)),
+            len(re.findall(re.escape(phrase), description.strip(), re.IGNORECASE)),
+            contains_money(title),
+        )
+        for title, description in articles
+    ]
+
+
+def scanner(articles: list[tuple[str, str]], phrase: str) -> list[tuple[int, int, bool]]:
+    text_scanner = TextScanner.for_phrases(phrase)
+    results = []
+    for title, description in articles:
+        title_scan = text_scanner.scan(title)
+        description_scan = text_scanner.scan(description)
+        results.append(
+            (title_scan.counts[0], description_scan.counts[0], title_scan.money or description_scan.money)
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--articles", type=int, default=100_000)
+    parser.add_argument("--phrase", default="wildfire")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    articles = [
+        (make_text(rng, args.phrase, 12), make_text(rng, args.phrase, 40))
+        for _ in range(args.articles)
+    ]
+
+    start = perf_counter()
+    expected = previous(articles, args.phrase)
+    previous_seconds = perf_counter() - start
+
+    start = perf_counter()
+    found = scanner(articles, args.phrase)
+    scanner_seconds = perf_counter() - start
+
+    counts_agree = sum(a[:2] == b[:2] for a, b in zip(expected, found))
+    title_money_agree = sum(b[2] for a, b in zip(expected, found) if a[2])
+    phrases = [args.phrase] + rng.sample(WORDS, 9)
+    start = perf_counter()
+    multi = TextScanner.for_phrases(tuple(phrases))
+    for title, description in articles:
+        multi.scan(title)
+        multi.scan(description)
+    multi_seconds = perf_counter() - start
+
+    print(f"{len(articles)} articles, phrase {args.phrase!r}")
+    print(f"previous regex calls : {previous_seconds:7.2f}s (money in the title only)")
+    print(f"TextScanner          : {scanner_seconds:7.2f}s (money in title and description)")
+    print(f"speedup              : {previous_seconds / scanner_seconds:7.2f}x")
+    print(f"TextScanner, {len(phrases)} phrases: {multi_seconds:7.2f}s in the same pass")
+    print(f"phrase counts agree  : {counts_agree}/{len(articles)}")
+    print(f"title money kept     : {title_money_agree}/{sum(a[2] for a in expected)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,17 +4,18 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     """
-    A class to represent an article with various attributes.
+    A class to represent an article with various attributes. Slotted, so
+    large collections carry no per-instance __dict__.
 
     Attributes:
     -----------
     title : str
         The title of the article (default is an empty string).
-    date : datetime
-        The publication date of the article (default is an empty string).
+    date : datetime | None
+        The publication date of the article (default is None).
     description : str
         A description of the article (default is an empty string).
     picture_filename : str
@@ -27,11 +28,15 @@ class Article:
         The count of a specific phrase in the description (default is 0).
     find_money_title_description : bool
         A flag indicating if the term 'money' is found in the title or description (default is False).
+    url : str
+        The URL of the article page (default is an empty string).
 
     Methods:
     --------
     to_dict():
         Converts the Article instance to a dictionary.
+    from_dict(data):
+        Builds an Article from a dictionary created by to_dict.
     articles_to_json(articles):
         Converts a list of Article instances to a JSON string.
     __str__():
@@ -39,13 +44,14 @@ class Article:
     """
 
     title: str = ""
-    date: datetime = ""
+    date: datetime | None = None
     description: str = ""
     picture_filename: str = ""
     picture_local_path: str = ""
     title_count_phrase: int = 0
     description_count_phrase: int = 0
     find_money_title_description: bool = False
+    url: str = ""
 
     def to_dict(self):
         """
@@ -67,8 +73,33 @@ class Article:
             "title_count_phrase": self.title_count_phrase,
             "description_count_phrase": self.description_count_phrase,
             "find_money_title_description": self.find_money_title_description,
+            "url": self.url,
         }
 
+    @staticmethod
+    def from_dict(data: dict) -> "Article":
+        """
+        Builds an Article from a dictionary created by to_dict.
+
+        Parameters:
+        -----------
+        data : dict
+            A dictionary with the Article attributes, the date in ISO format.
+
+        Returns:
+        --------
+        Article
+            The Article instance.
+        """
+        values = {
+            field.name: data[field.name]
+            for field in dataclasses.fields(Article)
+            if field.name in data
+        }
+        if "date" in values:
+            values["date"] = datetime.fromisoformat(values["date"]) if values["date"] else None
+        return Article(**values)
+
     @staticmethod
     def articles_to_json(articles):
         """
@@ -0,0 +1,210 @@
+import dataclasses
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from helpers.article import Article
+
+COLUMNS = tuple(f.name for f in dataclasses.fields(Article))
+
+
+def naive_utc(date: datetime | None) -> datetime | None:
+    """
+    Returns a date without time zone: an aware date converted to UTC, a
+    naive date unchanged. Formats without time zones (xlsx, parquet) store
+    dates this way, so they compare equal to those read back from csv/jsonl.
+
+    Parameters:
+    -----------
+    date : datetime | None
+        The date.
+
+    Returns:
+    --------
+    datetime | None
+        The naive date.
+    """
+    if date is not None and date.tzinfo is not None:
+        return date.astimezone(timezone.utc).replace(tzinfo=None)
+    return date
+
+
+def fingerprint(title: str, date: datetime | None, url: str) -> str:
+    """
+    Returns the identity of an article: its URL or, without one, its
+    normalized title and its date (as naive UTC, see naive_utc).
+
+    Parameters:
+    -----------
+    title : str
+        The title of the article.
+    date : datetime | None
+        The publication date of the article.
+    url : str
+        The URL of the article page.
+
+    Returns:
+    --------
+    str
+        The fingerprint.
+    """
+    if url:
+        return url
+    date = naive_utc(date)
+    return f"{' '.join(title.lower().split())}|{date.isoformat() if date else ''}"
+
+
+@dataclass
+class ArticleBatch:
+    """
+    A class to represent a batch of articles stored by column.
+
+    Every Article field is a list with one value per row, so enrichment,
+    deduplication and export read and write whole columns in place
+    instead of creating and copying one object per article.
+
+    Attributes:
+    -----------
+    title, date, description, picture_filename, picture_local_path,
+    title_count_phrase, description_count_phrase, find_money_title_description, url : list
+        One column per Article field.
+
+    Methods:
+    --------
+    from_articles(articles):
+        Builds a batch from Article instances.
+    append(article):
+        Adds an Article as the last row.
+    row(index):
+        Returns a row as an Article.
+    to_articles():
+        Returns every row as an Article.
+    fingerprint(index):
+        Returns the identity of a row: its URL, or its title and date.
+    dedup():
+        Removes the rows whose fingerprint was already seen, in place.
+    iter_dicts():
+        Yields every row as the dictionary Article.to_dict would return.
+    """
+
+    title: list[str] = field(default_factory=list)
+    date: list[datetime | None] = field(default_factory=list)
+    description: list[str] = field(default_factory=list)
+    picture_filename: list[str] = field(default_factory=list)
+    picture_local_path: list[str | None] = field(default_factory=list)
+    title_count_phrase: list[int] = field(default_factory=list)
+    description_count_phrase: list[int] = field(default_factory=list)
+    find_money_title_description: list[bool] = field(default_factory=list)
+    url: list[str] = field(default_factory=list)
+
+    @staticmethod
+    def from_articles(articles: list[Article]) -> "ArticleBatch":
+        """
+        Builds a batch from Article instances, one column at a time.
+
+        Parameters:
+        -----------
+        articles : list[Article]
+            The articles.
+
+        Returns:
+        --------
+        ArticleBatch
+            The batch.
+        """
+        return ArticleBatch(
+            **{name: [getattr(article, name) for article in articles] for name in COLUMNS}
+        )
+
+    def __len__(self) -> int:
+        return len(self.title)
+
+    def append(self, article: Article) -> None:
+        """
+        Adds an Article as the last row.
+
+        Parameters:
+        -----------
+        article : Article
+            The article.
+        """
+        for name in COLUMNS:
+            getattr(self, name).append(getattr(article, name))
+
+    def row(self, index: int) -> Article:
+        """
+        Returns a row as an Article.
+
+        Parameters:
+        -----------
+        index : int
+            The row index.
+
+        Returns:
+        --------
+        Article
+            A new Article with the values of the row.
+        """
+        return Article(**{name: getattr(self, name)[index] for name in COLUMNS})
+
+    def to_articles(self) -> list[Article]:
+        """
+        Returns every row as an Article.
+
+        Returns:
+        --------
+        list[Article]
+            The articles, in row order.
+        """
+        return [Article(*values) for values in zip(*(getattr(self, name) for name in COLUMNS))]
+
+    def fingerprint(self, index: int) -> str:
+        """
+        Returns the identity of a row: its URL or, without one, its title and date.
+
+        Parameters:
+        -----------
+        index : int
+            The row index.
+
+        Returns:
+        --------
+        str
+            The fingerprint.
+        """
+        return fingerprint(self.title[index], self.date[index], self.url[index])
+
+    def dedup(self) -> int:
+        """
+        Removes the rows whose fingerprint was already seen, keeping the first one, in place.
+
+        Returns:
+        --------
+        int
+            The number of rows removed.
+        """
+        seen = set()
+        keep = []
+        for index in range(len(self)):
+            key = self.fingerprint(index)
+            if key not in seen:
+                seen.add(key)
+                keep.append(index)
+        removed = len(self) - len(keep)
+        if removed:
+            for name in COLUMNS:
+                column = getattr(self, name)
+                column[:] = [column[index] for index in keep]
+        return removed
+
+    def iter_dicts(self):
+        """
+        Yields every row as the dictionary Article.to_dict would return.
+
+        Yields:
+        -------
+        dict
+            The row, with the date in ISO format.
+        """
+        for values in zip(*(getattr(self, name) for name in COLUMNS)):
+            row = dict(zip(COLUMNS, values))
+            row["date"] = row["date"].isoformat() if row["date"] else ""
+            yield row
@@ -0,0 +1,147 @@
+import difflib
+import hashlib
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+
+NGRAM = 3
+RERANK = 5
+CACHE_SIZE = 64
+
+
+@dataclass
+class FuzzyMatch:
+    """
+    A class to represent the best match of a fuzzy lookup.
+
+    Attributes:
+    -----------
+    index : int
+        The position of the match in the candidate list.
+    value : str
+        The matching candidate.
+    score : float
+        The similarity between the candidate and the query, from 0.0 to 1.0.
+    """
+
+    index: int
+    value: str
+    score: float
+
+
+def normalize_text(t: str) -> str:
+    return " ".join(t.lower().split())
+
+
+def ngrams(text: str, n: int = NGRAM) -> set[str]:
+    """
+    Returns the character n-grams of a normalized text, padded so the word
+    boundaries count.
+    """
+    padded = f"{' ' * (n - 1)}{text} "
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+class FuzzyIndex:
+    """
+    A class to represent an n-gram index over a list of candidate strings.
+
+    The index is built once per candidate list; a lookup only scores the
+    candidates that share at least one n-gram with the query (Dice
+    coefficient over the n-gram sets), then re-ranks the few best ones with
+    difflib so the result agrees with a full SequenceMatcher sort.
+
+    Methods:
+    --------
+    for_candidates(candidates):
+        Returns the index of a candidate list, cached by content hash.
+    best(query, min_score=0.0):
+        Returns the best FuzzyMatch or None if its score is below min_score.
+    """
+
+    _cache = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    def __init__(self, candidates: list[str]) -> None:
+        self.candidates = list(candidates)
+        self._normalized = [normalize_text(candidate) for candidate in self.candidates]
+        self._sizes = []
+        self._postings = {}
+        for i, text in enumerate(self._normalized):
+            grams = ngrams(text)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(i)
+        self._exact = {}
+        for i, text in enumerate(self._normalized):
+            self._exact.setdefault(text, i)
+
+    @classmethod
+    def for_candidates(cls, candidates: list[str]) -> "FuzzyIndex":
+        """
+        Returns the index of a candidate list, building it only the first time
+        a list with the same content is seen.
+
+        Parameters:
+        -----------
+        candidates : list[str]
+            The candidate strings.
+
+        Returns:
+        --------
+        FuzzyIndex
+            The index of the candidates.
+        """
+        digest = hashlib.sha1("\x1f".join(candidates).encode("utf-8")).hexdigest()
+        with cls._cache_lock:
+            index = cls._cache.get(digest)
+            if index is not None:
+                cls._cache.move_to_end(digest)
+                return index
+        index = cls(candidates)
+        with cls._cache_lock:
+            cls._cache[digest] = index
+            if len(cls._cache) > CACHE_SIZE:
+                cls._cache.popitem(last=False)
+        return index
+
+    def best(self, query: str, min_score: float = 0.0) -> FuzzyMatch | None:
+        """
+        Returns the candidate most similar to the query.
+
+        Parameters:
+        -----------
+        query : str
+            The text to look for.
+        min_score : float
+            The minimum score to accept a match (default is 0.0, always match).
+
+        Returns:
+        --------
+        FuzzyMatch | None
+            The best match or None if there are no candidates or the best score is below min_score.
+        """
+        if not self.candidates:
+            return None
+        target = normalize_text(query)
+        exact = self._exact.get(target)
+        if exact is not None:
+            return FuzzyMatch(exact, self.candidates[exact], 1.0)
+
+        grams = ngrams(target)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        if shared:
+            dice = {i: 2 * count / (len(grams) + self._sizes[i]) for i, count in shared.items()}
+            shortlist = sorted(dice, key=lambda i: (-dice[i], i))[:RERANK]
+        else:
+            shortlist = list(range(min(RERANK, len(self.candidates))))
+
+        scored = [
+            (difflib.SequenceMatcher(None, self._normalized[i], target).ratio(), -i)
+            for i in shortlist
+        ]
+        score, i = max(scored)
+        match = FuzzyMatch(-i, self.candidates[-i], score)
+        return match if score >= min_score else None
@@ -1,6 +1,9 @@
 import dataclasses
+import os
 from dataclasses import dataclass
 
+ENGINES = ("selenium", "http")
+
 
 @dataclass
 class Payload:
@@ -13,23 +16,36 @@ class Payload:
         A phrase to be tested (default is an empty string).
     section : str
         A section identifier (default is an empty string).
+    data_range : int
+        Number of months of news to collect: 1 is the current month only, 2 the current and
+        previous month, and so on (default is 0, no date window).
     sort_by : int
         A parameter to sort the results by (default is an empty integer).
     results : int
         The number of results to be returned (default is 0).
+    engine : str
+        The search engine used for the work item, "selenium" or "http" (default is "selenium").
+    outputs : str
+        The output formats of the work item separated by commas, among the formats of the export
+        sinks (default is an empty string, the output_formats setting).
 
     Methods:
     --------
     to_dict():
         Converts the Payload instance to a dictionary.
+    from_dict(data):
+        Builds and validates a Payload from a dictionary (CSV row or work item payload).
     __str__():
         Returns a string representation containing only the non-default field values.
     """
 
     phrase_test: str = ""
     section: str = ""
+    data_range: int = 0
     sort_by: int = ""
     results: int = 0
+    engine: str = "selenium"
+    outputs: str = ""
 
     def to_dict(self):
         """
@@ -43,10 +59,62 @@ class Payload:
         return {
             "phrase_test": self.phrase_test,
             "section": self.section,
+            "data_range": self.data_range,
             "sort_by": self.sort_by,
             "results": self.results,
+            "engine": self.engine,
+            "outputs": self.outputs,
         }
 
+    @staticmethod
+    def from_dict(data: dict) -> "Payload":
+        """
+        Builds a Payload from a dictionary, validating every field.
+
+        Parameters:
+        -----------
+        data : dict
+            A CSV row (as read by csv.DictReader) or a work item payload.
+
+        Returns:
+        --------
+        Payload
+            The validated Payload instance.
+
+        Raises:
+        -------
+        KeyError
+            If a required field is missing.
+        ValueError
+            If the phrase is empty, a numeric field is not an integer or an output format is unknown.
+        """
+        # Imported here: the formats are the ones registered in the export sinks
+        from tasks_methods.export_sinks import parse_formats
+
+        phrase_test = str(data["phrase_test"] or "").strip()
+        if not phrase_test:
+            raise ValueError("phrase_test is empty")
+
+        engine = str(data.get("engine") or os.getenv("search_engine") or "selenium").strip().lower()
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown search engine: {engine}")
+
+        outputs = data.get("outputs") or ""
+        if isinstance(outputs, (list, tuple)):
+            outputs = ",".join(map(str, outputs))
+        # Empty keeps the output_formats setting, read when the work item is exported
+        outputs = parse_formats(str(outputs)) if str(outputs).strip() else []
+
+        return Payload(
+            phrase_test=phrase_test,
+            section=str(data.get("section") or "").strip(),
+            data_range=int(data.get("data_range") or 0),
+            sort_by=int(data["sort_by"]),
+            results=int(data["results"]),
+            engine=engine,
+            outputs=",".join(outputs),
+        )
+
     def __str__(self):
         """
         Returns a string containing only the non-default field values.
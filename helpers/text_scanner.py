@@ -0,0 +1,139 @@
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+# Amounts like $11.1, $111,111.11, 11 dollars or 11 USD (case-sensitive)
+MONEY_RE = re.compile(r"\$[0-9,.]+|\b\d+\s*(?:dollars|USD)\b")
+# Literals every money amount contains, checked before running the regex
+MONEY_MARKERS = ("$", "dollars", "USD")
+
+
+@dataclass
+class ScanResult:
+    """
+    A class to represent what a TextScanner found in one text.
+
+    Attributes:
+    -----------
+    counts : list[int]
+        The occurrences of each phrase, in the order the phrases were given.
+    money : bool
+        True if the text contains a money amount.
+    """
+
+    counts: list[int] = field(default_factory=list)
+    money: bool = False
+
+
+class TextScanner:
+    """
+    A class to represent a scanner that counts several phrases
+    (case-insensitive) and detects money amounts in a text.
+
+    Each text is lower-cased once and every phrase is counted on that copy
+    with str.count, which searches in C; counts do not overlap, like
+    re.findall, and each phrase is counted independently of the others.
+    The money regex is compiled once and only runs on texts that contain
+    one of its literal markers ($, dollars, USD).
+
+    Methods:
+    --------
+    for_phrases(phrases):
+        Returns the scanner of the phrases, built once per process.
+    scan(text):
+        Returns the ScanResult of a text.
+    scan_column(texts):
+        Returns the phrase counts and money flags of many texts, by column.
+    """
+
+    def __init__(self, phrases: str | list[str]) -> None:
+        if isinstance(phrases, str):
+            phrases = [phrases]
+        self.phrases = list(phrases)
+        self._needles = [phrase.lower() for phrase in self.phrases]
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def for_phrases(phrases: str | tuple[str, ...]) -> "TextScanner":
+        """
+        Returns the scanner of the phrases, built only the first time.
+
+        Parameters:
+        -----------
+        phrases : str | tuple[str, ...]
+            The phrase, or a tuple of phrases.
+
+        Returns:
+        --------
+        TextScanner
+            The scanner.
+        """
+        return TextScanner(list(phrases) if isinstance(phrases, tuple) else phrases)
+
+    def scan(self, text: str) -> ScanResult:
+        """
+        Counts the phrases and looks for money amounts in a text.
+
+        Parameters:
+        -----------
+        text : str
+            The text to scan.
+
+        Returns:
+        --------
+        ScanResult
+            The phrase counts and whether the text contains money.
+        """
+        if not text:
+            return ScanResult(counts=[0] * len(self.phrases))
+        lowered = text.lower()
+        return ScanResult(
+            counts=[lowered.count(needle) if needle else 0 for needle in self._needles],
+            money=self.has_money(text),
+        )
+
+    def has_money(self, text: str) -> bool:
+        """
+        Looks for a money amount, running the regex only on texts with a marker.
+
+        Parameters:
+        -----------
+        text : str
+            The text to scan.
+
+        Returns:
+        --------
+        bool
+            True if the text contains a money amount.
+        """
+        return (
+            bool(text)
+            and any(marker in text for marker in MONEY_MARKERS)
+            and MONEY_RE.search(text) is not None
+        )
+
+    def scan_column(self, texts: list[str]) -> tuple[list[list[int]], list[bool]]:
+        """
+        Scans a whole column of texts without creating a result per text.
+
+        Parameters:
+        -----------
+        texts : list[str]
+            The texts to scan.
+
+        Returns:
+        --------
+        tuple[list[list[int]], list[bool]]
+            One list of counts per phrase (one count per text), and the money flag of each text.
+        """
+        if len(self._needles) == 1:
+            # Lower-cased copies are not kept when each text is counted only once
+            needle = self._needles[0]
+            counts = [[text.lower().count(needle) if text and needle else 0 for text in texts]]
+        else:
+            lowered = [text.lower() if text else "" for text in texts]
+            counts = [
+                [text.count(needle) for text in lowered] if needle else [0] * len(lowered)
+                for needle in self._needles
+            ]
+        return counts, [self.has_money(text) for text in texts]
@@ -5,6 +5,9 @@ from Log.logs import Logs
 from webdriver_util.webdrv_util import *
 from dotenv import load_dotenv
 from tasks_methods.methods import ExcelOtherMethods, ProducerMethods, ScraperMethods
+from tasks_methods.image_pipeline import ImagePipeline
+from tasks_methods.output_partitions import OutputPartitions
+from tasks_methods.worker_pool import ConsumerPoolMethods
 
 load_dotenv("config\.env")
 logger = Logs.Returnlog(os.getenv("name_app"), "Tasks")
@@ -28,53 +31,38 @@ def scrapper():
     pay = ScraperMethods.get_work_item()
     if pay:
         logger.info(f"The current item from the work item has been retrieved: {pay.to_dict()}")
-    driver = get_driver(site_url=os.getenv("site_url"), headless=os.getenv("headless"))
-    initial_search = ScraperMethods.inicial_search(
-        driver=driver, phrase=pay.phrase_test
-    )
-    if initial_search:
-        logger.info("Initial search done")
-        logger.info("Starting fine searching")
-
-        # Perform fine search
-        fine_searching = ScraperMethods.fine_search(
-            driver=driver,
-            section=pay.section,
-            sort_by=pay.sort_by,
+    driver = None
+    if pay.engine != "http":
+        driver = get_driver(
+            site_url=os.getenv("site_url"),
+            headless=os.getenv("headless", "").strip().lower() == "true",
         )
-        if fine_searching:
-            logger.info("Fine searching done")
-            logger.info("Starting to collect articles")
+    ScraperMethods.process_payload(driver=driver, pay=pay)
+    ImagePipeline.default().wait()
+    # The work item wrote its own partition; output/Articles.* holds the ones of this run
+    written = OutputPartitions.default().written
+    if written:
+        ExcelOtherMethods.merge_outputs(keys=written)
+    else:
+        logger.warning("No output partition written by this run, output/Articles.* not merged")
 
-            if pay.results > 0:
-                logger.info(f"{pay.results} results will be collected")
 
-            # Collect articles
-            coll_articles = ScraperMethods.collect_articles(
-                driver=driver, results=pay.results
-            )
-            if coll_articles:
-                logger.info("Preparing articles to save")
+@task
+def scrapper_pool():
+    """Process every input Work Item with a pool of browser worker processes."""
+    stats = ConsumerPoolMethods.run_pool()
+    if stats:
+        logger.info(f"Consumer pool finished: {stats}")
+        if stats["partitions"]:
+            ExcelOtherMethods.merge_outputs(keys=stats["partitions"])
 
-                # Prepare articles for saving
-                articles_to_save = ExcelOtherMethods.prepare_articles(
-                    list_articles=coll_articles, phrase=pay.phrase_test
-                )
-                if articles_to_save:
-                    logger.info("Saving articles to Excel")
 
-                    # Export articles to Excel
-                    ExcelOtherMethods.export_excel(articles_to_save)
-            else:
-                logger.critical("There are problems to generate articles collection")
-        else:
-            logger.critical(
-                f"There are no search results with the phrase: {pay.phrase_test}"
-            )
-    else:
-        logger.critical("There is a problem with a inicial search")
+@task
+def merge_outputs():
+    """Merge the output partitions of every processed Work Item into output/Articles.*."""
+    ExcelOtherMethods.merge_outputs()
 
 
-def get_csv_produce_work_item()->str:
+def get_csv_produce_work_item() -> dict | None:
     payload = ProducerMethods.read_csv_create_work_item()
     return payload
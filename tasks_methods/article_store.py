@@ -0,0 +1,245 @@
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from time import time
+from dotenv import load_dotenv
+from helpers.article import Article
+from helpers.article_batch import ArticleBatch, fingerprint
+from helpers.payload import Payload
+from Log.logs import Logs
+
+load_dotenv("config/.env")
+logger = Logs.Returnlog(os.getenv("name_app"), "Article Store")
+
+# Host parameters per query, below the SQLite limit of older builds (999)
+QUERY_CHUNK = 500
+BUSY_TIMEOUT = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS seen (
+    scope TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    url TEXT NOT NULL,
+    title TEXT NOT NULL,
+    date TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    PRIMARY KEY (scope, fingerprint)
+) WITHOUT ROWID
+"""
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "").strip().lower() == "true"
+
+
+class ArticleStore:
+    """
+    The articles already exported by previous runs, in a local SQLite
+    database shared by every run and every worker process.
+
+    Articles are identified by their fingerprint (URL, or normalized title
+    and date) within a scope, the phrase and section of the search, so
+    an article exported for one phrase is still new for another one. The
+    database runs in WAL mode with a busy timeout, so workers can read
+    while another one writes.
+    """
+
+    _default = None
+
+    def __init__(self, path: str) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._connection = None
+
+    @classmethod
+    def default(cls) -> "ArticleStore":
+        """
+        Returns the store configured in .env, shared by the current process.
+
+        Returns:
+            ArticleStore: The shared store.
+        """
+        if cls._default is None:
+            cls._default = cls(os.getenv("article_store_file") or os.path.join("output", "article_store.sqlite3"))
+        return cls._default
+
+    @staticmethod
+    def scope(pay: Payload) -> str:
+        """
+        Returns the scope of a payload: its normalized phrase and section.
+
+        Args:
+            pay (Payload): The payload of the work item.
+
+        Returns:
+            str: The scope.
+        """
+        return f"{' '.join(pay.phrase_test.lower().split())}|{' '.join(pay.section.lower().split())}"
+
+    def known(self, scope: str, articles: list[Article]) -> list[bool]:
+        """
+        Looks up a page of articles.
+
+        Args:
+            scope (str): The scope of the search.
+            articles (list[Article]): The articles.
+
+        Returns:
+            list[bool]: True for each article already stored in the scope; all
+            False if the store cannot be read.
+        """
+        keys = [fingerprint(article.title, article.date, article.url) for article in articles]
+        found = set()
+        try:
+            with self._lock:
+                connection = self.__connect()
+                for start in range(0, len(keys), QUERY_CHUNK):
+                    chunk = keys[start:start + QUERY_CHUNK]
+                    rows = connection.execute(
+                        "SELECT fingerprint FROM seen WHERE scope = ? AND fingerprint IN "
+                        f"({', '.join('?' * len(chunk))})",
+                        [scope, *chunk],
+                    )
+                    found.update(row[0] for row in rows)
+        except sqlite3.Error as e:
+            logger.critical(f"sqlite3.Error: {e}")
+            return [False] * len(keys)
+        return [key in found for key in keys]
+
+    def remember(self, scope: str, articles: ArticleBatch | Iterable[Article]) -> int:
+        """
+        Stores exported articles, refreshing last_seen of the known ones.
+
+        Args:
+            scope (str): The scope of the search.
+            articles (ArticleBatch | Iterable[Article]): The exported articles.
+
+        Returns:
+            int: The number of articles new to the scope.
+        """
+        if isinstance(articles, ArticleBatch):
+            articles = articles.to_articles()
+        now = time()
+        rows = [
+            (
+                scope,
+                fingerprint(article.title, article.date, article.url),
+                article.url,
+                article.title,
+                article.date.isoformat() if article.date else "",
+                now,
+                now,
+            )
+            for article in articles
+        ]
+        try:
+            with self._lock:
+                connection = self.__connect()
+                with connection:
+                    new = connection.executemany(
+                        "INSERT OR IGNORE INTO seen VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+                    ).rowcount
+                    connection.executemany(
+                        "UPDATE seen SET last_seen = ? WHERE scope = ? AND fingerprint = ?",
+                        [(now, row[0], row[1]) for row in rows],
+                    )
+        except sqlite3.Error as e:
+            logger.critical(f"sqlite3.Error: {e}")
+            return 0
+        logger.info(f"Article store: {new} new and {len(rows) - new} known articles for {scope!r}")
+        return new
+
+    def close(self) -> None:
+        """
+        Closes the connection of the current process.
+        """
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __connect(self) -> sqlite3.Connection:
+        # Opened on first use: pool workers are spawned and build their own
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(SCHEMA)
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+
+class SeenArticles:
+    """
+    The articles of one payload already exported by a previous run.
+
+    filter_page() marks the known articles of each results page and, as
+    configured in .env, drops them (skip_known_articles) and ends the
+    pagination on a page where every article is known (stop_on_known_page).
+    remember() records the articles once they are exported, so an
+    interrupted run never hides articles from the next one.
+    """
+
+    def __init__(
+        self,
+        pay: Payload,
+        store: ArticleStore | None = None,
+        skip_known: bool | None = None,
+        stop_on_known: bool | None = None,
+    ) -> None:
+        self.store = store or ArticleStore.default()
+        self.scope = ArticleStore.scope(pay)
+        self.skip_known = skip_known if skip_known is not None else _env_flag("skip_known_articles")
+        self.stop_on_known = stop_on_known if stop_on_known is not None else _env_flag("stop_on_known_page")
+        self.known = 0
+
+    @property
+    def incremental(self) -> bool:
+        """
+        Returns:
+            bool: True if known articles may be left out of the collection
+            (skipped, or on the pages after a fully known one).
+        """
+        return self.skip_known or self.stop_on_known
+
+    def filter_page(self, articles: list[Article]) -> tuple[list[Article], bool]:
+        """
+        Marks the known articles of a results page.
+
+        Args:
+            articles (list[Article]): The articles of the page, in page order.
+
+        Returns:
+            tuple[list, bool]: The articles kept (without the known ones when
+            skipping them) and True if the collection should stop.
+        """
+        if not articles:
+            return articles, False
+        flags = self.store.known(self.scope, articles)
+        known = sum(flags)
+        self.known += known
+        if known:
+            logger.info(f"{known} of {len(articles)} articles already seen")
+        stop = self.stop_on_known and known == len(articles)
+        if stop:
+            logger.info("Every article of the page was already seen, stopping the collection")
+        if self.skip_known and known:
+            articles = [article for article, flag in zip(articles, flags) if not flag]
+        return articles, stop
+
+    def remember(self, articles: ArticleBatch | Iterable[Article]) -> int:
+        """
+        Records the exported articles of the payload.
+
+        Args:
+            articles (ArticleBatch | Iterable[Article]): The exported articles.
+
+        Returns:
+            int: The number of articles new to the payload scope.
+        """
+        return self.store.remember(self.scope, articles)
@@ -0,0 +1,88 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+from dotenv import load_dotenv
+from helpers.article import Article
+from helpers.payload import Payload
+from Log.logs import Logs
+
+load_dotenv("config/.env")
+logger = Logs.Returnlog(os.getenv("name_app"), "Checkpoints")
+
+
+class CollectionCheckpoint:
+    """
+    Per-payload checkpoint of the article collection, stored on local disk.
+
+    Every completed results page is appended to a JSON Lines file as
+    {"page": n, "articles": [...]}, so a retried or restarted consumer can
+    resume after the last completed page. A partially written last line
+    (crash while saving) is ignored.
+    """
+
+    def __init__(self, pay: Payload, directory: str | None = None) -> None:
+        directory = directory or os.getenv("checkpoint_dir") or os.path.join("output", "checkpoints")
+        key = json.dumps(
+            [pay.phrase_test, pay.section, pay.data_range, pay.sort_by, pay.results], ensure_ascii=False
+        )
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+        self.path = Path(directory, f"{digest}.jsonl")
+
+    def load(self) -> tuple[int, list[Article]]:
+        """
+        Reads the checkpoint.
+
+        Returns:
+            tuple[int, list[Article]]: The last completed page (0 if none) and the articles collected so far.
+        """
+        page = 0
+        list_articles = []
+        try:
+            with open(self.path, mode="r", encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.warning(f"Ignoring incomplete checkpoint line in {self.path}")
+                        break
+                    page = entry["page"]
+                    list_articles.extend(Article.from_dict(data) for data in entry["articles"])
+        except FileNotFoundError:
+            return 0, []
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring corrupted checkpoint {self.path}: {e}")
+            return 0, []
+
+        if page:
+            logger.info(f"Resuming after page {page} with {len(list_articles)} articles")
+        return page, list_articles
+
+    def save_page(self, page: int, articles: list[Article]) -> None:
+        """
+        Appends a completed page to the checkpoint.
+
+        Args:
+            page (int): The number of the completed page.
+            articles (list[Article]): The articles collected from that page.
+        """
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            line = json.dumps({"page": page, "articles": [article.to_dict() for article in articles]})
+            with open(self.path, mode="a", encoding="utf-8") as file:
+                file.write(line + "\n")
+                file.flush()
+                os.fsync(file.fileno())
+        except OSError as e:
+            logger.warning(f"Checkpoint not saved: {e}")
+
+    def clear(self) -> None:
+        """
+        Deletes the checkpoint, once the work item is finished.
+        """
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Checkpoint not deleted: {e}")
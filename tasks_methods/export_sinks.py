@@ -0,0 +1,511 @@
+import csv
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from dotenv import load_dotenv
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from helpers.article import Article
+from helpers.article_batch import COLUMNS, ArticleBatch, naive_utc
+from Log.logs import Logs
+
+load_dotenv("config/.env")
+logger = Logs.Returnlog(os.getenv("name_app"), "Export Sinks")
+
+# Rows per worksheet in Excel, header included
+EXCEL_MAX_ROWS = 1_048_576
+DATE_FORMAT = "yyyy-mm-dd hh:mm:ss"
+DATE_COLUMN = COLUMNS.index("date")
+PARQUET_ROW_GROUP = 65_536
+PARQUET_COMPRESSION = "snappy"
+DEFAULT_OUTPUTS = "xlsx"
+
+
+def iter_article_rows(articles: ArticleBatch | Iterable[Article]) -> Iterator[tuple]:
+    """
+    Yields the values of every article in COLUMNS order, without building
+    an intermediate dict or JSON document.
+
+    Args:
+        articles (ArticleBatch | Iterable[Article]): A batch, a list or a generator of articles.
+
+    Yields:
+        tuple: The values of one article.
+    """
+    if isinstance(articles, ArticleBatch):
+        yield from zip(*(getattr(articles, name) for name in COLUMNS))
+    else:
+        for article in articles:
+            yield tuple(getattr(article, name) for name in COLUMNS)
+
+
+class ArticleSink(ABC):
+    """
+    Streaming writer of one output file, fed one article row at a time.
+
+    open() starts a temporary file next to the target, write() adds a row
+    (the values of an article in COLUMNS order) and close() completes the
+    file and moves it over the target, so readers never see a partial
+    output. abort() drops the temporary file instead.
+    """
+
+    extension = ""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        self.rows = 0
+
+    def open(self) -> None:
+        """
+        Creates the output directory and starts the temporary file.
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._open()
+
+    @abstractmethod
+    def write(self, values: tuple) -> None:
+        """
+        Adds one row.
+
+        Args:
+            values (tuple): The values of an article in COLUMNS order.
+        """
+
+    def close(self) -> int:
+        """
+        Completes the file and replaces the target with it.
+
+        Returns:
+            int: The number of rows written.
+        """
+        try:
+            self._close()
+            os.replace(self.tmp_path, self.path)
+        finally:
+            self.__remove_tmp()
+        return self.rows
+
+    def abort(self) -> None:
+        """
+        Drops the output, leaving any previous target in place.
+        """
+        try:
+            self._abort()
+        finally:
+            self.__remove_tmp()
+
+    @abstractmethod
+    def _open(self) -> None:
+        """
+        Starts the temporary file.
+        """
+
+    @abstractmethod
+    def _close(self) -> None:
+        """
+        Completes the temporary file.
+        """
+
+    def _abort(self) -> None:
+        pass
+
+    def __remove_tmp(self) -> None:
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+class XlsxSink(ArticleSink):
+    """
+    Writes an .xlsx workbook with openpyxl's write-only mode, so memory
+    stays bounded whatever the number of rows. Dates are native date cells
+    (aware dates in UTC). When a worksheet reaches max_rows, the rows continue on a new worksheet
+    ("Articles (2)", ...) with its own header.
+    """
+
+    extension = "xlsx"
+
+    def __init__(self, path: str, sheet_title: str = "Articles", max_rows: int = EXCEL_MAX_ROWS) -> None:
+        super().__init__(path)
+        self.sheet_title = sheet_title
+        self.max_rows = max_rows
+        self.sheets = 0
+        self._wb = None
+        self._ws = None
+        self._sheet_rows = max_rows
+
+    def _open(self) -> None:
+        self._wb = Workbook(write_only=True)
+
+    def write(self, values: tuple) -> None:
+        if self._sheet_rows >= self.max_rows:
+            self.sheets += 1
+            title = self.sheet_title if self.sheets == 1 else f"{self.sheet_title} ({self.sheets})"
+            self._ws = self._wb.create_sheet(title)
+            self._ws.append(COLUMNS)
+            self._sheet_rows = 1
+        row = list(values)
+        date = row[DATE_COLUMN]
+        if isinstance(date, datetime):
+            # Excel has no time zones
+            cell = WriteOnlyCell(self._ws, value=naive_utc(date))
+            cell.number_format = DATE_FORMAT
+            row[DATE_COLUMN] = cell
+        self._ws.append(row)
+        self._sheet_rows += 1
+        self.rows += 1
+
+    def _close(self) -> None:
+        if self._ws is None:
+            self._wb.create_sheet(self.sheet_title)
+        self._wb.save(self.tmp_path)
+
+    def _abort(self) -> None:
+        self._wb = None
+
+
+class CsvSink(ArticleSink):
+    """
+    Writes a UTF-8 CSV file with a header row; dates are in ISO format.
+    """
+
+    extension = "csv"
+    _file = None
+
+    def _open(self) -> None:
+        self._file = open(self.tmp_path, mode="w", encoding="utf-8", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(COLUMNS)
+
+    def write(self, values: tuple) -> None:
+        row = list(values)
+        date = row[DATE_COLUMN]
+        row[DATE_COLUMN] = date.isoformat() if date else ""
+        self._writer.writerow(row)
+        self.rows += 1
+
+    def _close(self) -> None:
+        self._file.close()
+
+    def _abort(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+class JsonLinesSink(ArticleSink):
+    """
+    Writes one JSON object per line, with the keys and values of Article.to_dict.
+    """
+
+    extension = "jsonl"
+    _file = None
+
+    def _open(self) -> None:
+        self._file = open(self.tmp_path, mode="w", encoding="utf-8")
+        self._encode = json.JSONEncoder(ensure_ascii=False).encode
+
+    def write(self, values: tuple) -> None:
+        row = dict(zip(COLUMNS, values))
+        date = row["date"]
+        row["date"] = date.isoformat() if date else ""
+        self._file.write(self._encode(row))
+        self._file.write("\n")
+        self.rows += 1
+
+    def _close(self) -> None:
+        self._file.close()
+
+    def _abort(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+class ParquetSink(ArticleSink):
+    """
+    Writes a columnar Parquet file, buffering row_group rows per column
+    before handing them to pyarrow. Dates are timestamps in UTC, without time zone.
+
+    pyarrow is imported when the first Parquet file is opened, so the other
+    formats work without it.
+    """
+
+    extension = "parquet"
+
+    def __init__(self, path: str, row_group: int = PARQUET_ROW_GROUP) -> None:
+        super().__init__(path)
+        self.row_group = row_group
+        self._columns = [[] for _ in COLUMNS]
+        self._writer = None
+
+    def _open(self) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                ("title", pa.string()),
+                ("date", pa.timestamp("us")),
+                ("description", pa.string()),
+                ("picture_filename", pa.string()),
+                ("picture_local_path", pa.string()),
+                ("title_count_phrase", pa.int32()),
+                ("description_count_phrase", pa.int32()),
+                ("find_money_title_description", pa.bool_()),
+                ("url", pa.string()),
+            ]
+        )
+        self._writer = pq.ParquetWriter(self.tmp_path, self._schema, compression=PARQUET_COMPRESSION)
+
+    def write(self, values: tuple) -> None:
+        for column, value in zip(self._columns, values):
+            column.append(value)
+        self.rows += 1
+        if len(self._columns[0]) >= self.row_group:
+            self.__flush()
+
+    def _close(self) -> None:
+        self.__flush()
+        self._writer.close()
+
+    def _abort(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+    def __flush(self) -> None:
+        if not self._columns[0]:
+            return
+        dates = self._columns[DATE_COLUMN]
+        self._columns[DATE_COLUMN] = [
+            naive_utc(date) if isinstance(date, datetime) else None for date in dates
+        ]
+        arrays = [
+            self._pa.array(column, type=self._schema.field(index).type)
+            for index, column in enumerate(self._columns)
+        ]
+        self._writer.write_table(self._pa.Table.from_arrays(arrays, schema=self._schema))
+        self._columns = [[] for _ in COLUMNS]
+
+
+SINKS = {sink.extension: sink for sink in (XlsxSink, CsvSink, JsonLinesSink, ParquetSink)}
+
+
+def parse_formats(value: str | Iterable[str] | None) -> list[str]:
+    """
+    Reads a list of output formats such as "xlsx,parquet", defaulting to
+    the output_formats setting of .env.
+
+    Args:
+        value (str | Iterable[str] | None): Formats separated by commas or spaces, or a list of formats.
+
+    Returns:
+        list[str]: The formats, without duplicates, in the given order.
+
+    Raises:
+        ValueError: If a format has no sink.
+    """
+    if not value:
+        value = os.getenv("output_formats") or DEFAULT_OUTPUTS
+    if isinstance(value, str):
+        value = value.replace(",", " ").split()
+    formats = []
+    for name in value:
+        name = name.strip().lower().lstrip(".")
+        if name not in SINKS:
+            raise ValueError(f"Unknown output format: {name}")
+        if name not in formats:
+            formats.append(name)
+    return formats
+
+
+def export_articles(
+    articles: ArticleBatch | Iterable[Article],
+    formats: str | Iterable[str] | None,
+    directory: str,
+    name: str = "Articles",
+) -> dict[str, str]:
+    """
+    Writes the articles to every requested format in a single pass over
+    the rows, so a generator of articles is read only once (see export_rows).
+
+    Args:
+        articles (ArticleBatch | Iterable[Article]): A batch, a list or a generator of articles.
+        formats (str | Iterable[str] | None): The output formats (see parse_formats).
+        directory (str): The output directory.
+        name (str): The file name of the outputs, without extension.
+
+    Returns:
+        dict[str, str]: The path written for each format that succeeded.
+    """
+    return export_rows(iter_article_rows(articles), formats, directory, name)
+
+
+def export_rows(
+    rows: Iterable[tuple],
+    formats: str | Iterable[str] | None,
+    directory: str,
+    name: str = "Articles",
+) -> dict[str, str]:
+    """
+    Feeds rows (article values in COLUMNS order) to a sink per format. A
+    format that fails is logged and dropped without stopping the others;
+    if reading the rows fails, every output is dropped and the error raised.
+
+    Args:
+        rows (Iterable[tuple]): The rows, from iter_article_rows or read_rows.
+        formats (str | Iterable[str] | None): The output formats (see parse_formats).
+        directory (str): The output directory.
+        name (str): The file name of the outputs, without extension.
+
+    Returns:
+        dict[str, str]: The path written for each format that succeeded.
+    """
+    sinks = []
+    for extension in parse_formats(formats):
+        sink = SINKS[extension](os.path.join(directory, f"{name}.{extension}"))
+        try:
+            sink.open()
+            sinks.append(sink)
+        except Exception as e:
+            logger.critical(f"{type(e).__name__}: {extension} output not opened: {e}")
+            sink.abort()
+
+    try:
+        for values in rows:
+            for sink in list(sinks):
+                try:
+                    sink.write(values)
+                except Exception as e:
+                    logger.critical(f"{type(e).__name__}: {sink.extension} output dropped: {e}")
+                    sink.abort()
+                    sinks.remove(sink)
+    except BaseException:
+        for sink in sinks:
+            sink.abort()
+        raise
+
+    paths = {}
+    for sink in sinks:
+        try:
+            written = sink.close()
+            paths[sink.extension] = sink.path
+            logger.info(f"{written} articles written to {sink.path}")
+        except Exception as e:
+            logger.critical(f"{type(e).__name__}: {sink.extension} output not saved: {e}")
+    return paths
+
+
+def read_rows(path: str) -> Iterator[tuple]:
+    """
+    Streams back the rows of a file written by a sink, with the types of
+    Article (dates as datetime, counts as int), one row or row group at a time.
+
+    Args:
+        path (str): An .xlsx, .csv, .jsonl or .parquet file.
+
+    Yields:
+        tuple: The values of one article in COLUMNS order.
+
+    Raises:
+        ValueError: If the file extension has no reader.
+    """
+    extension = os.path.splitext(path)[1].lstrip(".").lower()
+    if extension not in READERS:
+        raise ValueError(f"Unknown output format: {extension}")
+    yield from READERS[extension](path)
+
+
+def _typed_row(values) -> tuple:
+    title, date, description, picture, local_path, title_count, description_count, money, url = values
+    if isinstance(date, str):
+        date = datetime.fromisoformat(date) if date else None
+    return (
+        title or "",
+        date,
+        description or "",
+        picture or "",
+        local_path or "",
+        int(title_count or 0),
+        int(description_count or 0),
+        money in (True, "True", "true", 1),
+        url or "",
+    )
+
+
+def _read_xlsx(path: str) -> Iterator[tuple]:
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True)
+    try:
+        for ws in wb.worksheets:
+            for values in ws.iter_rows(min_row=2, max_col=len(COLUMNS), values_only=True):
+                yield _typed_row(values)
+    finally:
+        wb.close()
+
+
+def _read_csv(path: str) -> Iterator[tuple]:
+    with open(path, mode="r", encoding="utf-8", newline="") as file:
+        reader = csv.reader(file)
+        next(reader, None)
+        for values in reader:
+            yield _typed_row(values)
+
+
+def _read_jsonl(path: str) -> Iterator[tuple]:
+    with open(path, mode="r", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                data = json.loads(line)
+                yield _typed_row([data.get(name) for name in COLUMNS])
+
+
+def _read_parquet(path: str) -> Iterator[tuple]:
+    import pyarrow.parquet as pq
+
+    parquet_file = pq.ParquetFile(path)
+    try:
+        for batch in parquet_file.iter_batches(batch_size=PARQUET_ROW_GROUP, columns=list(COLUMNS)):
+            for values in zip(*(column.to_pylist() for column in batch.columns)):
+                yield _typed_row(values)
+    finally:
+        parquet_file.close()
+
+
+READERS = {"xlsx": _read_xlsx, "csv": _read_csv, "jsonl": _read_jsonl, "parquet": _read_parquet}
+
+
+def write_articles_xlsx(
+    articles: ArticleBatch | Iterable[Article],
+    excel_file_path: str,
+    sheet_title: str = "Articles",
+    max_rows: int = EXCEL_MAX_ROWS,
+) -> int:
+    """
+    Streams articles into an .xlsx file (see XlsxSink).
+
+    Args:
+        articles (ArticleBatch | Iterable[Article]): A batch, a list or a generator of articles.
+        excel_file_path (str): The .xlsx file to write.
+        sheet_title (str): The title of the first worksheet.
+        max_rows (int): Rows per worksheet, header included.
+
+    Returns:
+        int: The number of articles written.
+    """
+    sink = XlsxSink(excel_file_path, sheet_title, max_rows)
+    sink.open()
+    try:
+        for values in iter_article_rows(articles):
+            sink.write(values)
+    except BaseException:
+        sink.abort()
+        raise
+    written = sink.close()
+    logger.info(f"{written} articles written to {excel_file_path} in {max(sink.sheets, 1)} sheet(s)")
+    return written
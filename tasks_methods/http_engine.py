@@ -0,0 +1,251 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
+import requests
+from dotenv import load_dotenv
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
+from helpers.article import Article
+from helpers.payload import Payload
+from Log.logs import Logs
+from tasks_methods.article_store import SeenArticles
+from tasks_methods.checkpoints import CollectionCheckpoint
+from tasks_methods.search_urls import build_search_url
+from tasks_methods.topic_catalog import TopicCatalog
+from webdriver_util.webdrv_util import apply_date_window, date_window_start, parse_article_date
+
+load_dotenv("config/.env")
+logger = Logs.Returnlog(os.getenv("name_app"), "HTTP Engine")
+
+TIMEOUT = 15
+POOL_SIZE = 10
+PREFETCH_PAGES = 4
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/117.0.0.0 Safari/537.36"
+
+RESULTS_XPATH = '//ul[contains(concat(" ", normalize-space(@class), " "), " search-results-module-results-menu ")]/li'
+FILTERS_XPATH = '//div[@class="search-filter-menu-wrapper"]//li'
+
+
+def _text(elm, xpath: str) -> str:
+    """
+    Returns the whitespace-normalized text of the first node matching xpath, or "".
+    """
+    nodes = elm.xpath(xpath)
+    return " ".join(nodes[0].text_content().split()) if nodes else ""
+
+
+class HttpSearchEngine:
+    """
+    Search engine that reads the static search result pages over a pooled
+    HTTP session instead of driving a browser.
+    """
+
+    _default = None
+
+    def __init__(
+        self,
+        site_url: str,
+        pool_size: int = POOL_SIZE,
+        timeout: float = TIMEOUT,
+        prefetch_pages: int | None = None,
+    ) -> None:
+        self.site_url = site_url
+        self.timeout = timeout
+        self.prefetch_pages = max(1, prefetch_pages or int(os.getenv("http_prefetch_pages") or PREFETCH_PAGES))
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=2)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"User-Agent": USER_AGENT})
+
+    @classmethod
+    def default(cls) -> "HttpSearchEngine":
+        """
+        Returns the engine shared by the current process, configured from .env.
+
+        Returns:
+            HttpSearchEngine: The shared engine.
+        """
+        if cls._default is None:
+            cls._default = cls(site_url=os.getenv("site_url"))
+        return cls._default
+
+    def fetch_page(self, url: str) -> str | None:
+        """
+        Downloads a page through the pooled session.
+
+        Args:
+            url (str): The page URL.
+
+        Returns:
+            str | None: The page HTML or None on error.
+        """
+        try:
+            logger.debug(f"GET {url}")
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return response.text
+        except requests.RequestException as e:
+            logger.error(f"RequestException: {e}")
+            return None
+
+    @staticmethod
+    def parse_articles(page_html: str, base_url: str = "") -> list[Article]:
+        """
+        Parses the search result items of a page into Article objects.
+
+        Args:
+            page_html (str): The HTML of a search results page.
+            base_url (str): The page URL, used to make the article links absolute.
+
+        Returns:
+            list[Article]: The articles of the page, in page order.
+        """
+        doc = lxml_html.fromstring(page_html)
+        articles = []
+        for li in doc.xpath(RESULTS_XPATH):
+            article = Article()
+            article.title = _text(li, './/h3[@class="promo-title"]')
+            article.description = _text(li, './/p[@class="promo-description"]')
+            time_str = _text(li, './/p[starts-with(@class, "promo-timestamp")]')
+            try:
+                article.date = parse_article_date(time_str)
+            except ValueError:
+                logger.warning(f"Date not recognized: {time_str!r}")
+            links = li.xpath('.//h3[@class="promo-title"]//a/@href')
+            if links:
+                article.url = urljoin(base_url, links[0])
+            pictures = li.xpath('.//img[contains(@src, ".jpg")]/@src')
+            if pictures:
+                article.picture_filename = pictures[0]
+            articles.append(article)
+        return articles
+
+    @staticmethod
+    def parse_sections(page_html: str) -> dict[str, str]:
+        """
+        Parses the section filter of a search results page.
+
+        Args:
+            page_html (str): The HTML of a search results page.
+
+        Returns:
+            dict[str, str]: The filter ids by section name.
+        """
+        doc = lxml_html.fromstring(page_html)
+        sections = {}
+        for li in doc.xpath(FILTERS_XPATH):
+            name = _text(li, ".//span")
+            values = li.xpath(".//input/@value")
+            if name and values:
+                sections[name] = values[0]
+        return sections
+
+    def resolve_section(self, phrase: str, section: str) -> str | None:
+        """
+        Finds the filter id of the section that best matches the given name,
+        reading the filter list only when the topic catalog cannot resolve it.
+
+        Args:
+            phrase (str): The search phrase, used to load the filter list.
+            section (str): The section name to look for.
+
+        Returns:
+            str | None: The filter id or None if it could not be resolved.
+        """
+        catalog = TopicCatalog.default()
+        section_id = catalog.section_id(section, phrase)
+        if section_id:
+            return section_id
+        page_html = self.fetch_page(build_search_url(self.site_url, phrase))
+        if page_html is None:
+            return None
+        return catalog.learn(section, self.parse_sections(page_html))
+
+    def fetch_articles(self, url: str) -> list[Article] | None:
+        """
+        Downloads and parses one search results page.
+
+        Args:
+            url (str): The page URL.
+
+        Returns:
+            list[Article] | None: The articles of the page or None if the page could not be downloaded.
+        """
+        page_html = self.fetch_page(url)
+        if page_html is None:
+            return None
+        return self.parse_articles(page_html, url)
+
+    def collect_articles(self, pay: Payload, seen: SeenArticles | None = None) -> list[Article] | None:
+        """
+        Collects the articles of a search until the results quota is met, the
+        pages run out or, sorted by newest, the date window is passed.
+
+        The first page is read alone to learn the page size; the following
+        pages are fetched and parsed concurrently, prefetch_pages at a time,
+        and merged in page order. Every page is checkpointed, so a retried
+        work item resumes after the last completed page.
+
+        Args:
+            pay (Payload): The payload of the work item.
+            seen (SeenArticles | None): Articles exported by previous runs, to skip them
+                or to stop on a page where every article is known.
+
+        Returns:
+            list[Article] | None: The collected articles or None if the search
+            could not be done over HTTP (the caller should fall back to Selenium).
+        """
+        section_id = ""
+        if pay.section.strip():
+            section_id = self.resolve_section(pay.phrase_test, pay.section)
+            if section_id is None:
+                return None
+
+        date_from = date_window_start(pay.data_range)
+        checkpoint = CollectionCheckpoint(pay)
+        page, list_articles = checkpoint.load()
+        page += 1
+        page_size = 0
+        finished = 0 < pay.results <= len(list_articles)
+        with ThreadPoolExecutor(max_workers=self.prefetch_pages) as executor:
+            while not finished:
+                if not page_size:
+                    window = 1
+                elif pay.results > 0:
+                    missing = pay.results - len(list_articles)
+                    window = min(self.prefetch_pages, -(-missing // page_size))
+                else:
+                    window = self.prefetch_pages
+                urls = [
+                    build_search_url(self.site_url, pay.phrase_test, pay.sort_by, number, section_id)
+                    for number in range(page, page + window)
+                ]
+                for number, articles in enumerate(executor.map(self.fetch_articles, urls), start=page):
+                    if articles is None:
+                        # Completed pages stay in the checkpoint for the retry
+                        return None
+                    if not articles:
+                        finished = True
+                        break
+                    page_size = max(page_size, len(articles))
+                    kept_articles, out_of_window = apply_date_window(
+                        articles, date_from, pay.sort_by == 1
+                    )
+                    if seen:
+                        kept_articles, all_known = seen.filter_page(kept_articles)
+                        out_of_window = out_of_window or all_known
+                    list_articles.extend(kept_articles)
+                    checkpoint.save_page(number, kept_articles)
+                    logger.info(f"Page {number}: {len(kept_articles)} articles")
+                    if out_of_window:
+                        finished = True
+                        break
+                    if 0 < pay.results <= len(list_articles):
+                        finished = True
+                        break
+                page += window
+
+        if pay.results > 0:
+            del list_articles[pay.results:]
+        return list_articles
@@ -0,0 +1,287 @@
+import hashlib
+import os
+import random
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import perf_counter, sleep
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from Log.logs import Logs
+from tasks_methods.image_store import ImageStore
+
+load_dotenv("config/.env")
+logger = Logs.Returnlog(os.getenv("name_app"), "Image Downloader")
+
+WORKERS = 8
+TIMEOUT = 10
+RETRIES = 3
+BACKOFF = 0.5
+CHUNK_SIZE = 64 * 1024
+RETRY_STATUS = {429, 500, 502, 503, 504}
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 Chrome/117.0.0.0 Safari/537.36"
+
+
+class RetryableStatus(Exception):
+    """
+    Raised for an HTTP status worth retrying (throttling or server error).
+    """
+
+
+class ImageDownloader:
+    """
+    Downloads images concurrently over a pooled keep-alive session.
+
+    Every request has a timeout; connection errors, timeouts and throttling
+    or server errors are retried with exponential backoff and jitter. The
+    body is streamed to a temporary file that replaces the target only
+    when complete, so an interrupted download is never reused. With an
+    ImageStore, images are fetched once into the store and linked to the
+    requested paths. stats holds the totals since the downloader was created.
+    """
+
+    _default = None
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        timeout: float | None = None,
+        retries: int | None = None,
+        backoff: float = BACKOFF,
+        store: ImageStore | None = None,
+    ) -> None:
+        self.workers = max(1, workers or int(os.getenv("image_workers") or WORKERS))
+        self.timeout = timeout or float(os.getenv("image_timeout") or TIMEOUT)
+        self.retries = retries if retries is not None else int(os.getenv("image_retries") or RETRIES)
+        self.backoff = backoff
+        self.store = store
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.workers, pool_maxsize=self.workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({"User-Agent": USER_AGENT})
+        self._lock = threading.Lock()
+        self._executor = None
+        self.stats = self.__new_stats()
+
+    @classmethod
+    def default(cls) -> "ImageDownloader":
+        """
+        Returns the downloader shared by the current process, configured from .env.
+
+        Returns:
+            ImageDownloader: The shared downloader.
+        """
+        if cls._default is None:
+            cls._default = cls(store=ImageStore.default())
+        return cls._default
+
+    @staticmethod
+    def __new_stats() -> dict:
+        return {
+            "requested": 0,
+            "downloaded": 0,
+            "cached": 0,
+            "revalidated": 0,
+            "failed": 0,
+            "retries": 0,
+            "bytes": 0,
+        }
+
+    def __count(self, batch: dict | None = None, **counts) -> None:
+        """
+        Adds to the totals of the downloader and, if given, to the counters of one batch.
+        """
+        with self._lock:
+            for name, value in counts.items():
+                self.stats[name] += value
+                if batch is not None:
+                    batch[name] += value
+
+    def fetch(
+        self, url: str, tmp_path: str, headers: dict | None = None, batch: dict | None = None
+    ) -> dict | None:
+        """
+        Streams one URL to a file, with retries and backoff, hashing the content on the way.
+
+        Args:
+            url (str): The image URL.
+            tmp_path (str): The file the body is written to.
+            headers (dict | None): Extra request headers (conditional request validators).
+            batch (dict | None): The counters of the batch the download belongs to.
+
+        Returns:
+            dict | None: status, etag, last_modified, sha256 and size of the response
+            (a 304 writes no file), or None if the download failed.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                logger.info(f"Downloading image: {url}")
+                with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+                    if response.status_code in RETRY_STATUS:
+                        raise RetryableStatus(f"HTTP {response.status_code}")
+                    response.raise_for_status()
+                    result = {
+                        "status": response.status_code,
+                        "etag": response.headers.get("ETag", ""),
+                        "last_modified": response.headers.get("Last-Modified", ""),
+                        "sha256": "",
+                        "size": 0,
+                    }
+                    if response.status_code == 304:
+                        return result
+                    digest = hashlib.sha256()
+                    with open(tmp_path, mode="wb") as file:
+                        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                            file.write(chunk)
+                            digest.update(chunk)
+                            result["size"] += len(chunk)
+                result["sha256"] = digest.hexdigest()
+                self.__count(batch, bytes=result["size"])
+                return result
+            except (requests.ConnectionError, requests.Timeout, RetryableStatus) as e:
+                if attempt == self.retries:
+                    logger.error(f"Image download failed after {attempt + 1} attempts: {url}: {e}")
+                    break
+                delay = self.backoff * 2 ** attempt * (1 + random.random())
+                logger.warning(f"Retrying image in {delay:.1f}s ({e}): {url}")
+                self.__count(batch, retries=1)
+                sleep(delay)
+            except requests.RequestException as e:
+                logger.error(f"RequestException: {e}")
+                break
+            except OSError as e:
+                logger.critical(f"OSError: {e}")
+                break
+
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return None
+
+    def download(self, url: str, path: str, batch: dict | None = None) -> str | None:
+        """
+        Makes one image available at a local path. With a store, a known image
+        is linked from it, revalidated with a conditional request once stale;
+        without a store, an existing file is kept.
+
+        Args:
+            url (str): The image URL.
+            path (str): The local file path.
+            batch (dict | None): The counters of the batch the download belongs to.
+
+        Returns:
+            str | None: The local path or None if the download failed.
+        """
+        self.__count(batch, requested=1)
+        if self.store is None:
+            if os.path.isfile(path) and os.path.getsize(path) > 0:
+                logger.info(f"Image already downloaded: {path}")
+                self.__count(batch, cached=1)
+                return path
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.part"
+            if self.fetch(url, tmp_path, batch=batch) is None:
+                self.__count(batch, failed=1)
+                return None
+            os.replace(tmp_path, path)
+            self.__count(batch, downloaded=1)
+            return path
+
+        try:
+            entry = self.store.lookup(url)
+            if entry and self.store.is_fresh(entry):
+                self.store.touch(url, entry)
+                self.__count(batch, cached=1)
+                return self.store.link(entry, path)
+
+            tmp_path = self.store.temp_path()
+            result = self.fetch(url, tmp_path, self.store.conditional_headers(entry), batch)
+            if result is None:
+                if entry:
+                    logger.warning(f"Revalidation failed, using the stored image: {url}")
+                    self.store.touch(url, entry)
+                    self.__count(batch, cached=1)
+                    return self.store.link(entry, path)
+                self.__count(batch, failed=1)
+                return None
+            if result["status"] == 304:
+                if not entry:
+                    logger.error(f"Unexpected 304 for an unknown image: {url}")
+                    self.__count(batch, failed=1)
+                    return None
+                self.store.touch(url, entry, validated=True)
+                self.__count(batch, revalidated=1)
+                return self.store.link(entry, path)
+
+            entry = self.store.add(
+                url,
+                tmp_path,
+                result["sha256"],
+                result["size"],
+                result["etag"],
+                result["last_modified"],
+            )
+            self.__count(batch, downloaded=1)
+            return self.store.link(entry, path)
+        except OSError as e:
+            logger.critical(f"OSError: {e}")
+            self.__count(batch, failed=1)
+            return None
+
+    def flush_store(self) -> None:
+        """
+        Applies the disk budget of the store and saves its index, after a batch.
+        """
+        if self.store is not None:
+            # Evicting saves the index too
+            self.store.evict()
+
+    def submit(self, url: str, path: str) -> Future:
+        """
+        Queues one download on the background executor of the downloader,
+        shared by every batch of the process, and returns at once.
+
+        Args:
+            url (str): The image URL.
+            path (str): The local file path.
+
+        Returns:
+            Future: Resolves with the local path, or None if the download failed.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="image-download"
+                )
+        return self._executor.submit(self.download, url, path)
+
+    def download_all(self, jobs: list[tuple[str, str]]) -> list[str | None]:
+        """
+        Downloads a batch of images with at most workers requests in flight.
+
+        Args:
+            jobs (list[tuple[str, str]]): The (url, local path) of each image.
+
+        Returns:
+            list[str | None]: The local path of each image, None where the download failed, in job order.
+        """
+        if not jobs:
+            return []
+        # The totals are shared with the background downloads: count this batch apart
+        batch = self.__new_stats()
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(jobs))) as executor:
+            paths = list(executor.map(lambda job: self.download(*job, batch=batch), jobs))
+        self.flush_store()
+        seconds = perf_counter() - start
+        images_per_sec = batch["downloaded"] / seconds if seconds else 0.0
+        mb_per_sec = batch["bytes"] / 1_048_576 / seconds if seconds else 0.0
+        logger.info(
+            f"Images: {batch['downloaded']} downloaded, {batch['cached']} cached, "
+            f"{batch['revalidated']} revalidated, "
+            f"{batch['failed']} failed in {seconds:.2f}s "
+            f"({images_per_sec:.1f} images/s, {mb_per_sec:.2f} MB/s)"
+        )
+        return paths
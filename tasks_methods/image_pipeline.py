@@ -0,0 +1,149 @@
+import os
+import threading
+from concurrent.futures import Future
+from time import perf_counter
+from dotenv import load_dotenv
+from helpers.article_batch import ArticleBatch
+from Log.logs import Logs
+from tasks_methods.image_downloader import ImageDownloader
+
+load_dotenv("config/.env")
+logger = Logs.Returnlog(os.getenv("name_app"), "Image Pipeline")
+
+
+class ImagePipeline:
+    """
+    Background stage that downloads the images of the exported articles
+    while the consumer goes on with the next work item.
+
+    Each batch fills the picture_local_path column of its ArticleBatch as
+    the downloads complete and, once the whole batch is done, calls its on_complete
+    callback (to write the workbook again with every image path). A batch
+    only calls back if no newer batch was started with the same key, so a
+    late batch never overwrites the output of a later work item. The check
+    and the callback run under the export lock of the key, which the
+    consumer also holds while it writes the output and starts the batch.
+    """
+
+    _default = None
+
+    def __init__(self, downloader: ImageDownloader | None = None) -> None:
+        self.downloader = downloader or ImageDownloader.default()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._batches = 0
+        self._latest = {}
+        self._export_locks = {}
+
+    @classmethod
+    def default(cls) -> "ImagePipeline":
+        """
+        Returns the pipeline shared by the current process.
+
+        Returns:
+            ImagePipeline: The shared pipeline.
+        """
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def export_lock(self, key: str) -> threading.RLock:
+        """
+        Returns the lock that serializes the writes of an output.
+
+        Args:
+            key (str): The output, as passed to start.
+
+        Returns:
+            threading.RLock: The lock of the key, reentrant as a batch may call back in the thread that starts it.
+        """
+        with self._lock:
+            return self._export_locks.setdefault(key, threading.RLock())
+
+    def start(
+        self,
+        batch: ArticleBatch,
+        jobs: list[tuple[int, str, str]],
+        on_complete=None,
+        key: str = "",
+    ) -> int:
+        """
+        Queues the images of a batch of articles and returns at once.
+
+        Args:
+            batch (ArticleBatch): The articles the images belong to.
+            jobs (list[tuple[int, str, str]]): The (row, image url, local path) of each image.
+            on_complete (callable | None): Called with no arguments when every image of the batch is done.
+            key (str): The output the batch belongs to; only the latest batch of a key calls back.
+
+        Returns:
+            int: The number of queued images.
+        """
+        with self._lock:
+            self._batches += 1
+            number = self._batches
+            self._latest[key] = number
+            if not jobs:
+                return 0
+            self._pending += 1
+
+        start = perf_counter()
+        remaining = [len(jobs)]
+        failed = [0]
+        lock = threading.Lock()
+
+        def done(index: int, future: Future) -> None:
+            try:
+                batch.picture_local_path[index] = future.result()
+            except Exception as e:
+                logger.error(f"Image download crashed: {e}")
+                batch.picture_local_path[index] = None
+            with lock:
+                if batch.picture_local_path[index] is None:
+                    failed[0] += 1
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                self.__finish(number, key, len(jobs), failed[0], perf_counter() - start, on_complete)
+
+        for index, url, path in jobs:
+            future = self.downloader.submit(url, path)
+            future.add_done_callback(lambda future, index=index: done(index, future))
+        logger.info(f"Image batch {number}: {len(jobs)} images queued")
+        return len(jobs)
+
+    def __finish(self, batch: int, key: str, images: int, failed: int, seconds: float, on_complete) -> None:
+        try:
+            self.downloader.flush_store()
+            logger.info(
+                f"Image batch {batch}: {images - failed} ready, {failed} failed in {seconds:.2f}s "
+                f"({images / seconds if seconds else 0.0:.1f} images/s)"
+            )
+            with self.export_lock(key):
+                with self._lock:
+                    latest = self._latest.get(key) == batch
+                if on_complete is not None:
+                    if latest:
+                        on_complete()
+                    else:
+                        logger.info(f"Image batch {batch}: output already replaced, not written again")
+        except Exception as e:
+            logger.critical(f"Unexpected error: {e}")
+        finally:
+            with self._idle:
+                self._pending -= 1
+                self._idle.notify_all()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Blocks until every queued batch is done, before the process exits.
+
+        Args:
+            timeout (float | None): Maximum seconds to wait.
+
+        Returns:
+            bool: True if the pipeline is idle, False on timeout.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
@@ -0,0 +1,290 @@
+import json
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from time import time
+from dotenv import load_dotenv
+from helpers.file_lock import file_lock
+from Log.logs import Logs
+
+load_dotenv("config/.env")
+logger = Logs.Returnlog(os.getenv("name_app"), "Image Store")
+
+MAX_MB = 500
+REVALIDATE_AFTER = 24 * 60 * 60
+
+
+class ImageStore:
+    """
+    Local image store shared by every run, addressed by content.
+
+    Each image is stored once under objects/<sha256>, whatever the
+    URLs or titles it was downloaded for, and hard linked to the per-run
+    paths (copied only when they are on another file system).
+    The index maps every URL to its object with the validators of the last
+    response (ETag, Last-Modified), so a known URL is reused as is while
+    fresh and revalidated with a conditional request afterwards. When the
+    objects exceed the disk budget, the least recently used ones are evicted.
+    The index file is merged and evicted under a file lock, as the pool
+    workers share the store.
+    """
+
+    _default = None
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int | None = None,
+        revalidate_after: float | None = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.objects_dir = self.directory / "objects"
+        self.index_path = self.directory / "index.json"
+        self.max_bytes = max_bytes if max_bytes is not None else int(
+            float(os.getenv("image_store_max_mb") or MAX_MB) * 1_048_576
+        )
+        self.revalidate_after = (
+            revalidate_after
+            if revalidate_after is not None
+            else float(os.getenv("image_store_revalidate_after") or REVALIDATE_AFTER)
+        )
+        self._lock = threading.Lock()
+        self._index = self.__load()
+        self._touched_urls = set()
+        self._touched_objects = set()
+
+    @classmethod
+    def default(cls) -> "ImageStore":
+        """
+        Returns the store shared by the current process, configured from .env.
+
+        Returns:
+            ImageStore: The shared store.
+        """
+        if cls._default is None:
+            cls._default = cls(os.getenv("image_store_dir") or os.path.join("output", "image_store"))
+        return cls._default
+
+    def object_path(self, entry: dict) -> Path:
+        return self.objects_dir / entry["sha256"]
+
+    def lookup(self, url: str) -> dict | None:
+        """
+        Returns the index entry of a URL whose object is still on disk.
+
+        Args:
+            url (str): The image URL.
+
+        Returns:
+            dict | None: The entry (sha256, etag, last_modified, checked_at) or None on a miss.
+        """
+        with self._lock:
+            entry = self._index["urls"].get(url)
+        if entry and self.object_path(entry).is_file():
+            return dict(entry)
+        return None
+
+    def is_fresh(self, entry: dict) -> bool:
+        """
+        Returns:
+            bool: True if the entry was validated within revalidate_after.
+        """
+        return time() - entry.get("checked_at", 0) < self.revalidate_after
+
+    @staticmethod
+    def conditional_headers(entry: dict | None) -> dict:
+        """
+        Builds the headers of a conditional request from the validators of an entry.
+
+        Args:
+            entry (dict | None): The index entry of the URL.
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since headers, empty without validators.
+        """
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def temp_path(self) -> Path:
+        """
+        Returns a unique temporary path inside the store, on the same file
+        system as the objects so it can be moved in atomically.
+        """
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        return self.objects_dir / f".{uuid.uuid4().hex}.part"
+
+    def add(
+        self,
+        url: str,
+        tmp_path: Path,
+        sha256: str,
+        size: int,
+        etag: str = "",
+        last_modified: str = "",
+    ) -> dict:
+        """
+        Moves a downloaded file into the store, deduplicated by content, and indexes its URL.
+
+        Args:
+            url (str): The image URL.
+            tmp_path (Path): The downloaded file, from temp_path.
+            sha256 (str): The SHA-256 of the file content.
+            size (int): The file size in bytes.
+            etag (str): The ETag of the response.
+            last_modified (str): The Last-Modified of the response.
+
+        Returns:
+            dict: The index entry of the URL.
+        """
+        entry = {
+            "sha256": sha256,
+            "etag": etag,
+            "last_modified": last_modified,
+            "checked_at": time(),
+        }
+        target = self.object_path(entry)
+        if target.is_file():
+            # Same content already stored for another URL or title
+            os.remove(tmp_path)
+        else:
+            os.replace(tmp_path, target)
+        with self._lock:
+            self._index["urls"][url] = entry
+            self._index["objects"][target.name] = {"size": size, "last_used": time()}
+            self._touched_urls.add(url)
+            self._touched_objects.add(target.name)
+        return entry
+
+    def touch(self, url: str, entry: dict, validated: bool = False) -> None:
+        """
+        Marks an entry as used now and, after a 304 response, as validated now.
+
+        Args:
+            url (str): The image URL.
+            entry (dict): The index entry of the URL.
+            validated (bool): True if the entry was just revalidated.
+        """
+        name = self.object_path(entry).name
+        with self._lock:
+            if validated:
+                entry["checked_at"] = time()
+                self._index["urls"][url] = entry
+                self._touched_urls.add(url)
+            objects = self._index["objects"]
+            size = objects.get(name, {}).get("size") or self.object_path(entry).stat().st_size
+            objects[name] = {"size": size, "last_used": time()}
+            self._touched_objects.add(name)
+
+    def link(self, entry: dict, path: str) -> str:
+        """
+        Makes a stored image available at a per-run path without copying it.
+
+        Args:
+            entry (dict): The index entry of the image.
+            path (str): The per-run file path.
+
+        Returns:
+            str: The per-run path.
+        """
+        source = self.object_path(entry)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_link = f"{path}.{uuid.uuid4().hex}.link"
+        try:
+            os.link(source, tmp_link)
+        except OSError:
+            # Other file system: a symbolic link would dangle once the object is evicted
+            shutil.copy2(source, tmp_link)
+        os.replace(tmp_link, path)
+        return path
+
+    def evict(self) -> int:
+        """
+        Deletes the least recently used objects until the store fits the disk
+        budget, counting the objects indexed by every process, and saves the index.
+
+        Returns:
+            int: The number of bytes freed.
+        """
+        return self.__sync(evict=True)
+
+    def save(self) -> None:
+        """
+        Merges the entries changed by this process into the index file, atomically.
+        """
+        self.__sync(evict=False)
+
+    def __sync(self, evict: bool) -> int:
+        """
+        Loads the index file, merges the entries changed by this process,
+        optionally evicts, and replaces the file, all under the file lock of
+        the index, so the pool workers never drop each other's entries.
+        """
+        freed = 0
+        with self._lock:
+            if not (evict or self._touched_urls or self._touched_objects):
+                return 0
+            try:
+                with file_lock(self.index_path):
+                    index = self.__load()
+                    for name in self._touched_objects:
+                        # Unless another process evicted it in the meantime
+                        if name in self._index["objects"] and (self.objects_dir / name).is_file():
+                            index["objects"][name] = self._index["objects"][name]
+                    for url in self._touched_urls:
+                        if url in self._index["urls"]:
+                            index["urls"][url] = self._index["urls"][url]
+                    if evict:
+                        freed = self.__evict(index["objects"])
+                    index["urls"] = {
+                        url: entry
+                        for url, entry in index["urls"].items()
+                        if self.object_path(entry).name in index["objects"]
+                    }
+                    tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+                    with open(tmp_path, mode="w", encoding="utf-8") as file:
+                        json.dump(index, file)
+                    os.replace(tmp_path, self.index_path)
+            except OSError as e:
+                logger.warning(f"Image store index not saved: {e}")
+                return freed
+            self._index = index
+            self._touched_urls = set()
+            self._touched_objects = set()
+        if freed:
+            logger.info(f"Evicted {freed / 1_048_576:.1f} MB from the image store")
+        return freed
+
+    def __evict(self, objects: dict) -> int:
+        total = sum(item["size"] for item in objects.values())
+        freed = 0
+        for name in sorted(objects, key=lambda name: objects[name]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(self.objects_dir / name)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Image not evicted: {e}")
+                continue
+            size = objects.pop(name)["size"]
+            total -= size
+            freed += size
+        return freed
+
+    def __load(self) -> dict:
+        try:
+            with open(self.index_path, mode="r", encoding="utf-8") as file:
+                index = json.load(file)
+            return {"urls": index.get("urls", {}), "objects": index.get("objects", {})}
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, AttributeError) as e:
+            logger.warning(f"Ignoring corrupted image store index {self.index_path}: {e}")
+        return {"urls": {}, "objects": {}}
@@ -1,23 +1,37 @@
 import csv
-import json
+import hashlib
 import os
 import re
-from urllib.error import URLError
-import urllib.request
 from datetime import datetime
 from pathlib import Path
+from time import perf_counter
 from dotenv import load_dotenv
-from openpyxl import Workbook
 from robocorp import workitems
 from helpers.article import Article
+from helpers.article_batch import ArticleBatch
 from helpers.payload import Payload
 from helpers.selector import Selector
+from helpers.text_scanner import TextScanner
+from tasks_methods.article_store import SeenArticles
+from tasks_methods.checkpoints import CollectionCheckpoint
+from tasks_methods.export_sinks import export_articles
+from tasks_methods.http_engine import HttpSearchEngine
+from tasks_methods.image_downloader import ImageDownloader
+from tasks_methods.image_pipeline import ImagePipeline
+from tasks_methods.output_partitions import OutputPartitions
+from tasks_methods.search_urls import build_search_url
+from tasks_methods.topic_catalog import TopicCatalog
 from webdriver_util.webdrv_util import *
 from urllib.parse import unquote
 from dotenv import load_dotenv
 
 load_dotenv("config/.env")
 
+NO_RESULTS_SELECTOR = Selector(css="div[class='search-results-module-no-results']")
+RESULTS_HEADER_SELECTOR = Selector(css="div[class='search-results-module-results-header']")
+# Raced by every search path: results first, so a tie always means results
+SEARCH_OUTCOME_SPECS = [selector_spec(RESULTS_HEADER_SELECTOR), selector_spec(NO_RESULTS_SELECTOR)]
+
 
 class ProducerMethods:
     @staticmethod
@@ -26,40 +40,23 @@ class ProducerMethods:
         Reads a CSV file and creates work items from its data.
 
         Args:
-            debug (bool): If True, the function returns the payload instead of creating work items.
+            debug (bool): If True, the function returns the first payload instead of creating work items.
 
         Returns:
-            Payload | None: Returns payload if debug is True, otherwise None.
+            Payload | dict | None: Returns the first payload if debug is True, otherwise the
+            producer statistics returned by stream_csv_create_work_items.
         """
-        csv_file_path = os.path.join("devdata", "csv_input.csv")
+        csv_file_path = os.getenv("caminho_csv") or os.path.join("devdata", "csv_input.csv")
+        if not debug:
+            return ProducerMethods.stream_csv_create_work_items(csv_file_path)
+
         if os.path.exists(csv_file_path):
             try:
-                with open(csv_file_path, mode="r", newline="") as file:
-                    reader = csv.reader(file)
-                    header = next(reader)
-                    for row in reader:
-                        payload = Payload(
-                            phrase_test=row[0],
-                            section=row[1],
-                            sort_by=int(row[2]),
-                            results=int(row[3]),
-                        )
-                        if not debug:
-                            return workitems.outputs.create(
-                                payload={
-                                    "phrase_test": payload.phrase_test,
-                                    "section": payload.section,
-                                    "sort_by": payload.sort_by,
-                                    "results": payload.results,
-                                }
-                            )
-                        else:
-                            return payload
-            except FileNotFoundError:
-                logger.critical(f"The CSV file: {csv_file_path} was not found.")
-                return None
-            except ValueError as e:
-                logger.critical(f"ValueError: {e}")
+                with open(csv_file_path, mode="r", newline="", encoding="utf-8-sig") as file:
+                    for row in csv.DictReader(file):
+                        return Payload.from_dict(row)
+            except (KeyError, ValueError) as e:
+                logger.critical(f"Invalid row: {e}")
                 return None
             except csv.Error as e:
                 logger.critical(f"csv.Error: {e}")
@@ -71,6 +68,107 @@ class ProducerMethods:
             logger.critical(f"The CSV file: {csv_file_path} was not found.")
             return None
 
+    @staticmethod
+    def __flush_work_items(batch: list[Payload]) -> int:
+        """
+        Creates and saves the output work items for a batch of payloads.
+
+        Args:
+            batch (list[Payload]): Payloads to be emitted.
+
+        Returns:
+            int: The number of work items created.
+        """
+        items = [
+            workitems.outputs.create(payload=payload.to_dict(), save=False)
+            for payload in batch
+        ]
+        for item in items:
+            item.save()
+        batch.clear()
+        return len(items)
+
+    @staticmethod
+    def stream_csv_create_work_items(
+        csv_file_path: str, batch_size: int | None = None, reject_file_path: str | None = None
+    ) -> dict | None:
+        """
+        Streams a CSV file and creates one output work item for every valid row.
+
+        Rows are read one at a time and work items are saved in batches of
+        batch_size, so memory stays constant whatever the size of the file.
+        Rows that cannot be converted into a Payload are written to the
+        reject file together with the error and do not abort the run.
+
+        Args:
+            csv_file_path (str): Path of the CSV search plan.
+            batch_size (int | None): Number of work items saved per batch (default from .env).
+            reject_file_path (str | None): CSV file receiving the invalid rows (default from .env).
+
+        Returns:
+            dict | None: Counters (rows, created, rejected, seconds, rows_per_sec) or None on error.
+        """
+        batch_size = batch_size or int(os.getenv("producer_batch_size", 500))
+        reject_file_path = reject_file_path or os.getenv(
+            "producer_reject_file", os.path.join("output", "rejected_rows.csv")
+        )
+        if not os.path.exists(csv_file_path):
+            logger.critical(f"The CSV file: {csv_file_path} was not found.")
+            return None
+
+        stats = {"rows": 0, "created": 0, "rejected": 0}
+        reject_file = None
+        reject_writer = None
+        start = perf_counter()
+        try:
+            # The reject file is only opened on a rejected row: a clean run must
+            # not leave the rejects of an earlier run behind
+            if os.path.exists(reject_file_path):
+                os.remove(reject_file_path)
+            with open(csv_file_path, mode="r", newline="", encoding="utf-8-sig") as file:
+                reader = csv.DictReader(file)
+                batch = []
+                for row in reader:
+                    stats["rows"] += 1
+                    try:
+                        batch.append(Payload.from_dict(row))
+                    except (KeyError, TypeError, ValueError) as e:
+                        if reject_writer is None:
+                            os.makedirs(os.path.dirname(reject_file_path) or ".", exist_ok=True)
+                            reject_file = open(reject_file_path, mode="w", newline="", encoding="utf-8")
+                            reject_writer = csv.writer(reject_file)
+                            reject_writer.writerow(["line", *reader.fieldnames, "error"])
+                        reject_writer.writerow(
+                            [reader.line_num, *(row.get(name) for name in reader.fieldnames), repr(e)]
+                        )
+                        stats["rejected"] += 1
+                        continue
+                    if len(batch) >= batch_size:
+                        stats["created"] += ProducerMethods.__flush_work_items(batch)
+                        logger.info(f"{stats['created']} work items created")
+                if batch:
+                    stats["created"] += ProducerMethods.__flush_work_items(batch)
+        except csv.Error as e:
+            logger.critical(f"csv.Error: {e}")
+            return None
+        except Exception as e:
+            logger.critical(f"Unexpected error: {e}")
+            return None
+        finally:
+            if reject_file:
+                reject_file.close()
+
+        stats["seconds"] = perf_counter() - start
+        stats["rows_per_sec"] = stats["rows"] / stats["seconds"] if stats["seconds"] else 0.0
+        logger.info(
+            f"{stats['rows']} rows read, {stats['created']} work items created, "
+            f"{stats['rejected']} rejected in {stats['seconds']:.2f}s "
+            f"({stats['rows_per_sec']:.0f} rows/sec)"
+        )
+        if stats["rejected"]:
+            logger.warning(f"Rejected rows written to: {reject_file_path}")
+        return stats
+
 
 class ScraperMethods:
     @staticmethod
@@ -85,12 +183,7 @@ class ScraperMethods:
             item = workitems.inputs.current
             if item:
                 logger.info(f"Received payload:{item.payload}")
-                pay = Payload(
-                    phrase_test=item.payload["phrase_test"],
-                    section=item.payload["section"],
-                    sort_by=int(item.payload["sort_by"]),
-                    results=int(item.payload["results"]),
-                )
+                pay = Payload.from_dict(item.payload)
                 return pay
             else:
                 logger.critical("An error occurred during the process!")
@@ -100,6 +193,9 @@ class ScraperMethods:
         except TypeError as e:
             logger.critical(f"TypeError: {e}")
             return None
+        except ValueError as e:
+            logger.critical(f"ValueError: {e}")
+            return None
         except Exception as e:
             logger.critical(f"Unexpected error: {e}")
             return None
@@ -148,38 +244,48 @@ class ScraperMethods:
         driver: WebDriver,
         section: str,
         sort_by: int = 0,
+        phrase: str = "",
     ):
         """
-        Performs fine-tuned search with additional filters.
+        Performs fine-tuned search with additional filters. A section already
+        in the topic catalog is clicked directly; otherwise the topic list is
+        read from the filter modal and added to the catalog.
 
         Args:
             driver (WebDriver): The WebDriver instance.
-            phrase (str): The search phrase.
             section (str): The section to filter.
             sort_by (int): The sort option (default is 0).
+            phrase (str): The search phrase, used to refresh a stale topic catalog.
 
         Returns:
             bool indicating success.
         """
         try:
-            no_results_match = find_element(
-                driver.driver,
-                Selector(css="div[class='search-results-module-no-results']"),
-            )
-            if no_results_match:
+            # One wait tells "no results" from "results" as soon as either appears
+            outcome, _ = wait_for_first(driver.driver, SEARCH_OUTCOME_SPECS)
+            if outcome == 1:
                 logger.critical("No search match found.")
                 return False
 
-            # Expand Filter
-            label_search = find_element(
-                driver.driver, Selector(css="span[class='see-all-text']")
-            )
-            if label_search:
-                center_element(driver.driver, label_search)
-                click_elm(driver.driver, label_search)
-                wait_for_modal(driver.driver)
-                if len(section.strip()) > 0:
-                    list_topics = extract_names_from_list_items(driver)
+            if len(section.strip()) > 0:
+                # Known sections are clicked straight from the topic catalog
+                catalog = TopicCatalog.default()
+                section_id = catalog.section_id(section, phrase)
+                topic = click_section_filter(driver.driver, section_id) if section_id else None
+                if topic:
+                    logger.info(f"Element '{topic}' was clicked.")
+                else:
+                    # Catalog miss or changed topics: read the list from the filter modal
+                    label_search = find_element(
+                        driver.driver, Selector(css="span[class='see-all-text']")
+                    )
+                    if label_search:
+                        center_element(driver.driver, label_search)
+                        click_elm(driver.driver, label_search)
+                        wait_for_modal(driver.driver)
+                    filters = read_section_filters(driver.driver)
+                    catalog.update(filters)
+                    list_topics = list(filters) or extract_names_from_list_items(driver)
                     if list_topics:
                         element_topic, topic = search_and_click_topics(
                             driver.driver, list_topics, section
@@ -187,18 +293,18 @@ class ScraperMethods:
                         if not element_topic and not topic:
                             return False, 0
 
-                if sort_by > 0:  # not Relevance (default)
-                    select_sort_by = find_element(
-                        driver.driver, Selector(css="select[name='s']")
-                    )
-                    if select_sort_by:
-                        if sort_by in [1, 2]:
-                            center_element(driver.driver, select_sort_by)
-                            select_option_value(select_sort_by, sort_by)
-                        else:
-                            logger.error(f"Sort parameter does not exist: {sort_by}")
-                            logger.info("Relevance is selected")
-                return (True,)
+            if sort_by > 0:  # not Relevance (default)
+                select_sort_by = find_element(
+                    driver.driver, Selector(css="select[name='s']")
+                )
+                if select_sort_by:
+                    if sort_by in [1, 2]:
+                        center_element(driver.driver, select_sort_by)
+                        select_option_value(select_sort_by, sort_by)
+                    else:
+                        logger.error(f"Sort parameter does not exist: {sort_by}")
+                        logger.info("Relevance is selected")
+            return (True,)
         except AttributeError as e:
             logger.critical(f"AttributeError: {e}")
             return None
@@ -210,106 +316,198 @@ class ScraperMethods:
         return False
 
     @staticmethod
-    def collect_articles(driver: WebDriver, results: int = 0) -> list[Article] | None:
+    def __extract_articles_batch(driver: WebDriver) -> list[Article] | None:
+        """
+        Extracts every search result of the current page with a single script call.
+
+        Args:
+            driver (WebDriver): The WebDriver instance.
+
+        Returns:
+            list[Article] | None: The articles of the page or None if an error occurs.
+        """
+        list_articles = []
+        for cont, row in enumerate(extract_search_results(driver.driver), start=1):
+            logger.info(f"Creating an article object: {cont}")
+            if row["title"] is None or row["timestamp"] is None or row["description"] is None:
+                logger.critical(f"Article information not found in result {cont}: {row}")
+                return None
+            article = Article()
+            article.title = row["title"]
+            article.description = row["description"]
+            article.date = parse_article_date(row["timestamp"])
+            article.url = row["url"] or ""
+            if row["picture"]:
+                article.picture_filename = row["picture"]
+                logger.info(f"Picture found: {article.picture_filename}")
+            logger.info(f"Title: {article.title} -- Date: {article.date}")
+            list_articles.append(article)
+        return list_articles
+
+    @staticmethod
+    def __extract_articles_elements(driver: WebDriver) -> list[Article] | None:
+        """
+        Extracts the search results of the current page element by element.
+
+        Args:
+            driver (WebDriver): The WebDriver instance.
+
+        Returns:
+            list[Article] | None: The articles of the page or None if an error occurs.
+        """
+        list_articles = []
+        li_search_results = find_all_css(
+            driver.driver,
+            'ul[class*="search-results-module-results-menu"] li',
+        )
+        for cont, li in enumerate(li_search_results or [], start=1):
+            logger.info(f"Creating an article object: {cont}")
+            article = Article()
+            try:
+                title = li.find_element(
+                    By.CSS_SELECTOR, "h3[class='promo-title']"
+                )
+                time = li.find_element(
+                    By.CSS_SELECTOR, "p[class^='promo-timestamp']"
+                )
+                description = li.find_element(
+                    By.CSS_SELECTOR, "p[class='promo-description']"
+                )
+            except AttributeError as e:
+                logger.critical(f"AttributeError: {e}")
+                return None
+            except TypeError as e:
+                logger.critical(f"TypeError: {e}")
+                return None
+            except Exception as e:
+                logger.critical(f"Unexpected error: {e}")
+                return None
+
+            try:
+                center_element(driver.driver, li)
+                photo = find_elm_picture(
+                    li, Selector(css='img[src*=".jpg"]')
+                )
+                if not photo is None:
+                    article.picture_filename = photo
+                    logger.info(
+                        f"Picture found: {article.picture_filename}"
+                    )
+            except AttributeError as e:
+                logger.critical(f"AttributeError: {e}")
+            except TypeError as e:
+                logger.critical(f"TypeError: {e}")
+            except Exception as e:
+                logger.critical(f"Unexpected error: {e}")
+                logger.info("Picture information in article not found.")
+
+            logger.info("Article information found.")
+            article.title = title.text.strip()
+            article.description = description.text.strip()
+            article.date = parse_article_date(time.text.strip())
+            links = li.find_elements(By.CSS_SELECTOR, "h3[class='promo-title'] a")
+            if links:
+                article.url = links[0].get_attribute("href") or ""
+            logger.info(
+                f"Title: {article.title} -- Date: {article.date}"
+            )
+            list_articles.append(article)
+        return list_articles
+
+    @staticmethod
+    def extract_page_articles(driver: WebDriver) -> list[Article] | None:
+        """
+        Extracts the search results of the current page, in one script call
+        (extraction_mode=batch, default) or element by element (extraction_mode=elements).
+
+        Args:
+            driver (WebDriver): The WebDriver instance.
+
+        Returns:
+            list[Article] | None: The articles of the page or None if an error occurs.
+        """
+        if os.getenv("extraction_mode", "batch") == "batch":
+            return ScraperMethods.__extract_articles_batch(driver)
+        return ScraperMethods.__extract_articles_elements(driver)
+
+    @staticmethod
+    def collect_articles(
+        driver: WebDriver,
+        results: int = 0,
+        checkpoint: CollectionCheckpoint | None = None,
+        page: int = 0,
+        list_articles: list[Article] | None = None,
+        date_from: datetime | None = None,
+        newest_first: bool = False,
+        seen: SeenArticles | None = None,
+    ) -> list[Article] | None:
         """
         Collects articles from the search results.
 
         Args:
             driver (WebDriver): The WebDriver instance.
-            data_range (int): The data range option.
+            results (int): The number of articles to collect (0 collects every page).
+            checkpoint (CollectionCheckpoint | None): Checkpoint receiving every completed page.
+            page (int): The number of pages already collected (when resuming).
+            list_articles (list[Article] | None): The articles already collected (when resuming).
+            date_from (datetime | None): Articles older than this date are dropped.
+            newest_first (bool): True if the results are sorted by newest, so the first
+                older article ends the collection.
+            seen (SeenArticles | None): Articles exported by previous runs, to skip them
+                or to stop on a page where every article is known.
 
         Returns:
             list[Article] | None: List of collected articles or None if an error occurs.
         """
         try:
-            list_articles = []
-            more_results = True
-            cont = 1
+            list_articles = list_articles or []
+            more_results = results <= 0 or len(list_articles) < results
+            cont = len(list_articles) + 1
             while more_results:
-                logger.info("Search results found")
                 search_results_section = find_element(
                     driver.driver,
-                    Selector(css="div[class='search-results-module-results-header']"),
+                    RESULTS_HEADER_SELECTOR,
                 )
-                if search_results_section:
-                    logger.info("Search results found")
-                    wait_for_modal(driver.driver)
-                    li_search_results = find_all_css(
-                        driver.driver,
-                        'ul[class*="search-results-module-results-menu"] li',
-                    )
-                    if li_search_results:
-                        for li in li_search_results:
-                            logger.info(f"Creating an article object: {cont}")
-                            article = Article()
-                            try:
-                                title = li.find_element(
-                                    By.CSS_SELECTOR, "h3[class='promo-title']"
-                                )
-                                time = li.find_element(
-                                    By.CSS_SELECTOR, "p[class^='promo-timestamp']"
-                                )
-                                description = li.find_element(
-                                    By.CSS_SELECTOR, "p[class='promo-description']"
-                                )
-                            except AttributeError as e:
-                                logger.critical(f"AttributeError: {e}")
-                                return None
-                            except TypeError as e:
-                                logger.critical(f"TypeError: {e}")
-                                return None
-                            except Exception as e:
-                                logger.critical(f"Unexpected error: {e}")
-                                return None
-
-                            try:
-                                center_element(driver.driver, li)
-                                photo = find_elm_picture(
-                                    li, Selector(css='img[src*=".jpg"]')
-                                )
-                                if not photo is None:
-                                    article.picture_filename = photo
-                                    logger.info(
-                                        f"Picture found: {article.picture_filename}"
-                                    )
-                            except AttributeError as e:
-                                logger.critical(f"AttributeError: {e}")
-                            except TypeError as e:
-                                logger.critical(f"TypeError: {e}")
-                            except Exception as e:
-                                logger.critical(f"Unexpected error: {e}")
-                                logger.info("Picture information in article not found.")
-
-                            logger.info("Article information found.")
-                            article.title = title.text.strip()
-                            article.description = description.text.strip()
-                            time_str = time.text.strip()
-                            parse = parse_time_ago(time_str)
-                            if not parse == None:
-                                article.date = parse
-                            else:
-                                article.date = datetime.strptime(
-                                    time.text.strip(), "%B %d, %Y"
-                                )
-                            logger.info(
-                                f"Title: {article.title} -- Date: {article.date}"
-                            )
-                            list_articles.append(article)
-                            if results == cont:
-                                more_results = False
-                                break
-                            cont += 1
-                        button_next = find_element(
-                            driver.driver,
-                            Selector(
-                                css='div[class="search-results-module-next-page"]'
-                            ),
-                        )
-                        if button_next:
-                            center_element(driver.driver, button_next)
-                            click_elm(driver.driver, button_next)
-                            if results < cont:
-                                more_results = False
+                if not search_results_section:
+                    break
+
+                logger.info("Search results found")
+                wait_for_modal(driver.driver)
+                page_articles = ScraperMethods.extract_page_articles(driver)
+                if page_articles is None:
+                    return None
+                page += 1
+                kept_articles, out_of_window = apply_date_window(
+                    page_articles, date_from, newest_first
+                )
+                if out_of_window:
+                    more_results = False
+                if seen:
+                    kept_articles, all_known = seen.filter_page(kept_articles)
+                    if all_known:
+                        more_results = False
+                for index, article in enumerate(kept_articles, start=1):
+                    list_articles.append(article)
+                    if results == cont:
+                        more_results = False
+                        del kept_articles[index:]
+                        break
+                    cont += 1
+                if checkpoint:
+                    checkpoint.save_page(page, kept_articles)
+                if not more_results or not page_articles:
+                    break
+
+                button_next = find_element(
+                    driver.driver,
+                    Selector(
+                        css='div[class="search-results-module-next-page"]'
+                    ),
+                )
+                if not button_next:
+                    break
+                center_element(driver.driver, button_next)
+                click_elm(driver.driver, button_next)
             return list_articles
         except AttributeError as e:
             logger.critical(f"AttributeError: {e}")
@@ -321,6 +519,216 @@ class ScraperMethods:
             logger.critical(f"Unexpected error: {e}")
             return None
 
+    @staticmethod
+    def direct_search(driver: Selenium, pay: Payload, page: int = 1) -> bool | None:
+        """
+        Loads the search results in one navigation, with phrase, section
+        filter and sort order encoded in the URL instead of typed and clicked.
+        The section filter id comes from the topic catalog, or is read from
+        the page the first time a section is not found there.
+
+        Args:
+            driver (Selenium): The Selenium driver instance.
+            pay (Payload): The payload of the work item being processed.
+            page (int): The results page to load (greater than 1 when resuming).
+
+        Returns:
+            bool | None: True if the results page was loaded with results, False if
+            the search has no results, None if the URL navigation itself failed.
+        """
+        try:
+            site_url = os.getenv("site_url")
+            section_id = ""
+            if pay.section.strip():
+                catalog = TopicCatalog.default()
+                section_id = catalog.section_id(pay.section, pay.phrase_test)
+                if not section_id:
+                    navigate(driver, build_search_url(site_url, pay.phrase_test))
+                    filters = read_section_filters(driver.driver)
+                    section_id = catalog.learn(pay.section, filters)
+                    if not section_id:
+                        return None
+
+            url = build_search_url(site_url, pay.phrase_test, pay.sort_by, page, section_id)
+            logger.info(f"Loading search results: {url}")
+            navigate(driver, url)
+            outcome, _ = wait_for_first(driver.driver, SEARCH_OUTCOME_SPECS)
+            if outcome != 0:
+                logger.critical("No search match found.")
+                return False
+            return True
+        except WebDriverException as e:
+            logger.critical(f"WebDriverException: {e.msg}")
+            return None
+        except Exception as e:
+            logger.critical(f"Unexpected error: {e}")
+            return None
+
+    @staticmethod
+    def browser_search(
+        driver: Selenium, pay: Payload, seen: SeenArticles | None = None
+    ) -> list[Article] | None:
+        """
+        Runs the Selenium search for one payload: initial search, fine search
+        and article collection.
+
+        Args:
+            driver (Selenium): The Selenium driver instance.
+            pay (Payload): The payload of the work item being processed.
+            seen (SeenArticles | None): Articles exported by previous runs.
+
+        Returns:
+            list[Article] | None: The collected articles or None if the search failed.
+        """
+        checkpoint = CollectionCheckpoint(pay)
+        if os.getenv("search_navigation", "url") == "url":
+            page, list_articles = checkpoint.load()
+            if 0 < pay.results <= len(list_articles):
+                return list_articles
+            direct_search = ScraperMethods.direct_search(driver=driver, pay=pay, page=page + 1)
+            if direct_search:
+                if pay.results > 0:
+                    logger.info(f"{pay.results} results will be collected")
+                return ScraperMethods.collect_articles(
+                    driver=driver,
+                    results=pay.results,
+                    checkpoint=checkpoint,
+                    page=page,
+                    list_articles=list_articles,
+                    date_from=date_window_start(pay.data_range),
+                    newest_first=pay.sort_by == 1,
+                    seen=seen,
+                )
+            if direct_search is False:
+                # A resumed search whose next page is empty is complete
+                return list_articles or None
+            logger.warning("Direct URL navigation failed, searching through the page UI")
+            driver.go_to(url=os.getenv("site_url"))
+
+        # The UI path always starts from the first page
+        checkpoint.clear()
+
+        initial_search = ScraperMethods.inicial_search(
+            driver=driver, phrase=pay.phrase_test
+        )
+        if not initial_search:
+            logger.critical("There is a problem with a inicial search")
+            return None
+
+        logger.info("Initial search done")
+        logger.info("Starting fine searching")
+
+        # Perform fine search
+        fine_searching = ScraperMethods.fine_search(
+            driver=driver,
+            section=pay.section,
+            sort_by=pay.sort_by,
+            phrase=pay.phrase_test,
+        )
+        if not fine_searching:
+            logger.critical(
+                f"There are no search results with the phrase: {pay.phrase_test}"
+            )
+            return None
+
+        logger.info("Fine searching done")
+        logger.info("Starting to collect articles")
+
+        if pay.results > 0:
+            logger.info(f"{pay.results} results will be collected")
+
+        # Collect articles
+        return ScraperMethods.collect_articles(
+            driver=driver,
+            results=pay.results,
+            checkpoint=checkpoint,
+            date_from=date_window_start(pay.data_range),
+            newest_first=pay.sort_by == 1,
+            seen=seen,
+        )
+
+    @staticmethod
+    def process_payload(driver: Selenium | None, pay: Payload) -> bool:
+        """
+        Runs the whole pipeline for one payload: search, enrichment and export.
+
+        Work items with the "http" engine are searched over HTTP first and fall
+        back to Selenium if that fails. When driver is None and the browser is
+        needed, a browser is started for this payload and closed at the end.
+
+        Args:
+            driver (Selenium | None): The Selenium driver instance, if one is already open.
+            pay (Payload): The payload of the work item being processed.
+
+        Returns:
+            bool: True if the articles were collected and exported, otherwise False.
+        """
+        seen = SeenArticles(pay)
+        coll_articles = None
+        if pay.engine == "http":
+            coll_articles = HttpSearchEngine.default().collect_articles(pay, seen)
+            if coll_articles is None:
+                logger.warning("HTTP search failed, falling back to Selenium")
+
+        if coll_articles is None:
+            own_driver = driver is None
+            if own_driver:
+                driver = get_driver(
+                    site_url=os.getenv("site_url"),
+                    headless=os.getenv("headless", "").strip().lower() == "true",
+                )
+            try:
+                coll_articles = ScraperMethods.browser_search(driver=driver, pay=pay, seen=seen)
+            finally:
+                if own_driver and driver is not None:
+                    driver.close_browser()
+
+        if coll_articles == [] and seen.skip_known and seen.known:
+            logger.info("No new articles since the last run")
+            CollectionCheckpoint(pay).clear()
+            return True
+
+        if not coll_articles:
+            logger.critical("There are problems to generate articles collection")
+            return False
+
+        logger.info("Preparing articles to save")
+
+        # Prepare articles for saving; images are downloaded by the background stage
+        articles_to_save = ExcelOtherMethods.prepare_articles(
+            list_articles=coll_articles, phrase=pay.phrase_test, download_images=False
+        )
+        if not articles_to_save:
+            return False
+
+        logger.info("Saving articles")
+
+        partition = OutputPartitions.key(pay)
+        if seen.incremental:
+            # An incremental run may export fewer articles than the last one,
+            # so it must not replace the partition of the last run
+            partition = f"{partition}-{datetime.now():%Y%m%d-%H%M%S-%f}"
+
+        # Export articles to the partition of the work item without waiting for
+        # the images, then again with every picture_local_path once they are done.
+        # The export lock keeps an older batch of the partition from writing
+        # between this export and the start of the new batch.
+        pipeline = ImagePipeline.default()
+        with pipeline.export_lock(partition):
+            if not ExcelOtherMethods.export_outputs(articles_to_save, pay.outputs, pay, partition):
+                return False
+            seen.remember(articles_to_save)
+            pipeline.start(
+                articles_to_save,
+                ExcelOtherMethods.image_jobs(articles_to_save),
+                on_complete=lambda: ExcelOtherMethods.export_outputs(
+                    articles_to_save, pay.outputs, pay, partition
+                ),
+                key=partition,
+            )
+        CollectionCheckpoint(pay).clear()
+        return True
+
 
 class ExcelOtherMethods:
     @staticmethod
@@ -354,28 +762,9 @@ class ExcelOtherMethods:
             return None
 
     @staticmethod
-    def __contains_money(text):
+    def __image_path(url: str, article_title: str) -> str:
         """
-        Checks if the text contains monetary amounts.
-
-        Args:
-            text (str): The input text.
-
-        Returns:
-            bool: True if monetary amounts are found, otherwise False.
-        """
-        try:
-            pattern = r"\$[0-9,.]+|\b\d+\s*(?:dollars|USD)\b"
-            matches = re.findall(pattern, text)
-            return bool(matches)
-        except re.error as e:
-            logger.critical(f"Regex error: {e}")
-            return False
-
-    @staticmethod
-    def __download_image(url: str, article_title: str) -> str:
-        """
-        Downloads an image from a given URL with a filename based on the article title.
+        Builds the local path of an image, with a filename based on the article title.
 
         Args:
             url (str): The URL of the image.
@@ -384,79 +773,94 @@ class ExcelOtherMethods:
         Returns:
             str: The local path where the image is saved.
         """
-        try:
-            # Extract the file extension from the URL
-            file_extension = os.path.splitext(url)[-1]
+        # Extract the file extension from the URL
+        file_extension = os.path.splitext(url)[-1]
 
-            # Sanitize the article title and ensure it is no more than 20 characters
-            sanitized_title = re.sub(r'[<>:"/\\|?*]', "", article_title)
-            short_title = sanitized_title[:20]
+        # Sanitize the article title and ensure it is no more than 20 characters
+        sanitized_title = re.sub(r'[<>:"/\\|?*]', "", article_title)
+        short_title = sanitized_title[:20]
 
-            # Create the full filename
-            filename = f"{short_title}{file_extension}"
+        # Create the full filename; the URL hash keeps titles with the same prefix apart
+        url_hash = hashlib.sha1(url.encode("utf-8")).hexdigest()[:8]
+        filename = f"{short_title}-{url_hash}{file_extension}"
 
-            # Define the download path
-            project_dir = str(os.getcwd())
-            full_path = Path(project_dir, "output", "downloads")
+        # Define the download path
+        project_dir = str(os.getcwd())
+        return os.path.join(Path(project_dir, "output", "downloads"), filename)
 
-            if not os.path.isdir(full_path):
-                os.makedirs(full_path)
+    @staticmethod
+    def image_jobs(batch: ArticleBatch) -> list[tuple[int, str, str]]:
+        """
+        Lists the images to download for the articles that have one.
 
-            if os.path.isdir(full_path):
-                full_path = os.path.join(full_path, filename)
-                logger.info(f"Downloading image: {url}")
-                urllib.request.urlretrieve(url, full_path)
-                return full_path
-        except URLError as e:
-            logger.critical(f"URLError: {e}")
-            return None
-        except Exception as e:
-            logger.critical(f"Unexpected error: {e}")
-            return None
+        Args:
+            batch (ArticleBatch): The prepared articles.
+
+        Returns:
+            list[tuple[int, str, str]]: The (row, image url, local path) of each image.
+        """
+        return [
+            (
+                index,
+                url,
+                ExcelOtherMethods.__image_path(url, title.strip()),
+            )
+            for index, (url, title) in enumerate(zip(batch.picture_filename, batch.title))
+            if url
+        ]
 
     @staticmethod
-    def prepare_articles(list_articles: list[Article], phrase: str) -> list[Article]:
+    def prepare_articles(
+        list_articles: list[Article] | ArticleBatch, phrase: str, download_images: bool = True
+    ) -> ArticleBatch:
         """
-        Prepares articles by adding additional metadata.
+        Prepares articles by adding additional metadata. The articles are
+        moved into an ArticleBatch once and enriched column by column, in place.
 
         Args:
-            list_articles (list[Article]): List of articles to be prepared.
+            list_articles (list[Article] | ArticleBatch): List of articles to be prepared.
             phrase (str): The phrase to count in titles and descriptions.
+            download_images (bool): Download the images before returning. When False,
+                picture_local_path is left for the ImagePipeline to fill (see image_jobs).
 
         Returns:
-            list[Article]: List of prepared articles.
+            ArticleBatch: The prepared articles, without duplicates.
         """
         try:
-            new_list_articles = []
             if list_articles:
-                for article in list_articles:
-                    art = Article()
-                    art.title = article.title
-                    art.date = article.date
-                    art.title_count_phrase = len(
-                        re.findall(
-                            re.escape(phrase), article.title.strip(), re.IGNORECASE
-                        )
-                    )
-                    art.description = article.description
-                    art.description_count_phrase = len(
-                        re.findall(
-                            re.escape(phrase),
-                            article.description.strip(),
-                            re.IGNORECASE,
-                        )
-                    )
-                    art.find_money_title_description = (
-                        ExcelOtherMethods.__contains_money(article.title)
+                batch = (
+                    list_articles
+                    if isinstance(list_articles, ArticleBatch)
+                    else ArticleBatch.from_articles(list_articles)
+                )
+                removed = batch.dedup()
+                if removed:
+                    logger.info(f"{removed} duplicated articles removed")
+
+                # One scan per text counts the phrase and looks for money
+                scanner = TextScanner.for_phrases(phrase)
+                title_counts, title_money = scanner.scan_column(batch.title)
+                description_counts, description_money = scanner.scan_column(batch.description)
+                batch.title_count_phrase = title_counts[0]
+                batch.description_count_phrase = description_counts[0]
+                batch.find_money_title_description = [
+                    in_title or in_description
+                    for in_title, in_description in zip(title_money, description_money)
+                ]
+                batch.picture_local_path = [""] * len(batch)
+
+                if download_images:
+                    # Images are downloaded concurrently once every article is prepared
+                    jobs = ExcelOtherMethods.image_jobs(batch)
+                    local_paths = ImageDownloader.default().download_all(
+                        [(url, path) for _, url, path in jobs]
                     )
-                    if len(article.picture_filename) > 0:
-                        art.picture_filename = article.picture_filename
-                        art.picture_local_path = ExcelOtherMethods.__download_image(
-                            art.picture_filename, article.title.strip()
-                        )
-                    new_list_articles.append(art)
-                    logger.info(f"Article created: {art.to_dict()}")
-                return new_list_articles
+                    for (index, _, _), local_path in zip(jobs, local_paths):
+                        batch.picture_local_path[index] = local_path
+                for row in batch.iter_dicts():
+                    logger.debug(f"Article created: {row}")
+                logger.info(f"{len(batch)} articles prepared")
+                return batch
 
         except AttributeError as e:
             logger.critical(f"AttributeError: {e}")
@@ -472,37 +876,47 @@ class ExcelOtherMethods:
             return None
 
     @staticmethod
-    def export_excel(list_articles: list[Article]):
+    def export_excel(list_articles: list[Article] | ArticleBatch):
         """
-        Exports the list of articles to an Excel file.
+        Exports the list of articles to an Excel file, streamed row by row.
 
         Args:
-            list_articles (list[Article]): List of articles to be exported.
+            list_articles (list[Article] | ArticleBatch): List of articles to be exported.
+        """
+        ExcelOtherMethods.export_outputs(list_articles, ["xlsx"])
+
+    @staticmethod
+    def export_outputs(
+        list_articles: list[Article] | ArticleBatch,
+        formats: str | list[str] | None = None,
+        pay: Payload | None = None,
+        partition: str | None = None,
+    ) -> dict[str, str] | None:
+        """
+        Exports the articles for every format in a single pass, to the partition
+        of the work item (see OutputPartitions) or, without a payload, to output/Articles.<format>.
+
+        Args:
+            list_articles (list[Article] | ArticleBatch): List of articles to be exported.
+            formats (str | list[str] | None): The output formats, such as "xlsx,parquet";
+                None uses the output_formats setting.
+            pay (Payload | None): The payload of the work item the articles belong to.
+            partition (str | None): The partition to write, the one of the payload if None.
+
+        Returns:
+            dict[str, str] | None: The file written for each format, or None on error.
         """
         try:
-            project_dir = str(os.getcwd())
-            full_path = Path(project_dir, "output")
-            excel_file_path = os.path.join(full_path, "Articles.xlsx")
-            wb = Workbook()
-            ws = wb.active
-            str_data = Article.articles_to_json(list_articles)
-            data = json.loads(str_data)
-            headers = list(data[0].keys()) if data else []
-            for col_num, header in enumerate(headers, start=1):
-                ws.cell(row=1, column=col_num, value=header)
-            for row_index, row_data in enumerate(data, start=2):
-                for col_index, header in enumerate(headers, start=1):
-                    ws.cell(
-                        row=row_index, column=col_index, value=row_data.get(header, "")
-                    )
-            logger.info("Excel file created.")
             logger.info("Creating Output...")
-            wb.save(excel_file_path)
-        except json.JSONDecodeError as e:
-            logger.critical(f"JSONDecodeError: {e}")
-            return None
-        except FileNotFoundError as e:
-            logger.critical(f"FileNotFoundError: {e}")
+            if pay is None:
+                full_path = Path(str(os.getcwd()), "output")
+                paths = export_articles(list_articles, formats, str(full_path))
+            else:
+                paths = OutputPartitions.default().write(list_articles, pay, formats, partition)
+            logger.info(f"Output files created: {', '.join(paths.values())}")
+            return paths
+        except ValueError as e:
+            logger.critical(f"ValueError: {e}")
             return None
         except PermissionError as e:
             logger.critical(f"PermissionError: {e}")
@@ -510,3 +924,36 @@ class ExcelOtherMethods:
         except Exception as e:
             logger.critical(f"Unexpected error: {e}")
             return None
+
+    @staticmethod
+    def merge_outputs(
+        formats: str | list[str] | None = None, keys: list[str] | None = None
+    ) -> dict[str, str] | None:
+        """
+        Merges the partitions of the work items into output/Articles.<format>,
+        streaming the rows and dropping the articles found by several work items.
+
+        Args:
+            formats (str | list[str] | None): The output formats; None uses the output_formats setting.
+            keys (list[str] | None): The partitions to merge, such as the ones written by
+                the current run; None merges every partition ever written.
+
+        Returns:
+            dict[str, str] | None: The file written for each format, or None on error.
+        """
+        try:
+            partitions = OutputPartitions.default()
+            count = len(keys) if keys is not None else len(partitions.entries())
+            logger.info(f"Merging {count} output partitions")
+            paths = partitions.merge(formats, keys=keys)
+            logger.info(f"Merged output files created: {', '.join(paths.values())}")
+            return paths
+        except ValueError as e:
+            logger.critical(f"ValueError: {e}")
+            return None
+        except OSError as e:
+            logger.critical(f"OSError: {e}")
+            return None
+        except Exception as e:
+            logger.critical(f"Unexpected error: {e}")
+            return None
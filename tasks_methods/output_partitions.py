@@ -0,0 +1,231 @@
+import hashlib
+import json
+import os
+import re
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from time import time
+from dotenv import load_dotenv
+from helpers.article import Article
+from helpers.article_batch import COLUMNS, ArticleBatch, fingerprint
+from helpers.payload import Payload
+from Log.logs import Logs
+from tasks_methods.export_sinks import export_articles, export_rows, parse_formats, read_rows
+
+load_dotenv("config/.env")
+logger = Logs.Returnlog(os.getenv("name_app"), "Output Partitions")
+
+# Source format of a partition for the merge, cheapest to read first
+READ_PREFERENCE = ("parquet", "jsonl", "csv", "xlsx")
+TITLE_COLUMN = COLUMNS.index("title")
+DATE_COLUMN = COLUMNS.index("date")
+URL_COLUMN = COLUMNS.index("url")
+
+
+class OutputPartitions:
+    """
+    Per work item outputs, so consumers never overwrite each other's files.
+
+    Every work item writes its articles to <directory>/<key>/Articles.<ext>,
+    where the key is derived from the phrase and the search parameters;
+    each file is written to a temporary name and renamed when complete.
+    After each write, one JSON line describing the partition is appended
+    to manifest.jsonl, so listing the partitions never scans the
+    directories and concurrent workers never rewrite a shared file. The
+    last line of a key wins; a partially written line is ignored.
+
+    merge() streams the partitions into a single set of outputs, row by
+    row, without loading any partition in memory. The keys written by the
+    current process are kept in written, to merge only the partitions of a run.
+    """
+
+    _default = None
+
+    def __init__(self, directory: str) -> None:
+        self.directory = Path(directory)
+        self.manifest_path = self.directory / "manifest.jsonl"
+        self.written = []
+
+    @classmethod
+    def default(cls) -> "OutputPartitions":
+        """
+        Returns the partitions of the configured directory, shared by the current process.
+
+        Returns:
+            OutputPartitions: The shared partitions.
+        """
+        if cls._default is None:
+            cls._default = cls(os.getenv("output_partitions_dir") or os.path.join("output", "partitions"))
+        return cls._default
+
+    @staticmethod
+    def key(pay: Payload) -> str:
+        """
+        Returns the partition of a payload: a readable slug of the phrase
+        and a digest of the search parameters.
+
+        Args:
+            pay (Payload): The payload of the work item.
+
+        Returns:
+            str: The partition key, safe as a directory name.
+        """
+        identity = json.dumps(
+            [pay.phrase_test, pay.section, pay.data_range, pay.sort_by, pay.results], ensure_ascii=False
+        )
+        digest = hashlib.sha1(identity.encode("utf-8")).hexdigest()[:10]
+        slug = re.sub(r"[^a-z0-9]+", "-", pay.phrase_test.lower()).strip("-")[:40]
+        return f"{slug or 'phrase'}-{digest}"
+
+    def write(
+        self,
+        articles: ArticleBatch | Iterable[Article],
+        pay: Payload,
+        formats: str | Iterable[str] | None = None,
+        key: str | None = None,
+    ) -> dict[str, str]:
+        """
+        Writes the articles of a work item to its partition, atomically per
+        file, and indexes the partition in the manifest.
+
+        Args:
+            articles (ArticleBatch | Iterable[Article]): The articles of the work item.
+            pay (Payload): The payload of the work item.
+            formats (str | Iterable[str] | None): The output formats (see parse_formats).
+            key (str | None): The partition, the key of the payload if None.
+
+        Returns:
+            dict[str, str]: The path written for each format that succeeded.
+        """
+        key = key or self.key(pay)
+        paths = export_articles(articles, formats, str(self.directory / key))
+        if paths:
+            self.__append(
+                {
+                    "key": key,
+                    "phrase": pay.phrase_test,
+                    "section": pay.section,
+                    "rows": len(articles) if hasattr(articles, "__len__") else None,
+                    "files": {
+                        extension: os.path.relpath(path, self.directory)
+                        for extension, path in paths.items()
+                    },
+                    "written_at": time(),
+                    "pid": os.getpid(),
+                }
+            )
+            if key not in self.written:
+                self.written.append(key)
+        return paths
+
+    def entries(self) -> dict[str, dict]:
+        """
+        Reads the manifest, keeping the last entry of each partition whose files still exist.
+
+        Returns:
+            dict[str, dict]: The entries by partition key, in the order the partitions were first written.
+        """
+        entries = {}
+        try:
+            with open(self.manifest_path, mode="r", encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                        entries[entry["key"]] = entry
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        logger.warning(f"Ignoring incomplete manifest line in {self.manifest_path}")
+        except FileNotFoundError:
+            return {}
+        for key, entry in list(entries.items()):
+            entry["files"] = {
+                extension: path
+                for extension, path in entry.get("files", {}).items()
+                if (self.directory / path).is_file()
+            }
+            if not entry["files"]:
+                del entries[key]
+        return entries
+
+    def compact(self) -> int:
+        """
+        Rewrites the manifest with one line per existing partition. Run it
+        when no worker is writing, as lines appended meanwhile would be lost.
+
+        Returns:
+            int: The number of partitions kept.
+        """
+        entries = self.entries()
+        tmp_path = self.manifest_path.with_name(f"{self.manifest_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, mode="w", encoding="utf-8") as file:
+            for entry in entries.values():
+                file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.manifest_path)
+        return len(entries)
+
+    def iter_rows(self, keys: Iterable[str] | None = None, dedup: bool = True) -> Iterator[tuple]:
+        """
+        Streams the rows of the partitions, each read from its cheapest
+        format, skipping the articles already yielded by a previous partition.
+
+        Args:
+            keys (Iterable[str] | None): The partitions to read, all of them if None.
+            dedup (bool): Skip rows whose fingerprint (URL, or title and date) was already yielded.
+
+        Yields:
+            tuple: The values of one article in COLUMNS order.
+        """
+        entries = self.entries()
+        seen = set()
+        for key in entries if keys is None else keys:
+            entry = entries.get(key)
+            if entry is None:
+                logger.warning(f"Partition not found in the manifest: {key}")
+                continue
+            extension = next(name for name in READ_PREFERENCE + tuple(entry["files"]) if name in entry["files"])
+            for values in read_rows(str(self.directory / entry["files"][extension])):
+                if dedup:
+                    identity = fingerprint(values[TITLE_COLUMN], values[DATE_COLUMN], values[URL_COLUMN])
+                    if identity in seen:
+                        continue
+                    seen.add(identity)
+                yield values
+
+    def merge(
+        self,
+        formats: str | Iterable[str] | None = None,
+        directory: str | None = None,
+        name: str = "Articles",
+        keys: Iterable[str] | None = None,
+        dedup: bool = True,
+    ) -> dict[str, str]:
+        """
+        Combines the partitions into one output per format, streaming the
+        rows so memory does not grow with the number of articles (only the
+        fingerprints are kept, for dedup).
+
+        Args:
+            formats (str | Iterable[str] | None): The output formats (see parse_formats).
+            directory (str | None): The output directory, the parent of the partitions if None.
+            name (str): The file name of the outputs, without extension.
+            keys (Iterable[str] | None): The partitions to merge, all of them if None.
+            dedup (bool): Drop the articles found by more than one work item.
+
+        Returns:
+            dict[str, str]: The path written for each format that succeeded.
+        """
+        formats = parse_formats(formats)
+        directory = directory or str(self.directory.parent)
+        return export_rows(self.iter_rows(keys, dedup), formats, directory, name)
+
+    def __append(self, entry: dict) -> None:
+        """
+        Appends one line to the manifest with a single write in append mode,
+        so lines of concurrent workers never interleave.
+        """
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.manifest_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
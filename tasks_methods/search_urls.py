@@ -0,0 +1,28 @@
+from urllib.parse import urlencode, urljoin
+
+
+def build_search_url(
+    site_url: str, phrase: str, sort_by: int = 0, page: int = 1, section_id: str = ""
+) -> str:
+    """
+    Builds the URL of a search results page, so phrase, section filter,
+    sort order and page are applied in a single navigation.
+
+    Args:
+        site_url (str): The site root URL.
+        phrase (str): The search phrase.
+        sort_by (int): The sort option: 0 relevance, 1 newest, 2 oldest.
+        page (int): The results page, starting at 1.
+        section_id (str): The id of the section filter, if any.
+
+    Returns:
+        str: The search URL.
+    """
+    params = {"q": phrase}
+    if section_id:
+        params["f0"] = section_id
+    params["s"] = sort_by if sort_by in (0, 1, 2) else 0
+    if page > 1:
+        params["p"] = page
+    return urljoin(site_url, "search") + "?" + urlencode(params)
+
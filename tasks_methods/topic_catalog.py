@@ -0,0 +1,214 @@
+import json
+import os
+import threading
+from pathlib import Path
+from time import time
+from urllib.parse import urlparse
+from dotenv import load_dotenv
+from Log.logs import Logs
+from tasks_methods.search_urls import build_search_url
+from webdriver_util.webdrv_util import FUZZY_MIN_SCORE, find_fuzzy, normalize
+
+load_dotenv("config/.env")
+logger = Logs.Returnlog(os.getenv("name_app"), "Topic Catalog")
+
+TTL = 24 * 60 * 60
+
+
+class TopicCatalog:
+    """
+    The section filter topics of a site ({name: filter id}), persisted
+    between runs so a work item with a section does not have to open the
+    filter modal and read the topic list again.
+
+    The catalog is the union of the topics seen on the search pages of the
+    site. Past its TTL it is still served, while a background thread reads
+    a fresh topic list over HTTP and merges it in.
+
+    It also remembers which topic each work item section name matched, by
+    topic name: the filter id is always read from the current topics, so a
+    refresh that changes an id reaches the sections already learned.
+    """
+
+    _default = None
+
+    def __init__(self, path: str, site_url: str, ttl: float | None = None) -> None:
+        self.path = Path(path)
+        self.site_url = site_url
+        self.site = urlparse(site_url).netloc or site_url
+        self.ttl = ttl if ttl is not None else float(os.getenv("topic_catalog_ttl") or TTL)
+        self._lock = threading.Lock()
+        self._refreshing = None
+        self._entry = self.__load().get(self.site, {})
+
+    @classmethod
+    def default(cls) -> "TopicCatalog":
+        """
+        Returns the catalog of the configured site, shared by the current process.
+
+        Returns:
+            TopicCatalog: The shared catalog.
+        """
+        if cls._default is None:
+            cls._default = cls(
+                os.getenv("topic_catalog_file") or os.path.join("output", "topic_catalog.json"),
+                os.getenv("site_url"),
+            )
+        return cls._default
+
+    def is_fresh(self) -> bool:
+        """
+        Returns:
+            bool: True if the catalog was read within its TTL.
+        """
+        return time() - self._entry.get("fetched_at", 0) < self.ttl
+
+    def topics(self, phrase: str = "") -> dict[str, str]:
+        """
+        Returns the cached topics, starting a background refresh when they are stale.
+
+        Args:
+            phrase (str): A search phrase whose results page lists the topics, for the refresh.
+
+        Returns:
+            dict[str, str]: The filter ids by topic name, empty on a cache miss.
+        """
+        topics = dict(self._entry.get("topics", {}))
+        if topics and not self.is_fresh():
+            self.refresh_async(phrase)
+        return topics
+
+    def section_id(self, section: str, phrase: str = "") -> str | None:
+        """
+        Resolves a section name to a filter id from the cached topics, without touching the page.
+
+        Args:
+            section (str): The section name of the work item.
+            phrase (str): The search phrase, for a background refresh.
+
+        Returns:
+            str | None: The filter id or None if the catalog cannot resolve the section.
+        """
+        topics = self.topics(phrase)
+        name = self._entry.get("sections", {}).get(normalize(section))
+        if name in topics:
+            return topics[name]
+        if not topics or find_fuzzy(list(topics), lambda x: x, section, FUZZY_MIN_SCORE) is None:
+            return None
+        return self.learn(section, topics)
+
+    def learn(self, section: str, topics: dict[str, str]) -> str | None:
+        """
+        Merges a topic list read from the page, picks the topic that best
+        matches a section name and remembers it.
+
+        Args:
+            section (str): The section name of the work item.
+            topics (dict[str, str]): The filter ids by topic name, as read from the search page.
+
+        Returns:
+            str | None: The filter id or None if the page had no matching topic.
+        """
+        if not topics:
+            logger.error("Section filter not found in the search page")
+            return None
+        self.update(topics)
+        best_match_name = find_fuzzy(list(topics), lambda x: x, section, FUZZY_MIN_SCORE)
+        if best_match_name is None:
+            logger.error(f"Section '{section}' not found in the search page")
+            return None
+        logger.info(f"Section '{section}' resolved to '{best_match_name}'")
+        with self._lock:
+            sections = self._entry.setdefault("sections", {})
+            if sections.get(normalize(section)) != best_match_name:
+                sections[normalize(section)] = best_match_name
+                self.__save()
+        return topics[best_match_name]
+
+    def update(self, topics: dict[str, str]) -> bool:
+        """
+        Merges a topic list read from the site into the catalog and persists it.
+
+        Args:
+            topics (dict[str, str]): The filter ids by topic name.
+
+        Returns:
+            bool: True if the list added or changed topics.
+        """
+        if not topics:
+            return False
+        with self._lock:
+            known = self._entry.get("topics", {})
+            changed = any(known.get(name) != value for name, value in topics.items())
+            self._entry = {**self._entry, "fetched_at": time(), "topics": {**known, **topics}}
+            if changed:
+                logger.info(f"Topic catalog of {self.site} updated: {len(self._entry['topics'])} topics")
+            self.__save()
+        return changed
+
+    def refresh_async(self, phrase: str = "") -> None:
+        """
+        Reads the topic list over HTTP in a daemon thread, unless a refresh is already running.
+
+        Args:
+            phrase (str): A search phrase whose results page lists the topics.
+        """
+        with self._lock:
+            if self._refreshing is not None and self._refreshing.is_alive():
+                return
+            self._refreshing = threading.Thread(
+                target=self.refresh, args=(phrase,), name="topic-catalog-refresh", daemon=True
+            )
+            self._refreshing.start()
+
+    def refresh(self, phrase: str = "") -> bool:
+        """
+        Reads the topic list of a search results page over HTTP and merges it in.
+
+        Args:
+            phrase (str): A search phrase whose results page lists the topics.
+
+        Returns:
+            bool: True if the catalog was refreshed.
+        """
+        # Imported here: the HTTP engine itself resolves sections through the catalog
+        from tasks_methods.http_engine import HttpSearchEngine
+
+        try:
+            page_html = HttpSearchEngine.default().fetch_page(build_search_url(self.site_url, phrase))
+            if page_html is None:
+                return False
+            topics = HttpSearchEngine.parse_sections(page_html)
+            if not topics:
+                logger.warning("Topic catalog refresh found no topics")
+                return False
+            self.update(topics)
+            return True
+        except Exception as e:
+            logger.warning(f"Topic catalog refresh failed: {e}")
+            return False
+
+    def __load(self) -> dict:
+        try:
+            with open(self.path, mode="r", encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError as e:
+            logger.warning(f"Ignoring corrupted topic catalog {self.path}: {e}")
+            return {}
+
+    def __save(self) -> None:
+        """
+        Writes the catalog atomically, keeping the entries of the other sites.
+        """
+        try:
+            catalogs = self.__load()
+            catalogs[self.site] = self._entry
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, mode="w", encoding="utf-8") as file:
+                json.dump(catalogs, file, indent=4)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Topic catalog not saved: {e}")
@@ -0,0 +1,219 @@
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from time import perf_counter
+from dotenv import load_dotenv
+from robocorp import workitems
+from robocorp.workitems import ExceptionType
+from helpers.payload import Payload
+from Log.logs import Logs
+
+load_dotenv("config/.env")
+logger = Logs.Returnlog(os.getenv("name_app"), "Consumer Pool")
+
+
+def _run_worker(worker_id: int, env: dict) -> dict:
+    """
+    Entry point of a pool process. Applies the worker environment before the
+    work item context is created, so the process only sees its own shard.
+
+    Args:
+        worker_id (int): Index of the worker in the pool.
+        env (dict): Environment variables overriding the parent ones.
+
+    Returns:
+        dict: The statistics returned by ConsumerPoolMethods.consume_work_items.
+    """
+    os.environ.update(env)
+    return ConsumerPoolMethods.consume_work_items(worker_id)
+
+
+class ConsumerPoolMethods:
+    @staticmethod
+    def consume_work_items(worker_id: int = 0) -> dict:
+        """
+        Walks every input work item available to this process with one warm
+        browser session from a DriverPool, marking each item as done or failed.
+
+        Args:
+            worker_id (int): Index of the worker, used in the logs.
+
+        Returns:
+            dict: Counters (worker, done, failed, seconds) and the partitions written by this worker.
+        """
+        # Imported here so the pool parent does not pay the Selenium import cost
+        from tasks_methods.image_pipeline import ImagePipeline
+        from tasks_methods.methods import ScraperMethods
+        from tasks_methods.output_partitions import OutputPartitions
+        from webdriver_util.driver_pool import DriverPool
+        from webdriver_util.selector_stats import SelectorStats
+
+        stats = {"worker": worker_id, "done": 0, "failed": 0}
+        start = perf_counter()
+        driver_pool = DriverPool(
+            site_url=os.getenv("site_url"),
+            headless=os.getenv("headless", "").strip().lower() == "true",
+        )
+        try:
+            for item in workitems.inputs:
+                try:
+                    pay = Payload.from_dict(item.payload)
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.critical(f"Worker {worker_id}: invalid payload {item.payload}: {e}")
+                    item.fail(ExceptionType.BUSINESS, code="INVALID_PAYLOAD", message=str(e))
+                    stats["failed"] += 1
+                    continue
+
+                logger.info(f"Worker {worker_id}: processing {pay}")
+                processed = False
+                try:
+                    if pay.engine == "http":
+                        processed = ScraperMethods.process_payload(driver=None, pay=pay)
+                    else:
+                        with driver_pool.session() as driver:
+                            if driver is None:
+                                item.fail(
+                                    ExceptionType.APPLICATION,
+                                    code="NO_BROWSER",
+                                    message="The browser could not be started",
+                                )
+                                stats["failed"] += 1
+                                continue
+                            processed = ScraperMethods.process_payload(driver=driver, pay=pay)
+                except Exception as e:
+                    logger.critical(f"Worker {worker_id}: unexpected error: {e}")
+
+                if processed:
+                    item.done()
+                    stats["done"] += 1
+                else:
+                    item.fail(
+                        ExceptionType.APPLICATION,
+                        code="SEARCH_FAILED",
+                        message=f"No articles exported for: {pay.phrase_test}",
+                    )
+                    stats["failed"] += 1
+        finally:
+            driver_pool.close()
+            ImagePipeline.default().wait()
+            # Pool processes exit without running atexit handlers
+            SelectorStats.default().flush()
+
+        stats["seconds"] = perf_counter() - start
+        logger.info(f"Worker {worker_id} finished: {stats}")
+        stats["partitions"] = OutputPartitions.default().written
+        return stats
+
+    @staticmethod
+    def split_input_work_items(workers: int) -> list[dict]:
+        """
+        Splits the local input work items file (FileAdapter) into one shard
+        per worker, round-robin, so every process owns its own items.
+
+        Args:
+            workers (int): The number of workers in the pool.
+
+        Returns:
+            list[dict]: The environment overrides of each worker (one per non-empty shard).
+        """
+        input_path = Path(os.getenv("RC_WORKITEM_INPUT_PATH", "")).resolve()
+        output_path = Path(
+            os.getenv("RC_WORKITEM_OUTPUT_PATH")
+            or os.path.join("output", "work-items-out", "work-items.json")
+        ).resolve()
+        with open(input_path, mode="r", encoding="utf-8") as file:
+            items = json.load(file)
+
+        # Files attached to the items are relative to the original input file
+        for item in items:
+            item["files"] = {
+                name: str(input_path.parent / path)
+                for name, path in (item.get("files") or {}).items()
+            }
+
+        shard_dir = Path(os.getcwd(), "output", "work-items-pool")
+        envs = []
+        for worker_id in range(min(workers, len(items))):
+            worker_dir = shard_dir / f"worker-{worker_id}"
+            worker_dir.mkdir(parents=True, exist_ok=True)
+            shard_path = worker_dir / "work-items.json"
+            with open(shard_path, mode="w", encoding="utf-8") as file:
+                json.dump(items[worker_id::workers], file, indent=4)
+            envs.append(
+                {
+                    "RC_WORKITEM_ADAPTER": "FileAdapter",
+                    "RC_WORKITEM_INPUT_PATH": str(shard_path),
+                    "RC_WORKITEM_OUTPUT_PATH": str(
+                        output_path.parent / f"worker-{worker_id}" / output_path.name
+                    ),
+                }
+            )
+        logger.info(f"{len(items)} input work items split into {len(envs)} shards")
+        return envs
+
+    @staticmethod
+    def run_pool(workers: int | None = None) -> dict | None:
+        """
+        Spreads all the input work items over a pool of browser worker
+        processes, one driver per process.
+
+        Locally (FileAdapter) the input file is sharded between the workers.
+        With any other adapter the reservation is owned by Control Room, so
+        the items are consumed in this process and Control Room is expected
+        to scale the step itself.
+
+        Args:
+            workers (int | None): Number of worker processes (default from .env or the CPU count).
+
+        Returns:
+            dict | None: Aggregated counters (workers, done, failed, seconds, searches_per_hour)
+            and the partitions written by the run, or None on error.
+        """
+        workers = workers or int(os.getenv("consumer_workers") or os.cpu_count() or 1)
+        start = perf_counter()
+        try:
+            if os.getenv("RC_WORKITEM_ADAPTER") == "FileAdapter":
+                envs = ConsumerPoolMethods.split_input_work_items(workers)
+            else:
+                logger.warning("Work items are not local, consuming them with a single worker")
+                envs = []
+
+            if envs:
+                results = []
+                context = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(max_workers=len(envs), mp_context=context) as pool:
+                    futures = [
+                        pool.submit(_run_worker, worker_id, env)
+                        for worker_id, env in enumerate(envs)
+                    ]
+                    for future in as_completed(futures):
+                        results.append(future.result())
+            else:
+                results = [ConsumerPoolMethods.consume_work_items()]
+        except FileNotFoundError as e:
+            logger.critical(f"FileNotFoundError: {e}")
+            return None
+        except json.JSONDecodeError as e:
+            logger.critical(f"JSONDecodeError: {e}")
+            return None
+        except Exception as e:
+            logger.critical(f"Unexpected error: {e}")
+            return None
+
+        seconds = perf_counter() - start
+        done = sum(result["done"] for result in results)
+        stats = {
+            "workers": len(results),
+            "done": done,
+            "failed": sum(result["failed"] for result in results),
+            "seconds": seconds,
+            "searches_per_hour": done * 3600 / seconds if seconds else 0.0,
+            "partitions": list(dict.fromkeys(key for result in results for key in result["partitions"])),
+        }
+        logger.info(
+            f"{stats['done']} done, {stats['failed']} failed with {stats['workers']} workers "
+            f"({stats['searches_per_hour']:.0f} searches/hour)"
+        )
+        return stats
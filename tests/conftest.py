@@ -0,0 +1,34 @@
+import os
+import sys
+import threading
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+# The modules read config/.env and write their log relative to the repository root
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+
+@pytest.fixture
+def http_server():
+    """
+    Starts local HTTP servers for a test: call it with a request handler
+    class, get back the base URL ("http://127.0.0.1:<port>/").
+    """
+    servers = []
+
+    def start(handler) -> str:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}/"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,13 @@
+from helpers.article import Article
+from helpers.payload import Payload
+from tasks_methods.checkpoints import CollectionCheckpoint
+
+
+def test_payloads_with_another_date_window_do_not_share_a_checkpoint(tmp_path):
+    last_month = CollectionCheckpoint(Payload(phrase_test="wildfire", data_range=1), str(tmp_path))
+    last_year = CollectionCheckpoint(Payload(phrase_test="wildfire", data_range=12), str(tmp_path))
+
+    last_month.save_page(1, [Article(title="Wildfire forces evacuations", url="https://example.com/1")])
+
+    assert last_month.load()[0] == 1
+    assert last_year.load() == (0, [])
@@ -0,0 +1,146 @@
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlparse
+import pytest
+from conftest import FIXTURES
+from helpers.payload import Payload
+from tasks_methods.http_engine import HttpSearchEngine
+from tasks_methods.topic_catalog import TopicCatalog
+
+SECTIONS = {
+    "California": "00000168-8694-d3b6-a96a-c6ff9d090000",
+    "Politics": "00000163-01e2-d9e7-a1f7-93ebde580000",
+    "World & Nation": "00000168-865c-d5d8-a76d-efddaf000000",
+}
+
+
+def fixture_html(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+class SearchSite(BaseHTTPRequestHandler):
+    """
+    Serves the saved search result pages: /search?...&p=N returns page N,
+    pages past the last one return an empty results page.
+    """
+
+    requests = []
+    lock = threading.Lock()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != "/search":
+            self.send_error(404)
+            return
+        query = parse_qs(url.query)
+        page = int(query.get("p", ["1"])[0])
+        with self.lock:
+            self.requests.append(query)
+        name = f"search_page{page}.html"
+        body = fixture_html(name if (FIXTURES / name).is_file() else "search_empty.html").encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def site(http_server, tmp_path, monkeypatch):
+    SearchSite.requests = []
+    base_url = http_server(SearchSite)
+    monkeypatch.setenv("checkpoint_dir", str(tmp_path / "checkpoints"))
+    monkeypatch.setattr(
+        TopicCatalog, "_default", TopicCatalog(str(tmp_path / "topic_catalog.json"), base_url)
+    )
+    return base_url
+
+
+def pages_requested() -> list[int]:
+    return sorted(int(query.get("p", ["1"])[0]) for query in SearchSite.requests)
+
+
+def test_parse_articles_reads_every_result_in_page_order():
+    articles = HttpSearchEngine.parse_articles(
+        fixture_html("search_page1.html"), "https://www.latimes.com/search?q=wildfire"
+    )
+
+    assert [article.title for article in articles] == [
+        "Wildfire forces evacuations in the Angeles National Forest",
+        "Lawmakers take up wildfire insurance bill",
+        "Canada wildfire smoke drifts south",
+    ]
+    assert [article.date for article in articles] == [
+        datetime(2024, 6, 5),
+        datetime(2024, 6, 4),
+        datetime(2024, 6, 3),
+    ]
+    assert articles[0].description.startswith("Thousands were told to leave")
+    # Relative links are resolved against the page URL
+    assert articles[1].url == "https://www.latimes.com/politics/story/2024-06-04/wildfire-insurance-bill"
+    assert articles[0].picture_filename.endswith("/wildfire-evacuations.jpg")
+    # Only .jpg pictures are kept
+    assert articles[2].picture_filename == ""
+
+
+def test_parse_articles_of_an_empty_page():
+    assert HttpSearchEngine.parse_articles(fixture_html("search_empty.html")) == []
+
+
+def test_parse_sections_reads_the_filter_ids():
+    assert HttpSearchEngine.parse_sections(fixture_html("search_page1.html")) == SECTIONS
+
+
+def test_resolve_section_reads_the_filter_once(site):
+    engine = HttpSearchEngine(site_url=site)
+
+    assert engine.resolve_section("wildfire", "Califronia") == SECTIONS["California"]
+    assert len(SearchSite.requests) == 1
+    assert SearchSite.requests[0]["q"] == ["wildfire"]
+
+    # Learned: resolved again without a request, as is any topic of the catalog
+    assert engine.resolve_section("wildfire", "california") == SECTIONS["California"]
+    assert engine.resolve_section("drought", "world nation") == SECTIONS["World & Nation"]
+    assert len(SearchSite.requests) == 1
+
+
+def test_collect_articles_reads_every_page_until_an_empty_one(site):
+    engine = HttpSearchEngine(site_url=site, prefetch_pages=2)
+    pay = Payload(phrase_test="wildfire", sort_by=1, results=0, engine="http")
+
+    articles = engine.collect_articles(pay)
+
+    assert len(articles) == 8
+    assert articles[0].title == "Wildfire forces evacuations in the Angeles National Forest"
+    assert articles[-1].title == "State adds 20 dollars per household for wildfire prevention"
+    assert len({article.url for article in articles}) == 8
+    # Page 1 alone, then windows of 2 pages until the empty page 4
+    assert pages_requested() == [1, 2, 3, 4, 5]
+    assert all(query["s"] == ["1"] for query in SearchSite.requests)
+
+
+def test_collect_articles_stops_at_the_quota(site):
+    engine = HttpSearchEngine(site_url=site, prefetch_pages=4)
+    pay = Payload(phrase_test="wildfire", sort_by=1, results=4, engine="http")
+
+    articles = engine.collect_articles(pay)
+
+    assert len(articles) == 4
+    assert articles[3].title == "Brush fire near Malibu is contained"
+    # 1 article missing after page 1 (3 per page): only page 2 is fetched
+    assert pages_requested() == [1, 2]
+
+
+def test_collect_articles_filters_by_section(site):
+    engine = HttpSearchEngine(site_url=site, prefetch_pages=4)
+    pay = Payload(phrase_test="wildfire", section="Politics", sort_by=1, results=3, engine="http")
+
+    articles = engine.collect_articles(pay)
+
+    assert len(articles) == 3
+    # One request to read the filters, then the results page with the filter id
+    assert SearchSite.requests[-1]["f0"] == [SECTIONS["Politics"]]
@@ -0,0 +1,180 @@
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler
+import pytest
+from tasks_methods.image_downloader import ImageDownloader
+from tasks_methods.image_store import ImageStore
+
+IMAGE = b"\xff\xd8\xff\xe0" + bytes(range(256)) * 64
+
+
+class ImageCdn(BaseHTTPRequestHandler):
+    """
+    Stands in for the image CDN:
+    /img/<n>.jpg   the image, after a short delay;
+    /flaky/<n>.jpg 429, then 503, then the image;
+    /missing.jpg   404;
+    /slow.jpg      answers after 2 seconds;
+    /broken.jpg    announces more bytes than it sends, then closes.
+    """
+
+    hits = Counter()
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with self.lock:
+            self.hits[self.path] += 1
+            attempt = self.hits[self.path]
+            ImageCdn.in_flight += 1
+            ImageCdn.max_in_flight = max(ImageCdn.max_in_flight, ImageCdn.in_flight)
+        try:
+            if self.path.startswith("/img/"):
+                time.sleep(0.1)
+                self.__send(IMAGE)
+            elif self.path.startswith("/flaky/"):
+                if attempt == 1:
+                    self.send_error(429)
+                elif attempt == 2:
+                    self.send_error(503)
+                else:
+                    self.__send(IMAGE)
+            elif self.path == "/slow.jpg":
+                time.sleep(2)
+                self.__send(IMAGE)
+            elif self.path == "/broken.jpg":
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(IMAGE) * 10))
+                self.end_headers()
+                self.wfile.write(IMAGE)
+                self.wfile.flush()
+                self.close_connection = True
+            else:
+                self.send_error(404)
+        finally:
+            with self.lock:
+                ImageCdn.in_flight -= 1
+
+    def __send(self, body: bytes) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "image/jpeg")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def cdn(http_server):
+    ImageCdn.hits = Counter()
+    ImageCdn.in_flight = 0
+    ImageCdn.max_in_flight = 0
+    return http_server(ImageCdn)
+
+
+def leftovers(directory) -> list:
+    return [path.name for path in directory.rglob("*") if path.name.endswith((".part", ".tmp", ".link"))]
+
+
+def test_download_all_bounds_the_requests_in_flight(cdn, tmp_path):
+    downloader = ImageDownloader(workers=3, timeout=5, retries=0)
+    jobs = [(f"{cdn}img/{n}.jpg", str(tmp_path / f"{n}.jpg")) for n in range(12)]
+
+    paths = downloader.download_all(jobs)
+
+    assert paths == [path for _, path in jobs]
+    assert all((tmp_path / f"{n}.jpg").read_bytes() == IMAGE for n in range(12))
+    assert ImageCdn.max_in_flight == 3
+    assert downloader.stats["downloaded"] == 12
+    assert downloader.stats["bytes"] == 12 * len(IMAGE)
+
+
+def test_throttling_and_server_errors_are_retried_with_backoff(cdn, tmp_path):
+    downloader = ImageDownloader(workers=1, timeout=5, retries=3, backoff=0.1)
+    url = f"{cdn}flaky/1.jpg"
+
+    start = time.perf_counter()
+    path = downloader.download(url, str(tmp_path / "1.jpg"))
+    seconds = time.perf_counter() - start
+
+    assert path == str(tmp_path / "1.jpg")
+    assert (tmp_path / "1.jpg").read_bytes() == IMAGE
+    assert ImageCdn.hits["/flaky/1.jpg"] == 3
+    assert downloader.stats["retries"] == 2
+    # Backoff of 0.1s then 0.2s, each with up to 100% jitter
+    assert seconds >= 0.3
+
+
+def test_retries_give_up_after_the_limit(cdn, tmp_path):
+    downloader = ImageDownloader(workers=1, timeout=5, retries=1, backoff=0.01)
+
+    assert downloader.download(f"{cdn}flaky/2.jpg", str(tmp_path / "2.jpg")) is None
+    assert ImageCdn.hits["/flaky/2.jpg"] == 2
+    assert downloader.stats["failed"] == 1
+    assert not (tmp_path / "2.jpg").exists()
+
+
+def test_not_found_is_not_retried(cdn, tmp_path):
+    downloader = ImageDownloader(workers=1, timeout=5, retries=3, backoff=0.01)
+
+    assert downloader.download(f"{cdn}missing.jpg", str(tmp_path / "missing.jpg")) is None
+    assert ImageCdn.hits["/missing.jpg"] == 1
+    assert downloader.stats["retries"] == 0
+    assert downloader.stats["failed"] == 1
+
+
+def test_slow_responses_time_out(cdn, tmp_path):
+    downloader = ImageDownloader(workers=1, timeout=0.3, retries=1, backoff=0.01)
+
+    start = time.perf_counter()
+    assert downloader.download(f"{cdn}slow.jpg", str(tmp_path / "slow.jpg")) is None
+    seconds = time.perf_counter() - start
+
+    assert ImageCdn.hits["/slow.jpg"] == 2
+    assert seconds < 1.5
+    assert not (tmp_path / "slow.jpg").exists()
+
+
+def test_failed_downloads_leave_no_partial_files(cdn, tmp_path):
+    downloader = ImageDownloader(workers=4, timeout=0.3, retries=1, backoff=0.01)
+    names = ["broken.jpg", "slow.jpg", "missing.jpg", "flaky/3.jpg"]
+    jobs = [(f"{cdn}{name}", str(tmp_path / "out" / name.replace("/", "-"))) for name in names]
+
+    paths = downloader.download_all(jobs)
+
+    assert paths == [None, None, None, None]
+    assert not (tmp_path / "out").exists() or not any((tmp_path / "out").iterdir())
+    assert leftovers(tmp_path) == []
+
+
+def test_failed_downloads_leave_nothing_in_the_store(cdn, tmp_path):
+    store = ImageStore(str(tmp_path / "store"), max_bytes=10_000_000)
+    downloader = ImageDownloader(workers=2, timeout=0.3, retries=1, backoff=0.01, store=store)
+    jobs = [
+        (f"{cdn}broken.jpg", str(tmp_path / "out" / "broken.jpg")),
+        (f"{cdn}img/1.jpg", str(tmp_path / "out" / "1.jpg")),
+    ]
+
+    paths = downloader.download_all(jobs)
+
+    assert paths == [None, str(tmp_path / "out" / "1.jpg")]
+    assert leftovers(tmp_path) == []
+    assert [path.name for path in (tmp_path / "store" / "objects").iterdir()] == [
+        store.lookup(f"{cdn}img/1.jpg")["sha256"]
+    ]
+
+
+def test_a_batch_keeps_the_counters_of_the_background_downloads(cdn, tmp_path):
+    downloader = ImageDownloader(workers=2, timeout=5, retries=0)
+    background = downloader.submit(f"{cdn}slow.jpg", str(tmp_path / "slow.jpg"))
+    jobs = [(f"{cdn}img/{n}.jpg", str(tmp_path / f"{n}.jpg")) for n in range(3)]
+
+    downloader.download_all(jobs)
+
+    assert background.result(5) == str(tmp_path / "slow.jpg")
+    assert downloader.stats["requested"] == 4
+    assert downloader.stats["downloaded"] == 4
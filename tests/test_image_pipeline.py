@@ -0,0 +1,87 @@
+import threading
+from concurrent.futures import Future
+from helpers.article import Article
+from helpers.article_batch import ArticleBatch
+from tasks_methods.image_pipeline import ImagePipeline
+
+
+class Downloader:
+    """
+    Stands in for the ImageDownloader: every download stays pending until
+    the test resolves its future.
+    """
+
+    def __init__(self) -> None:
+        self.futures = []
+
+    def submit(self, url: str, path: str) -> Future:
+        self.futures.append(Future())
+        return self.futures[-1]
+
+    def flush_store(self) -> None:
+        pass
+
+
+def batch_of(count: int) -> ArticleBatch:
+    return ArticleBatch.from_articles([Article(title=f"Article {n}") for n in range(count)])
+
+
+def test_completed_downloads_fill_the_batch_then_call_back():
+    downloader = Downloader()
+    pipeline = ImagePipeline(downloader)
+    batch = batch_of(2)
+    written = []
+
+    pipeline.start(batch, [(0, "u0", "p0"), (1, "u1", "p1")], on_complete=lambda: written.append(1), key="k")
+    downloader.futures[1].set_result("p1")
+    downloader.futures[0].set_result(None)
+
+    assert pipeline.wait(timeout=2)
+    assert batch.picture_local_path == [None, "p1"]
+    assert written == [1]
+
+
+def test_an_older_batch_does_not_call_back_after_a_newer_one():
+    downloader = Downloader()
+    pipeline = ImagePipeline(downloader)
+    written = []
+
+    pipeline.start(batch_of(1), [(0, "u", "old")], on_complete=lambda: written.append("old"), key="k")
+    pipeline.start(batch_of(1), [(0, "u", "new")], on_complete=lambda: written.append("new"), key="k")
+    downloader.futures[1].set_result("new")
+    downloader.futures[0].set_result("old")
+
+    assert pipeline.wait(timeout=2)
+    assert written == ["new"]
+
+
+def test_an_export_waits_for_the_call_back_of_an_older_batch():
+    downloader = Downloader()
+    pipeline = ImagePipeline(downloader)
+    written = []
+    writing = threading.Event()
+    release = threading.Event()
+
+    def old_export():
+        writing.set()
+        release.wait(2)
+        written.append("old")
+
+    def new_export():
+        with pipeline.export_lock("k"):
+            written.append("new")
+            pipeline.start(batch_of(0), [], key="k")
+
+    pipeline.start(batch_of(1), [(0, "u", "old")], on_complete=old_export, key="k")
+    threading.Thread(target=downloader.futures[0].set_result, args=("old",)).start()
+    assert writing.wait(2)
+    consumer = threading.Thread(target=new_export)
+    consumer.start()
+    consumer.join(0.2)
+
+    # The older batch passed its check: the new export waits for its write
+    assert consumer.is_alive()
+    release.set()
+    consumer.join(2)
+    assert pipeline.wait(timeout=2)
+    assert written == ["old", "new"]
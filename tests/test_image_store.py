@@ -0,0 +1,50 @@
+import hashlib
+import multiprocessing
+from tasks_methods.image_store import ImageStore
+
+WORKERS = 4
+IMAGES = 15
+SIZE = 1000
+
+
+def add_images(directory: str, worker: int, max_bytes: int) -> None:
+    store = ImageStore(directory, max_bytes=max_bytes)
+    for n in range(IMAGES):
+        content = f"{worker}-{n}".encode().ljust(SIZE, b"\0")
+        tmp_path = store.temp_path()
+        tmp_path.write_bytes(content)
+        store.add(f"https://cdn.example.com/{worker}/{n}.jpg", tmp_path, hashlib.sha256(content).hexdigest(), SIZE)
+        store.evict()
+
+
+def run_workers(directory: str, max_bytes: int) -> None:
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=add_images, args=(directory, worker, max_bytes)) for worker in range(WORKERS)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(60)
+    assert [process.exitcode for process in processes] == [0] * WORKERS
+
+
+def test_parallel_processes_index_every_image(tmp_path):
+    run_workers(str(tmp_path), max_bytes=10_000_000)
+
+    store = ImageStore(str(tmp_path), max_bytes=10_000_000)
+    urls = [f"https://cdn.example.com/{worker}/{n}.jpg" for worker in range(WORKERS) for n in range(IMAGES)]
+    assert all(store.lookup(url) for url in urls)
+    assert len(list((tmp_path / "objects").iterdir())) == WORKERS * IMAGES
+
+
+def test_parallel_processes_share_the_disk_budget(tmp_path):
+    run_workers(str(tmp_path), max_bytes=20 * SIZE)
+
+    objects = sorted(path.name for path in (tmp_path / "objects").iterdir())
+    store = ImageStore(str(tmp_path), max_bytes=20 * SIZE)
+    urls = [f"https://cdn.example.com/{worker}/{n}.jpg" for worker in range(WORKERS) for n in range(IMAGES)]
+    indexed = sorted(entry["sha256"] for entry in map(store.lookup, urls) if entry)
+    # Every object on disk is indexed, and together they fit the budget
+    assert len(objects) == 20
+    assert objects == indexed
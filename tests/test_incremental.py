@@ -0,0 +1,74 @@
+import pytest
+from test_http_engine import SearchSite, site  # noqa: F401 (fixture)
+from helpers.payload import Payload
+from tasks_methods.article_store import ArticleStore
+from tasks_methods.export_sinks import read_rows
+from tasks_methods.http_engine import HttpSearchEngine
+from tasks_methods.image_pipeline import ImagePipeline
+from tasks_methods.methods import ExcelOtherMethods, ScraperMethods
+from tasks_methods.output_partitions import OutputPartitions
+
+
+@pytest.fixture
+def incremental(site, tmp_path, monkeypatch):  # noqa: F811
+    monkeypatch.setattr(HttpSearchEngine, "_default", HttpSearchEngine(site_url=site, prefetch_pages=1))
+    monkeypatch.setattr(OutputPartitions, "_default", OutputPartitions(str(tmp_path / "partitions")))
+    store = ArticleStore(str(tmp_path / "articles.sqlite3"))
+    monkeypatch.setattr(ArticleStore, "_default", store)
+    # No image downloads from the saved pages' CDN
+    monkeypatch.setattr(ExcelOtherMethods, "image_jobs", staticmethod(lambda batch: []))
+    yield OutputPartitions.default()
+    ImagePipeline.default().wait()
+    store.close()
+
+
+def run(pay: Payload) -> None:
+    assert ScraperMethods.process_payload(None, pay)
+    ImagePipeline.default().wait()
+
+
+def merged_urls(partitions: OutputPartitions, tmp_path) -> list[str]:
+    paths = partitions.merge("csv", directory=str(tmp_path / "merged"))
+    return [values[-1] for values in read_rows(paths["csv"])]
+
+
+def test_stopping_on_a_known_page_keeps_the_previous_partition(incremental, tmp_path, monkeypatch):
+    pay = Payload(phrase_test="wildfire", sort_by=1, results=0, engine="http", outputs="csv")
+    monkeypatch.setenv("stop_on_known_page", "True")
+    monkeypatch.setenv("skip_known_articles", "False")
+
+    run(pay)
+    SearchSite.requests = []
+    run(pay)
+
+    # The second run stops after its first, fully known page...
+    assert [query.get("p", ["1"])[0] for query in SearchSite.requests] == ["1"]
+    entries = list(incremental.entries().values())
+    assert [entry["rows"] for entry in entries] == [8, 3]
+    # ...in its own partition, so the merge still has every article
+    assert len(merged_urls(incremental, tmp_path)) == 8
+
+
+def test_skipping_known_articles_exports_only_new_ones(incremental, tmp_path, monkeypatch):
+    pay = Payload(phrase_test="wildfire", sort_by=1, results=0, engine="http", outputs="csv")
+    monkeypatch.setenv("skip_known_articles", "True")
+    monkeypatch.setenv("stop_on_known_page", "False")
+
+    run(pay)
+    run(pay)
+
+    # The second run finds nothing new and writes no partition
+    assert [entry["rows"] for entry in incremental.entries().values()] == [8]
+    assert len(merged_urls(incremental, tmp_path)) == 8
+
+
+def test_without_incremental_flags_a_rerun_replaces_its_partition(incremental, tmp_path, monkeypatch):
+    pay = Payload(phrase_test="wildfire", sort_by=1, results=0, engine="http", outputs="csv")
+    monkeypatch.setenv("skip_known_articles", "False")
+    monkeypatch.setenv("stop_on_known_page", "False")
+
+    run(pay)
+    run(pay)
+
+    assert list(incremental.entries()) == [OutputPartitions.key(pay)]
+    assert len(merged_urls(incremental, tmp_path)) == 8
@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from helpers.article import Article
+from helpers.payload import Payload
+from tasks_methods.export_sinks import read_rows
+from tasks_methods.output_partitions import OutputPartitions
+
+FORMATS = ("xlsx", "csv", "jsonl", "parquet")
+PACIFIC = timezone(timedelta(hours=-7))
+
+
+def articles() -> list[Article]:
+    return [
+        # No URL: identified by title and date, with a time zone
+        Article(title="Wildfire  Forces Evacuations", date=datetime(2024, 6, 5, 18, 30, tzinfo=PACIFIC)),
+        Article(title="Insurance bill", date=datetime(2024, 6, 4), url="https://example.com/insurance"),
+    ]
+
+
+@pytest.mark.parametrize("first", FORMATS)
+@pytest.mark.parametrize("second", FORMATS)
+def test_merge_dedups_articles_without_url_across_formats(tmp_path, first, second):
+    partitions = OutputPartitions(str(tmp_path / "partitions"))
+    partitions.write(articles(), Payload(phrase_test="wildfire"), first)
+    partitions.write(articles(), Payload(phrase_test="fire"), second)
+
+    paths = partitions.merge("jsonl", directory=str(tmp_path))
+    rows = list(read_rows(paths["jsonl"]))
+
+    assert [row[0] for row in rows] == ["Wildfire  Forces Evacuations", "Insurance bill"]
+
+
+@pytest.mark.parametrize("extension", FORMATS)
+def test_dates_read_back_as_the_same_instant(tmp_path, extension):
+    partitions = OutputPartitions(str(tmp_path / "partitions"))
+    paths = partitions.write(articles(), Payload(phrase_test="wildfire"), extension)
+
+    date = next(read_rows(paths[extension]))[1]
+
+    assert date.replace(tzinfo=date.tzinfo or timezone.utc) == datetime(2024, 6, 6, 1, 30, tzinfo=timezone.utc)
+
+
+def test_a_run_merges_only_the_partitions_it_wrote(tmp_path):
+    earlier = OutputPartitions(str(tmp_path / "partitions"))
+    earlier.write([Article(title="Drought", url="https://example.com/drought")], Payload(phrase_test="drought"), "csv")
+    run = OutputPartitions(str(tmp_path / "partitions"))
+    run.write(articles(), Payload(phrase_test="wildfire"), "csv")
+    run.write(articles(), Payload(phrase_test="wildfire"), "jsonl")
+
+    assert run.written == [OutputPartitions.key(Payload(phrase_test="wildfire"))]
+    paths = run.merge("csv", directory=str(tmp_path), keys=run.written)
+    assert [row[0] for row in read_rows(paths["csv"])] == ["Wildfire  Forces Evacuations", "Insurance bill"]
@@ -0,0 +1,23 @@
+import pytest
+from helpers.payload import Payload
+from tasks_methods.export_sinks import SINKS
+
+
+def row(**fields) -> dict:
+    return {"phrase_test": "wildfire", "sort_by": "1", "results": "0", **fields}
+
+
+@pytest.mark.parametrize("extension", SINKS)
+def test_every_sink_is_an_output_format(extension):
+    assert Payload.from_dict(row(outputs=extension.upper())).outputs == extension
+
+
+def test_outputs_are_normalized_without_duplicates():
+    assert Payload.from_dict(row(outputs="csv, .parquet csv")).outputs == "csv,parquet"
+    assert Payload.from_dict(row(outputs=["jsonl", "xlsx"])).outputs == "jsonl,xlsx"
+    assert Payload.from_dict(row()).outputs == ""
+
+
+def test_unknown_output_formats_are_rejected():
+    with pytest.raises(ValueError, match="Unknown output format: pdf"):
+        Payload.from_dict(row(outputs="csv,pdf"))
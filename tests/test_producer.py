@@ -0,0 +1,42 @@
+import pytest
+from tasks_methods.methods import ProducerMethods
+
+HEADER = "phrase_test,section,data_range,sort_by,results\n"
+
+
+@pytest.fixture
+def emitted(monkeypatch):
+    payloads = []
+
+    def flush(batch):
+        payloads.extend(batch)
+        count = len(batch)
+        batch.clear()
+        return count
+
+    monkeypatch.setattr(ProducerMethods, "_ProducerMethods__flush_work_items", staticmethod(flush))
+    return payloads
+
+
+def test_rejected_rows_go_to_the_reject_file(tmp_path, emitted):
+    plan = tmp_path / "plan.csv"
+    plan.write_text(HEADER + "wildfire,California,1,1,15\n,Politics,1,1,15\ndrought,,0,x,5\n", encoding="utf-8")
+    rejects = tmp_path / "rejected_rows.csv"
+
+    stats = ProducerMethods.stream_csv_create_work_items(str(plan), 2, str(rejects))
+
+    assert (stats["rows"], stats["created"], stats["rejected"]) == (3, 1, 2)
+    assert [pay.phrase_test for pay in emitted] == ["wildfire"]
+    assert [line.split(",")[0] for line in rejects.read_text(encoding="utf-8").splitlines()] == ["line", "3", "4"]
+
+
+def test_a_clean_run_removes_the_rejects_of_an_earlier_run(tmp_path, emitted):
+    plan = tmp_path / "plan.csv"
+    plan.write_text(HEADER + "wildfire,California,1,1,15\n", encoding="utf-8")
+    rejects = tmp_path / "rejected_rows.csv"
+    rejects.write_text("line,phrase_test,error\n2,,ValueError('phrase_test is empty')\n", encoding="utf-8")
+
+    stats = ProducerMethods.stream_csv_create_work_items(str(plan), 2, str(rejects))
+
+    assert stats["rejected"] == 0
+    assert not rejects.exists()
@@ -0,0 +1,30 @@
+import multiprocessing
+from helpers.selector import Selector
+from webdriver_util.selector_stats import SelectorStats
+
+SELECTORS = [Selector(css="h1.title"), Selector(css="h2.title")]
+WORKERS = 4
+LOOKUPS = 40
+
+
+def worker(path: str) -> None:
+    stats = SelectorStats(path)
+    for lookup in range(LOOKUPS):
+        stats.record("title", SELECTORS, SELECTORS[lookup % 2])
+        stats.flush()
+
+
+def test_parallel_processes_add_up_their_lookups(tmp_path):
+    path = str(tmp_path / "selector_stats.json")
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=worker, args=(path,)) for _ in range(WORKERS)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(60)
+
+    assert [process.exitcode for process in processes] == [0] * WORKERS
+    report = SelectorStats(path).report()["title"]
+    assert report[str(SELECTORS[0])]["hits"] == WORKERS * LOOKUPS // 2
+    assert report[str(SELECTORS[1])]["hits"] == WORKERS * LOOKUPS // 2
+    assert report[str(SELECTORS[0])]["misses"] == WORKERS * LOOKUPS // 2
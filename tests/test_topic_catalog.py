@@ -0,0 +1,25 @@
+from tasks_methods.topic_catalog import TopicCatalog
+
+SITE = "https://www.latimes.com/"
+TOPICS = {"California": "id-california", "Politics": "id-politics"}
+
+
+def test_learned_sections_are_resolved_without_the_page(tmp_path):
+    catalog = TopicCatalog(str(tmp_path / "topic_catalog.json"), SITE)
+
+    assert catalog.learn("Califronia", TOPICS) == "id-california"
+
+    reloaded = TopicCatalog(str(tmp_path / "topic_catalog.json"), SITE)
+    assert reloaded.section_id("Califronia") == "id-california"
+    assert reloaded.section_id("politics") == "id-politics"
+
+
+def test_an_updated_topic_id_reaches_the_learned_sections(tmp_path):
+    catalog = TopicCatalog(str(tmp_path / "topic_catalog.json"), SITE)
+    catalog.learn("Califronia", TOPICS)
+
+    assert catalog.update({"California": "id-california-2"})
+
+    assert catalog.section_id("Califronia") == "id-california-2"
+    reloaded = TopicCatalog(str(tmp_path / "topic_catalog.json"), SITE)
+    assert reloaded.section_id("Califronia") == "id-california-2"
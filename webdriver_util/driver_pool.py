@@ -0,0 +1,238 @@
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+from dotenv import load_dotenv
+from RPA.Browser.Selenium import Selenium
+from selenium.common import WebDriverException
+from Log.logs import Logs
+from webdriver_util.webdrv_util import get_driver, navigate
+
+load_dotenv("config/.env")
+logger = Logs.Returnlog(os.getenv("name_app"), "Driver Pool")
+
+MAX_USES = 25
+
+
+@dataclass
+class DriverSession:
+    """
+    A warm browser session owned by a DriverPool.
+
+    Attributes:
+    -----------
+    driver : Selenium
+        The Selenium instance returned by get_driver.
+    uses : int
+        How many work items the session has served.
+    """
+
+    driver: Selenium = None
+    uses: int = 0
+
+
+class DriverPool:
+    """
+    Keeps browser sessions warm between work items.
+
+    A session is reset cheaply when it is released (extra tabs, cookies,
+    storage and navigation history) and recycled after max_uses work items
+    or as soon as it stops answering, so only the first work item pays the
+    Chrome startup cost.
+    """
+
+    def __init__(
+        self,
+        site_url: str,
+        headless: bool = False,
+        size: int = 1,
+        max_uses: int | None = None,
+    ) -> None:
+        self.site_url = site_url
+        self.headless = headless
+        self.size = size
+        self.max_uses = max_uses or int(os.getenv("driver_max_uses") or MAX_USES)
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._created = 0
+        self.stats = {"created": 0, "reused": 0, "recycled": 0}
+
+    def __create(self) -> DriverSession | None:
+        """
+        Launches a new browser session with get_driver.
+
+        Returns:
+            DriverSession | None: The new session or None if the browser could not be started.
+        """
+        start = perf_counter()
+        driver = get_driver(site_url=self.site_url, headless=self.headless)
+        if driver is None:
+            with self._lock:
+                self._created -= 1
+            return None
+        self.stats["created"] += 1
+        logger.info(f"Browser session started in {perf_counter() - start:.2f}s")
+        return DriverSession(driver=driver)
+
+    def __discard(self, session: DriverSession) -> None:
+        """
+        Closes a session and frees its slot in the pool.
+
+        Args:
+            session (DriverSession): The session to close.
+        """
+        with self._lock:
+            self._created -= 1
+        self.stats["recycled"] += 1
+        try:
+            session.driver.close_browser()
+        except Exception as e:
+            logger.warning(f"Error closing browser session: {e}")
+
+    @staticmethod
+    def is_healthy(session: DriverSession) -> bool:
+        """
+        Checks if the browser behind a session still answers commands.
+
+        Args:
+            session (DriverSession): The session to check.
+
+        Returns:
+            bool: True if the browser answered, otherwise False.
+        """
+        try:
+            return session.driver.driver.execute_script("return document.readyState") is not None
+        except WebDriverException as e:
+            logger.warning(f"Unhealthy browser session: {e.msg}")
+            return False
+        except Exception as e:
+            logger.warning(f"Unhealthy browser session: {e}")
+            return False
+
+    def reset(self, session: DriverSession) -> bool:
+        """
+        Brings a session back to a clean state on the home page: closes the
+        extra tabs, clears cookies, web storage and navigation history.
+
+        Args:
+            session (DriverSession): The session to reset.
+
+        Returns:
+            bool: True if the session was reset, otherwise False.
+        """
+        try:
+            web_driver = session.driver.driver
+            handles = web_driver.window_handles
+            for handle in handles[1:]:
+                web_driver.switch_to.window(handle)
+                web_driver.close()
+            web_driver.switch_to.window(handles[0])
+            session.driver.delete_all_cookies()
+            web_driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+            session.driver.execute_cdp("Page.resetNavigationHistory", {})
+            navigate(session.driver, self.site_url)
+            return True
+        except Exception as e:
+            logger.warning(f"Browser session could not be reset: {e}")
+            return False
+
+    def prewarm(self) -> int:
+        """
+        Starts sessions until the pool is full.
+
+        Returns:
+            int: The number of idle sessions.
+        """
+        while True:
+            with self._lock:
+                if self._created >= self.size:
+                    break
+                self._created += 1
+            session = self.__create()
+            if session is None:
+                break
+            self._idle.put(session)
+        return self._idle.qsize()
+
+    def acquire(self, timeout: float | None = None) -> DriverSession | None:
+        """
+        Returns a warm session, starting a new one only when the pool is not full.
+
+        Args:
+            timeout (float | None): Seconds to wait for a session to be released when the pool is full.
+
+        Returns:
+            DriverSession | None: A ready session or None if none could be obtained.
+        """
+        while True:
+            try:
+                session = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_create = self._created < self.size
+                    if can_create:
+                        self._created += 1
+                if can_create:
+                    return self.__create()
+                try:
+                    session = self._idle.get(timeout=timeout)
+                except queue.Empty:
+                    logger.error("No browser session was released in time")
+                    return None
+
+            if self.is_healthy(session):
+                self.stats["reused"] += 1
+                return session
+            self.__discard(session)
+
+    def release(self, session: DriverSession, healthy: bool = True) -> None:
+        """
+        Gives a session back to the pool, resetting it for the next work item,
+        or recycles it if it is unhealthy or reached max_uses.
+
+        Args:
+            session (DriverSession): The session being released.
+            healthy (bool): False if the caller knows the session is broken.
+        """
+        session.uses += 1
+        if not healthy or session.uses >= self.max_uses or not self.reset(session):
+            logger.info(f"Recycling browser session after {session.uses} uses")
+            self.__discard(session)
+            return
+        self._idle.put(session)
+
+    @contextmanager
+    def session(self, timeout: float | None = None):
+        """
+        Context manager that acquires a session and releases it on exit.
+
+        Yields:
+            Selenium | None: The Selenium instance of the session, or None if none could be obtained.
+        """
+        session = self.acquire(timeout)
+        if session is None:
+            yield None
+            return
+        try:
+            yield session.driver
+        except Exception:
+            self.release(session, healthy=self.is_healthy(session))
+            raise
+        else:
+            self.release(session)
+
+    def close(self) -> None:
+        """
+        Closes every idle session of the pool.
+        """
+        while True:
+            try:
+                session = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self.__discard(session)
+        logger.info(f"Driver pool closed: {self.stats}")
@@ -0,0 +1,197 @@
+import atexit
+import json
+import os
+import threading
+from pathlib import Path
+from time import monotonic
+from dotenv import load_dotenv
+from helpers.file_lock import file_lock
+from helpers.selector import Selector
+from Log.logs import Logs
+
+load_dotenv("config/.env")
+logger = Logs.Returnlog(os.getenv("name_app"), "Selector Stats")
+
+EXPIRE_AFTER = 50
+FLUSH_SECONDS = 30
+
+
+class SelectorStats:
+    """
+    Hit statistics of the fallback selectors of each logical lookup, persisted
+    between runs so the selector that usually matches is tried first.
+
+    For every lookup key the store keeps how many lookups were made and, per
+    selector, how many of them it won and the lookup number of its last win.
+    A selector that has not won in the last expire_after lookups of its key
+    is expired: it is left out of the race and only checked once, without
+    waiting, when the active selectors find nothing.
+
+    Counts are accumulated in memory and merged into the file on flush,
+    under a file lock, so parallel worker processes add their lookups
+    instead of overwriting them.
+    """
+
+    _default = None
+
+    def __init__(self, path: str, expire_after: int | None = None) -> None:
+        self.path = Path(path)
+        self.expire_after = expire_after or int(os.getenv("selector_expire_after") or EXPIRE_AFTER)
+        self._lock = threading.Lock()
+        self._stats = self.__load()
+        self._pending = {}
+        self._last_flush = monotonic()
+
+    @classmethod
+    def default(cls) -> "SelectorStats":
+        """
+        Returns the store shared by the current process, configured from .env.
+
+        Returns:
+            SelectorStats: The shared store.
+        """
+        if cls._default is None:
+            cls._default = cls(
+                os.getenv("selector_stats_file") or os.path.join("output", "selector_stats.json")
+            )
+            atexit.register(cls._default.flush)
+        return cls._default
+
+    @staticmethod
+    def lookup_key(selectors: list[Selector], label: str | None = None) -> str:
+        """
+        Returns the key of a logical lookup: its label or its selectors.
+
+        Args:
+            selectors (list[Selector]): The selectors of the lookup.
+            label (str | None): A stable name for the lookup.
+
+        Returns:
+            str: The lookup key.
+        """
+        return label or " | ".join(str(selector) for selector in selectors)
+
+    def order(self, key: str, selectors: list[Selector]) -> tuple[list[Selector], list[Selector]]:
+        """
+        Splits the selectors of a lookup into active ones, the most winning
+        first, and expired ones. Declaration order breaks the ties.
+
+        Args:
+            key (str): The lookup key.
+            selectors (list[Selector]): The selectors in declaration order.
+
+        Returns:
+            tuple[list[Selector], list[Selector]]: The active and the expired selectors.
+        """
+        with self._lock:
+            entry = self.__entry(key)
+            lookups = entry["lookups"]
+            ranked = sorted(
+                selectors,
+                key=lambda selector: -entry["selectors"].get(str(selector), {}).get("hits", 0),
+            )
+            active = []
+            expired = []
+            for selector in ranked:
+                stat = entry["selectors"].get(str(selector))
+                if stat and lookups - stat["last_hit"] >= self.expire_after:
+                    expired.append(selector)
+                else:
+                    active.append(selector)
+        if not active:
+            return expired, []
+        return active, expired
+
+    def record(self, key: str, selectors: list[Selector], winner: Selector | None) -> None:
+        """
+        Records the outcome of a lookup.
+
+        Args:
+            key (str): The lookup key.
+            selectors (list[Selector]): Every selector of the lookup.
+            winner (Selector | None): The selector that matched, None if none did.
+        """
+        with self._lock:
+            entry = self.__entry(key)
+            pending = self._pending.setdefault(key, {"lookups": 0, "selectors": {}})
+            entry["lookups"] += 1
+            pending["lookups"] += 1
+            for selector in selectors:
+                name = str(selector)
+                stat = entry["selectors"].setdefault(name, {"hits": 0, "last_hit": entry["lookups"] - 1})
+                delta = pending["selectors"].setdefault(name, {"hits": 0, "since_hit": None})
+                if delta["since_hit"] is not None:
+                    delta["since_hit"] += 1
+                if selector is winner:
+                    stat["hits"] += 1
+                    stat["last_hit"] = entry["lookups"]
+                    delta["hits"] += 1
+                    delta["since_hit"] = 0
+            due = monotonic() - self._last_flush >= FLUSH_SECONDS
+        if due:
+            self.flush()
+
+    def report(self) -> dict:
+        """
+        Returns the hit and miss counts of every selector, to monitor site drift.
+
+        Returns:
+            dict: {lookup key: {selector: {"hits", "misses", "expired"}}}.
+        """
+        with self._lock:
+            return {
+                key: {
+                    name: {
+                        "hits": stat["hits"],
+                        "misses": entry["lookups"] - stat["hits"],
+                        "expired": entry["lookups"] - stat["last_hit"] >= self.expire_after,
+                    }
+                    for name, stat in entry["selectors"].items()
+                }
+                for key, entry in self._stats.items()
+            }
+
+    def flush(self) -> None:
+        """
+        Merges the lookups recorded by this process into the file, atomically
+        and under the file lock, so no other process merges in between.
+        """
+        with self._lock:
+            self._last_flush = monotonic()
+            if not self._pending:
+                return
+            try:
+                with file_lock(self.path):
+                    stats = self.__load()
+                    for key, pending in self._pending.items():
+                        entry = stats.setdefault(key, {"lookups": 0, "selectors": {}})
+                        entry["lookups"] += pending["lookups"]
+                        for name, delta in pending["selectors"].items():
+                            stat = entry["selectors"].setdefault(
+                                name, {"hits": 0, "last_hit": entry["lookups"] - pending["lookups"]}
+                            )
+                            stat["hits"] += delta["hits"]
+                            if delta["since_hit"] is not None:
+                                stat["last_hit"] = entry["lookups"] - delta["since_hit"]
+                    tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                    with open(tmp_path, mode="w", encoding="utf-8") as file:
+                        json.dump(stats, file, indent=4)
+                    os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.warning(f"Selector stats not saved: {e}")
+                return
+            self._stats = stats
+            self._pending = {}
+
+    def __entry(self, key: str) -> dict:
+        return self._stats.setdefault(key, {"lookups": 0, "selectors": {}})
+
+    def __load(self) -> dict:
+        try:
+            with open(self.path, mode="r", encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError as e:
+            logger.warning(f"Ignoring corrupted selector stats {self.path}: {e}")
+            return {}
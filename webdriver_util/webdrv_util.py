@@ -1,4 +1,4 @@
-import difflib
+import json
 import os
 import random
 import re
@@ -7,7 +7,7 @@ import requests
 from Log.logs import Logs
 from dotenv import load_dotenv
 from RPA.Browser.Selenium import Selenium
-from time import sleep
+from time import monotonic, sleep
 from selenium.common import (
     ElementClickInterceptedException,
     ElementNotInteractableException,
@@ -22,7 +22,9 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
+from helpers.fuzzy_index import FuzzyIndex
 from helpers.selector import Selector
+from webdriver_util.selector_stats import SelectorStats
 from selenium.webdriver.chrome.options import Options
 from datetime import datetime, timedelta
 
@@ -34,6 +36,45 @@ logger = Logs.Returnlog(os.getenv("name_app"), "Scraping")
 
 TIMEOUT = 5
 RETRYATTEMPTS = 2
+# Below this similarity a section name is considered not found
+FUZZY_MIN_SCORE = float(os.getenv("fuzzy_min_score") or 0.3)
+
+# URL patterns blocked at the network layer (Network.setBlockedURLs) by profile
+AD_TRACKER_URLS = [
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*googletagservices.com*",
+    "*googletagmanager.com*",
+    "*google-analytics.com*",
+    "*adservice.google.com*",
+    "*amazon-adsystem.com*",
+    "*adnxs.com*",
+    "*rubiconproject.com*",
+    "*pubmatic.com*",
+    "*criteo.com*",
+    "*moatads.com*",
+    "*taboola.com*",
+    "*outbrain.com*",
+    "*scorecardresearch.com*",
+    "*chartbeat.com*",
+    "*chartbeat.net*",
+    "*quantserve.com*",
+    "*krxd.net*",
+    "*permutive.com*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*nr-data.net*",
+    "*newrelic.com*",
+    "*optimizely.com*",
+]
+FONT_MEDIA_URLS = ["*.woff*", "*.ttf*", "*.otf*", "*.eot*", "*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*"]
+IMAGE_URLS = ["*.jpg*", "*.jpeg*", "*.png*", "*.gif*", "*.webp*", "*.avif*", "*.svg*"]
+BLOCK_PROFILES = {
+    "none": [],
+    "light": AD_TRACKER_URLS + FONT_MEDIA_URLS,
+    # Image src attributes stay in the DOM, only the downloads are blocked
+    "strict": AD_TRACKER_URLS + FONT_MEDIA_URLS + IMAGE_URLS,
+}
 
 
 def parse_time_ago(text) -> datetime | None:
@@ -68,22 +109,184 @@ def parse_time_ago(text) -> datetime | None:
     return result_time
 
 
+def parse_article_date(text: str) -> datetime:
+    """
+    Parses the timestamp of a search result, either relative ("2 hours ago")
+    or absolute ("June 5, 2024").
+
+    Args:
+        text (str): The timestamp text of the search result.
+
+    Returns:
+        datetime: The parsed datetime.
+
+    Raises:
+        ValueError: If the text matches neither format.
+    """
+    parse = parse_time_ago(text)
+    if parse is not None:
+        return parse
+    return datetime.strptime(text.strip(), "%B %d, %Y")
+
+
+def date_window_start(months: int, now: datetime | None = None) -> datetime | None:
+    """
+    Returns the oldest date of a window of months: 1 is the current month
+    only, 2 the current and previous month, and so on.
+
+    Args:
+        months (int): The number of months in the window (0 or less means no window).
+        now (datetime | None): The reference date (default is now).
+
+    Returns:
+        datetime | None: The first day of the oldest month, or None if there is no window.
+    """
+    if months <= 0:
+        return None
+    now = now or datetime.now()
+    month_index = now.year * 12 + now.month - 1 - (months - 1)
+    return datetime(month_index // 12, month_index % 12 + 1, 1)
+
+
+def apply_date_window(articles: list, date_from: datetime | None, newest_first: bool) -> tuple[list, bool]:
+    """
+    Drops the articles older than the date window. When the results are
+    sorted newest-first, the first older article ends the collection.
+
+    Args:
+        articles (list[Article]): The articles of a results page, in page order.
+        date_from (datetime | None): The oldest date accepted (None keeps everything).
+        newest_first (bool): True if the results are sorted by newest.
+
+    Returns:
+        tuple[list, bool]: The articles kept and True if the collection should stop.
+    """
+    if date_from is None:
+        return articles, False
+    kept = []
+    for article in articles:
+        if article.date and article.date < date_from:
+            if newest_first:
+                logger.info(f"Article older than {date_from:%Y-%m-%d} found, stopping the collection")
+                return kept, True
+            continue
+        kept.append(article)
+    return kept, False
+
+
+# Opened on purpose to read the topics: never an overlay to dismiss
+FILTER_PANEL_SELECTOR = "div.search-filter-menu-wrapper"
+
+# Finds a blocking overlay: a visible fixed-position element covering at least
+# half of the viewport on top of its center, or an open aria-modal dialog,
+# other than the filter panel (arguments[1]).
+# When asked, dismisses it with its close button or removes it from the DOM.
+# Returns a short description of the overlay, or null if there is none.
+OVERLAY_JS = """
+const dismiss = arguments[0], ignored = arguments[1];
+const vw = window.innerWidth, vh = window.innerHeight;
+const isIgnored = e => e.matches(ignored) || e.closest(ignored) !== null || e.querySelector(ignored) !== null;
+const isBlocking = e => {
+    if (isIgnored(e)) { return false; }
+    const st = getComputedStyle(e);
+    if (st.display === "none" || st.visibility === "hidden" || Number(st.opacity) === 0 || st.pointerEvents === "none") {
+        return false;
+    }
+    const r = e.getBoundingClientRect();
+    const w = Math.min(r.right, vw) - Math.max(r.left, 0);
+    const h = Math.min(r.bottom, vh) - Math.max(r.top, 0);
+    return w > 0 && h > 0 && w * h >= 0.5 * vw * vh;
+};
+let overlay = null;
+let e = document.elementFromPoint(vw / 2, vh / 2);
+for (; e && e !== document.body && e !== document.documentElement; e = e.parentElement) {
+    if (getComputedStyle(e).position === "fixed" && isBlocking(e)) { overlay = e; break; }
+}
+if (!overlay) {
+    overlay = Array.from(document.querySelectorAll('[aria-modal="true"], dialog[open]'))
+        .find(e => e.getClientRects().length && getComputedStyle(e).visibility !== "hidden" && !isIgnored(e)) || null;
+}
+if (!overlay) { return null; }
+const description = overlay.tagName.toLowerCase() + (overlay.id ? "#" + overlay.id : "")
+    + (typeof overlay.className === "string" && overlay.className ? "." + overlay.className.trim().split(/\\s+/).join(".") : "");
+if (dismiss) {
+    const close = overlay.querySelector('[aria-label*="close" i], button[class*="close" i], [data-dismiss], button[title*="close" i]');
+    if (close) { close.click(); } else { overlay.remove(); }
+    document.documentElement.style.overflow = "";
+    document.body.style.overflow = "";
+}
+return description;
+"""
+
+
 def wait_for_modal(driver, timeout=15, search_click=True):
     """
-    Waits for a modal to close. This is a blocking function that scrolls down to activate the modal and waits for it to close.
+    Waits while a blocking overlay (modal, paywall, ad layer) covers the page,
+    dismissing it when possible. Without an overlay it returns right away.
+    The section filter panel is not an overlay, even when open.
 
     Args:
         driver (WebDriver): The Selenium WebDriver instance.
         timeout (int): The number of seconds to wait before timing out.
-        search_click (bool): Whether or not to search for the modal.
+        search_click (bool): Whether to dismiss the overlay (close button or removal).
+
+    Returns:
+        bool: True if no overlay is blocking the page, False otherwise.
+    """
+    try:
+        overlay = driver.execute_script(OVERLAY_JS, search_click, FILTER_PANEL_SELECTOR)
+        if not overlay:
+            return True
+
+        logger.info(f"Blocking overlay found: {overlay}")
+        closed = wait_for(
+            lambda: driver.execute_script(OVERLAY_JS, search_click, FILTER_PANEL_SELECTOR) is None,
+            timeout=timeout,
+            label="overlay to close",
+            driver=driver,
+        )
+        if closed:
+            logger.info("Modal closed.")
+            return True
+        logger.warning(f"Overlay still blocking the page after {timeout}s: {overlay}")
+        return False
+    except JavascriptException as e:
+        logger.error(f"Overlay detection failed: {e.msg}")
+        return True
+
+
+def extract_search_results(driver) -> list[dict]:
+    """
+    Extracts title, timestamp, description, picture and article URL of every
+    search result on the page in a single script call. Texts are the rendered
+    texts (innerText), as returned by WebElement.text.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
 
     Returns:
-        bool: True if the modal was closed, False otherwise.
+        list: One dict per result, with None for the fields that were not found.
     """
-    driver.execute_script("document.body.innerHTML += '';")
-    sleep(0.800)
-    logger.info("Modal closed.")
-    return True
+    return driver.execute_script(
+        """
+        const text = (li, css) => {
+            const elm = li.querySelector(css);
+            return elm ? elm.innerText.trim() : null;
+        };
+        const items = document.querySelectorAll('ul[class*="search-results-module-results-menu"] li');
+        return Array.from(items).map(li => {
+            const img = li.querySelector('img[src*=".jpg"]');
+            const link = li.querySelector("h3[class='promo-title'] a");
+            return {
+                title: text(li, "h3[class='promo-title']"),
+                timestamp: text(li, "p[class^='promo-timestamp']"),
+                description: text(li, "p[class='promo-description']"),
+                picture: img ? img.src : null,
+                url: link ? link.href : null,
+            };
+        });
+        """
+    ) or []
 
 
 def extract_names_from_list_items(driver):
@@ -104,6 +307,54 @@ def extract_names_from_list_items(driver):
     return names
 
 
+def read_section_filters(driver) -> dict[str, str]:
+    """
+    Reads the section filter of the search page in a single script call,
+    without opening the filter modal.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+
+    Returns:
+        dict: The filter ids (checkbox values) by section name.
+    """
+    pairs = driver.execute_script(
+        """
+        return Array.from(document.querySelectorAll("div.search-filter-menu-wrapper li")).map(li => {
+            const span = li.querySelector("span");
+            const input = li.querySelector("input");
+            return [span ? span.textContent.trim() : "", input ? input.value : ""];
+        }).filter(pair => pair[0] && pair[1]);
+        """
+    )
+    return dict(pairs or [])
+
+
+def click_section_filter(driver, section_id: str) -> str | None:
+    """
+    Clicks the topic of the section filter with the given filter id, in a
+    single script call and without opening the filter modal.
+
+    Args:
+        driver (WebDriver): The Selenium WebDriver instance.
+        section_id (str): The filter id (checkbox value) of the topic.
+
+    Returns:
+        str | None: The name of the clicked topic or None if the page has no such topic.
+    """
+    return driver.execute_script(
+        """
+        const li = Array.from(document.querySelectorAll("div.search-filter-menu-wrapper li"))
+            .find(li => { const input = li.querySelector("input"); return input && input.value === arguments[0]; });
+        if (!li) { return null; }
+        const span = li.querySelector("span");
+        (span || li.querySelector("input")).click();
+        return span ? span.textContent.trim() : arguments[0];
+        """,
+        section_id,
+    )
+
+
 def search_and_click_topics(driver, names: list, target_name):
     """
     Search and click topics. This is a helper function for find_fuzzy.
@@ -116,9 +367,9 @@ def search_and_click_topics(driver, names: list, target_name):
     Returns:
         tuple: (bool, bool) indicating if topics were found and clicked.
     """
-    best_match_name = find_fuzzy(names, lambda x: x, target_name)
+    best_match_name = find_fuzzy(names, lambda x: x, target_name, FUZZY_MIN_SCORE)
 
-    if not len(best_match_name.strip()) > 0:
+    if not best_match_name or not len(best_match_name.strip()) > 0:
         logger.error(f"Topic not found '{target_name}'.")
         return False, True
     else:
@@ -214,14 +465,68 @@ def search_and_click_topics(driver, names: list, target_name):
     return None
 
   
-def get_driver(site_url: str, headless: bool = False) -> Selenium | None:
+def navigation_stats(browser: Selenium) -> dict:
+    """
+    Reports the network usage since the previous call (from the Chrome
+    performance log) and the page-load time of the current page.
+
+    Args:
+        browser (Selenium): The Selenium instance created by get_driver.
+
+    Returns:
+        dict: bytes (transferred), requests, blocked (requests) and load_ms.
+    """
+    stats = {"bytes": 0, "requests": 0, "blocked": 0, "load_ms": None}
+    try:
+        for entry in browser.driver.get_log("performance"):
+            message = json.loads(entry["message"])["message"]
+            if message["method"] == "Network.loadingFinished":
+                stats["requests"] += 1
+                stats["bytes"] += int(message["params"].get("encodedDataLength", 0))
+            elif message["method"] == "Network.loadingFailed" and message["params"].get("blockedReason"):
+                stats["blocked"] += 1
+        stats["load_ms"] = browser.driver.execute_script(
+            """
+            const nav = performance.getEntriesByType("navigation")[0];
+            return nav ? Math.round(nav.loadEventEnd || nav.domContentLoadedEventEnd) : null;
+            """
+        )
+    except (WebDriverException, ValueError, KeyError) as e:
+        logger.debug(f"Navigation stats not available: {e}")
+    return stats
+
+
+def navigate(browser: Selenium, url: str) -> dict:
+    """
+    Loads a URL and logs the page-load time, the bytes transferred and the
+    requests blocked by the blocking profile.
+
+    Args:
+        browser (Selenium): The Selenium instance created by get_driver.
+        url (str): The URL to load.
+
+    Returns:
+        dict: The statistics returned by navigation_stats.
+    """
+    navigation_stats(browser)  # discard the events of the previous page
+    browser.go_to(url=url)
+    stats = navigation_stats(browser)
+    logger.info(
+        f"Loaded {url} in {stats['load_ms']} ms: {stats['bytes'] / 1024:.0f} KiB in "
+        f"{stats['requests']} requests, {stats['blocked']} requests blocked"
+    )
+    return stats
+
+
+def get_driver(site_url: str, headless: bool = False, block_profile: str | None = None) -> Selenium | None:
     """
     Returns a Selenium object to interact with the site. It is used for testing purposes.
 
     Args:
         site_url (str): URL of the site to connect to.
         headless (bool): True if you want to use headless mode.
-        use_proxy (bool): True if you want to use a proxy.
+        block_profile (str | None): Network blocking profile: "none", "light" (ads, trackers,
+            fonts and media) or "strict" (also images). Default from .env.
 
     Returns:
         Selenium | None: Instance of Selenium that is ready to interact, or None if an error occurs.
@@ -245,6 +550,8 @@ def get_driver(site_url: str, headless: bool = False) -> Selenium | None:
         options.add_argument("--log-level=3")
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
+        # Performance log, used to report the bytes transferred per navigation
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
         # Add headless mode options if required
         if headless:
             options.add_argument("--headless")
@@ -255,9 +562,22 @@ def get_driver(site_url: str, headless: bool = False) -> Selenium | None:
         browser.open_browser(url="about:blank", browser='chrome', options=options)
         browser.maximize_browser_window()
         browser.set_selenium_page_load_timeout(60)
-        browser.set_browser_implicit_wait(5)
+        # Waits are explicit (wait_for_elements), an implicit wait would stack on them
+        browser.set_browser_implicit_wait(0)
+        browser.driver.set_script_timeout(60)
+
+        # Block the unneeded resources at the network layer
+        block_profile = block_profile or os.getenv("block_profile") or "none"
+        blocked_urls = BLOCK_PROFILES.get(block_profile)
+        if blocked_urls is None:
+            logger.error(f"Unknown block profile: {block_profile}")
+        elif blocked_urls:
+            browser.execute_cdp("Network.enable", {})
+            browser.execute_cdp("Network.setBlockedURLs", {"urls": blocked_urls})
+            logger.info(f"Block profile '{block_profile}': {len(blocked_urls)} URL patterns")
+
         logger.info(f"Accessing the site: {site_url}")
-        browser.go_to(url=site_url)
+        navigate(browser, site_url)
         browser.delete_all_cookies()
 
         # Execute JavaScript to remove the webdriver property
@@ -357,14 +677,200 @@ def js_click(driver, elm):
     return None
 
 
+# Resolves as soon as one of the element specs matches, re-checking on every
+# DOM mutation instead of polling, with [index of the spec, matching elements];
+# when several specs match at once the first one wins. Resolves with null at the deadline.
+WAIT_FOR_ELEMENTS_JS = """
+const [specs, root, ms] = arguments;
+const done = arguments[arguments.length - 1];
+const scope = root || document;
+const isVisible = e => !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length)
+    && getComputedStyle(e).visibility !== "hidden";
+const matchSpec = spec => {
+    let found;
+    if (spec.by === "xpath") {
+        const snapshot = document.evaluate(spec.query, scope, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        found = Array.from({length: snapshot.snapshotLength}, (_, i) => snapshot.snapshotItem(i));
+    } else {
+        found = Array.from(scope.querySelectorAll(spec.query));
+    }
+    return found.filter(e =>
+        (!spec.visible || isVisible(e))
+        && (spec.text === null || (e.innerText || "").trim().toLowerCase().includes(spec.text))
+        && (spec.attr === null || (e.getAttribute(spec.attr) || "").trim().toLowerCase().includes(spec.value))
+    );
+};
+const match = () => {
+    for (let i = 0; i < specs.length; i++) {
+        const found = matchSpec(specs[i]);
+        if (found.length) { return [i, found]; }
+    }
+    return null;
+};
+let result = match();
+if (result || ms <= 0) { done(result); return; }
+const finish = value => { observer.disconnect(); clearTimeout(timer); done(value); };
+const observer = new MutationObserver(() => { result = match(); if (result) finish(result); });
+const timer = setTimeout(() => finish(match()), ms);
+observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+"""
+
+# Resolves on the next DOM mutation, or false at the deadline.
+WAIT_FOR_DOM_CHANGE_JS = """
+const ms = arguments[0];
+const done = arguments[arguments.length - 1];
+const finish = changed => { observer.disconnect(); clearTimeout(timer); done(changed); };
+const observer = new MutationObserver(() => finish(true));
+const timer = setTimeout(() => finish(false), ms);
+observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+"""
+
+# Longest single in-page wait, bounds a mutation missed between two checks
+DOM_WAIT_SLICE = 1.0
+
+
+def element_spec(
+    query: str,
+    by: str = "css",
+    visible: bool = True,
+    text: str | None = None,
+    attr: tuple | None = None,
+) -> dict:
+    """
+    Builds the element spec matched in the page by WAIT_FOR_ELEMENTS_JS.
+
+    Args:
+        query (str): The CSS selector or XPath.
+        by (str): "css" or "xpath".
+        visible (bool): Only match visible elements.
+        text (str | None): Only match elements whose text contains this value.
+        attr (tuple | None): (attribute, value): only match elements whose attribute contains the value.
+
+    Returns:
+        dict: The element spec.
+    """
+    attr_name, attr_value = attr if attr else (None, None)
+    return {
+        "by": by,
+        "query": query,
+        "visible": visible,
+        "text": normalize(text) if text is not None else None,
+        "attr": attr_name,
+        "value": normalize(attr_value) if attr_value is not None else None,
+    }
+
+
+def selector_spec(selector: Selector, visible: bool = True) -> dict:
+    """
+    Converts a Selector into an element spec: XPath selectors match present
+    elements, CSS selectors (with optional text or attribute) visible ones.
+
+    Args:
+        selector (Selector): The selector.
+        visible (bool): Only match visible elements with CSS selectors.
+
+    Returns:
+        dict: The element spec.
+    """
+    if selector.xpath:
+        return element_spec(selector.xpath, by="xpath", visible=False)
+    return element_spec(
+        selector.css,
+        visible=visible,
+        text=selector.text or None,
+        attr=selector.attr or None,
+    )
+
+
+def wait_for_first(
+    driver: WebDriver,
+    specs: list[dict],
+    timeout: float = TIMEOUT,
+    root: WebElement | None = None,
+) -> tuple[int | None, list[WebElement]]:
+    """
+    Watches several element specs at once and returns whichever matches
+    first, in a single WebDriver round trip, notified by DOM mutations.
+
+    Args:
+        driver (WebDriver): Chrome driver.
+        specs (list[dict]): The element specs (element_spec / selector_spec).
+        timeout (float): Timeout in seconds (0 checks once without waiting).
+        root (WebElement | None): Search only below this element.
+
+    Returns:
+        tuple[int | None, list[WebElement]]: The index of the matching spec and its
+        elements, or (None, []) if none matched before the timeout.
+    """
+    try:
+        result = driver.execute_async_script(
+            WAIT_FOR_ELEMENTS_JS, specs, root, int(timeout * 1000)
+        )
+    except TimeoutException:
+        logger.debug(f"Script timeout while waiting for {[spec['query'] for spec in specs]}")
+        return None, []
+    if not result:
+        return None, []
+    index, found = result
+    return index, found
+
+
+def wait_for_elements(
+    driver: WebDriver,
+    query: str,
+    by: str = "css",
+    timeout: float = TIMEOUT,
+    visible: bool = True,
+    text: str | None = None,
+    attr: tuple | None = None,
+    root: WebElement | None = None,
+) -> list[WebElement]:
+    """
+    Waits inside the page, notified by DOM mutations, until elements match.
+    Returns as soon as they appear, in a single WebDriver round trip.
+
+    Args:
+        driver (WebDriver): Chrome driver.
+        query (str): The CSS selector or XPath.
+        by (str): "css" or "xpath".
+        timeout (float): Timeout in seconds (0 checks once without waiting).
+        visible (bool): Only return visible elements.
+        text (str | None): Only return elements whose text contains this value.
+        attr (tuple | None): (attribute, value): only return elements whose attribute contains the value.
+        root (WebElement | None): Search only below this element.
+
+    Returns:
+        list[WebElement]: The matching elements, empty if none appeared before the timeout.
+    """
+    _, found = wait_for_first(
+        driver, [element_spec(query, by, visible, text, attr)], timeout, root
+    )
+    return found
+
+
+def wait_for_dom_change(driver: WebDriver, timeout: float) -> bool:
+    """
+    Blocks until the DOM of the page changes or the timeout expires.
+
+    Args:
+        driver (WebDriver): Chrome driver.
+        timeout (float): Timeout in seconds.
+
+    Returns:
+        bool: True if the DOM changed, False on timeout.
+    """
+    try:
+        return bool(driver.execute_async_script(WAIT_FOR_DOM_CHANGE_JS, int(timeout * 1000)))
+    except (JavascriptException, TimeoutException):
+        return False
+
+
 def click_elm(driver, elm, timeout=TIMEOUT):
     try:
         label = "Trying to click"
 
         def get():
-            return [
-                WebDriverWait(driver, TIMEOUT).until(EC.element_to_be_clickable(elm))
-            ]
+            return [elm] if elm.is_displayed() and elm.is_enabled() else []
 
         element_to_click = find_it(driver, elements=get, timeout=TIMEOUT, label=label)
         if element_to_click:
@@ -398,14 +904,7 @@ def find_with_label(driver, tag, label, timeout=TIMEOUT):
 
 def find_all_with_attribute(driver, tag, attr, value, timeout=TIMEOUT):
     try:
-        target = normalize(value)
-        return [
-            e
-            for e in WebDriverWait(driver, TIMEOUT).until(
-                EC.visibility_of_any_elements_located(locator=[By.TAG_NAME, tag])
-            )
-            if e.get_attribute(attr) and (target in normalize(e.get_attribute(attr)))
-        ]
+        return wait_for_elements(driver, tag, timeout=timeout, attr=(attr, value))
     except (
         ElementClickInterceptedException,
         ElementNotInteractableException,
@@ -439,14 +938,10 @@ def find_all_elm_with_attribute(elm: WebElement, tag, attr, value, timeout=TIMEO
 def find_elm_picture(elm: WebElement, selector: Selector, timeout=TIMEOUT):
     try:
         logger.debug(f"Trying to find: {selector.css}")
-        sleep(0.2)
-        e = WebDriverWait(elm, timeout).until(
-            EC.visibility_of_element_located((By.CSS_SELECTOR, selector.css))
-        )
-        if e:
-            str_picture = e.get_attribute("src")
-            sleep(0.4)
-            return str_picture
+        found = wait_for_elements(elm.parent, selector.css, timeout=timeout, root=elm)
+        if found:
+            return found[0].get_attribute("src")
+        logger.debug(f"Not Found: {selector.css}")
     except (NoSuchElementException, TimeoutException):
         logger.debug(f"Not Found: {selector.css}")
 
@@ -454,12 +949,9 @@ def find_elm_picture(elm: WebElement, selector: Selector, timeout=TIMEOUT):
 def find_with_attribute(driver, tag, attr, value, timeout=TIMEOUT):
     try:
         label = "find_with_attribute %s %s %s" % (tag, attr, value)
-        return find_it(
-            driver,
-            lambda: find_all_with_attribute(driver, tag, attr, value),
-            timeout=TIMEOUT,
-            label=label,
-        )
+        logger.debug(f"Waiting for {label}")
+        found = find_all_with_attribute(driver, tag, attr, value, timeout)
+        return found[0] if found else None
     except (
         ElementClickInterceptedException,
         ElementNotInteractableException,
@@ -475,17 +967,9 @@ def find_with_text(driver, tag, text, timeout=TIMEOUT):
     try:
         target = normalize(text)
         label = "find_with_text %s %s" % (tag, target)
-
-        def get():
-            return [
-                e
-                for e in WebDriverWait(driver, timeout).until(
-                    EC.visibility_of_any_elements_located(locator=[By.TAG_NAME, tag])
-                )
-                if target in normalize(e.text)
-            ]
-
-        return find_it(driver, get, timeout=TIMEOUT, label=label)
+        logger.debug(f"Waiting for {label}")
+        found = wait_for_elements(driver, tag, timeout=timeout, text=target)
+        return found[0] if found else None
     except (
         ElementClickInterceptedException,
         ElementNotInteractableException,
@@ -501,19 +985,9 @@ def find_css_with_text(driver, css_selector, text, timeout=TIMEOUT):
     try:
         target = normalize(text)
         label = f"find_css_with_text {css_selector} {target}"
-
-        def get():
-            return [
-                e
-                for e in WebDriverWait(driver, timeout).until(
-                    EC.visibility_of_any_elements_located(
-                        locator=[By.CSS_SELECTOR, css_selector]
-                    )
-                )
-                if target in normalize(e.text)
-            ]
-
-        return find_it(driver, get, timeout=TIMEOUT, label=label)
+        logger.debug(f"Waiting for {label}")
+        found = wait_for_elements(driver, css_selector, timeout=timeout, text=target)
+        return found[0] if found else None
     except (
         ElementClickInterceptedException,
         ElementNotInteractableException,
@@ -528,18 +1002,9 @@ def find_css_with_text(driver, css_selector, text, timeout=TIMEOUT):
 def find_css(driver, css_selector, timeout=TIMEOUT):
     try:
         label = "find_css %s" % css_selector
-
-        def get():
-            return [
-                e
-                for e in WebDriverWait(driver, timeout).until(
-                    EC.visibility_of_any_elements_located(
-                        locator=[By.CSS_SELECTOR, css_selector]
-                    )
-                )
-            ]
-
-        return find_it(driver, elements=get, timeout=TIMEOUT, label=label)
+        logger.debug(f"Waiting for {label}")
+        found = wait_for_elements(driver, css_selector, timeout=timeout)
+        return found[0] if found else None
     except (
         ElementClickInterceptedException,
         ElementNotInteractableException,
@@ -553,7 +1018,7 @@ def find_css(driver, css_selector, timeout=TIMEOUT):
 
 def find_all_css(driver: WebDriver, css_selector, timeout=TIMEOUT):
     try:
-        return driver.find_elements(By.CSS_SELECTOR, css_selector)
+        return wait_for_elements(driver, css_selector, timeout=timeout, visible=False)
     except (
         ElementClickInterceptedException,
         ElementNotInteractableException,
@@ -565,16 +1030,70 @@ def find_all_css(driver: WebDriver, css_selector, timeout=TIMEOUT):
         return None
 
 
+def race_selectors(
+    driver: WebDriver,
+    selectors: list[Selector],
+    timeout: float = TIMEOUT,
+    label: str | None = None,
+    plain_css_visible: bool = True,
+) -> tuple[Selector | None, list[WebElement]]:
+    """
+    Watches the selectors of a logical lookup at once, the historically winning
+    one first, and records which one matched in the SelectorStats store.
+    Expired selectors are only checked once, without waiting, when the active
+    ones find nothing.
+
+    Args:
+        driver (WebDriver): Chrome driver.
+        selectors (list[Selector]): The fallback selectors of the lookup.
+        timeout (float): Timeout in seconds.
+        label (str | None): A stable name for the lookup in the stats (default: the selectors).
+        plain_css_visible (bool): Only match visible elements with CSS selectors without text or attribute.
+
+    Returns:
+        tuple[Selector | None, list[WebElement]]: The selector that matched and its elements,
+        or (None, []) if none matched before the timeout.
+    """
+    stats = SelectorStats.default()
+    key = stats.lookup_key(selectors, label)
+    active, expired = stats.order(key, selectors)
+
+    def specs(candidates):
+        return [
+            selector_spec(
+                selector, visible=plain_css_visible or bool(selector.text or selector.attr)
+            )
+            for selector in candidates
+        ]
+
+    winner = None
+    index, found = wait_for_first(driver, specs(active), timeout)
+    if found:
+        winner = active[index]
+    elif expired:
+        index, found = wait_for_first(driver, specs(expired), 0)
+        if found:
+            winner = expired[index]
+            logger.warning(f"Expired selector matched again: {winner}")
+    stats.record(key, selectors, winner)
+    return winner, found
+
+
 def find_element(
-    driver: WebDriver, selectors: Selector | list[Selector], timeout: int = TIMEOUT
+    driver: WebDriver,
+    selectors: Selector | list[Selector],
+    timeout: int = TIMEOUT,
+    label: str | None = None,
 ) -> WebElement | None:
     """
-    Find an element by CSS, text, or XPath. If a list of selectors is provided, it will try to find the first one that matches.
+    Find an element by CSS, text, or XPath. If a list of selectors is provided, all of them
+    are watched at once, the one that matched most often in previous runs first.
 
     Args:
         driver (WebDriver): Chrome driver.
         selectors (Selector | list[Selector]): List of Selectors.
         timeout (int): Timeout in seconds.
+        label (str | None): A stable name for the lookup in the selector stats.
 
     Returns:
         WebElement: The element if found, None otherwise.
@@ -582,76 +1101,52 @@ def find_element(
     if not isinstance(selectors, list):
         selectors = [selectors]
 
-    for selector in selectors:
-        elm = None
-        logger.debug(f"Trying to find {selector.css}")
-        try:
-            if selector.xpath:
-                elm = WebDriverWait(driver, timeout).until(
-                    EC.presence_of_element_located(locator=[By.XPATH, selector.xpath])
-                )
-            elif selector.css and selector.attr:
-                attr, value = selector.attr
-                elm = find_with_attribute(driver, selector.css, attr, value, TIMEOUT)
-            elif selector.css and selector.text:
-                elm = find_css_with_text(
-                    driver, selector.css, selector.text, timeout=TIMEOUT
-                )
-            elif selector.css:
-                elm = find_css(driver, selector.css, timeout=TIMEOUT)
-            if elm:
-                logger.debug(f"Found element: {elm}")
-                return elm
-        except NoSuchElementException:
-            logger.warning(f"Element not found using selector: {selector}")
-        except TimeoutException:
-            logger.warning(f"Timeout while waiting for element with selector: {selector}")
-        except Exception as e:
-            logger.critical(f"Unexpected error occurred while finding element: {e}")
-
+    logger.debug(f"Trying to find {', '.join(str(selector) for selector in selectors)}")
+    try:
+        winner, found = race_selectors(driver, selectors, timeout, label)
+        if found:
+            logger.debug(f"Found element with selector: {winner}")
+            return found[0]
+        logger.warning(f"Timeout while waiting for element with selectors: {selectors}")
+    except NoSuchElementException:
+        logger.warning(f"Element not found using selectors: {selectors}")
+    except Exception as e:
+        logger.critical(f"Unexpected error occurred while finding element: {e}")
 
 
 def find_elements(
-    driver: WebDriver, selectors: Selector | list[Selector], timeout: int = TIMEOUT
-) -> WebElement | None:
+    driver: WebDriver,
+    selectors: Selector | list[Selector],
+    timeout: int = TIMEOUT,
+    label: str | None = None,
+) -> list[WebElement] | None:
     """
-    Find an element by CSS, text, or XPath. If a list of selectors is provided, it will try to find the first one that matches.
+    Find elements by CSS, text, or XPath. If a list of selectors is provided, all of them
+    are watched at once, the one that matched most often in previous runs first, and the
+    elements of the first one that matches are returned.
 
     Args:
         driver (WebDriver): Chrome driver.
         selectors (Selector | list[Selector]): List of Selectors.
         timeout (int): Timeout in seconds.
+        label (str | None): A stable name for the lookup in the selector stats.
 
     Returns:
-        WebElement: The element if found, None otherwise.
+        list[WebElement]: The elements if found, None otherwise.
     """
     if not isinstance(selectors, list):
         selectors = [selectors]
 
-    for selector in selectors:
-        elm = None
-        logger.debug(f"Trying to find {selector.css}")
-        try:
-            if selector.xpath:
-                elm = WebDriverWait(driver, timeout).until(
-                    EC.presence_of_all_elements_located(
-                        locator=[By.XPATH, selector.xpath]
-                    )
-                )
-            elif selector.css and selector.attr:
-                attr, value = selector.attr
-                elm = find_with_attribute(driver, selector.css, attr, value, timeout)
-            elif selector.css and selector.text:
-                elm = find_css_with_text(
-                    driver, selector.css, selector.text, timeout=TIMEOUT
-                )
-            elif selector.css:
-                elm = find_all_css(driver, selector.css, timeout=TIMEOUT)
-            if elm:
-                logger.debug(f"Found element: {elm}")
-                return elm
-        except (TimeoutException, NoSuchElementException):
-            continue
+    logger.debug(f"Trying to find {', '.join(str(selector) for selector in selectors)}")
+    try:
+        winner, found = race_selectors(
+            driver, selectors, timeout, label, plain_css_visible=False
+        )
+        if found:
+            logger.debug(f"Found elements with selector: {winner}")
+            return found
+    except (TimeoutException, NoSuchElementException):
+        return None
 
 
 def select_option(select, option, to_string):
@@ -661,32 +1156,36 @@ def select_option(select, option, to_string):
     Args:
         select (WebElement): Selenium element.
         option (str): Option to select.
-        to_string (function): Function to convert an option to a string.
+        to_string (function | str): Function to convert an option to a string, or the name of the
+            option property to read ("value", "text") for all the options in a single script call.
     """
     if not select:
         return False
     retry(select.click)
     sleep(0.5)
 
-    possible_options = sorted(
-        select.find_elements(By.TAG_NAME, "option"),
-        key=lambda op: difflib.SequenceMatcher(
-            None, normalize(to_string(op)), normalize(str(option))
-        ).ratio(),
-        reverse=True,
-    )
-    if possible_options:
-        best = possible_options[0]
+    possible_options = select.find_elements(By.TAG_NAME, "option")
+    if isinstance(to_string, str):
+        labels = select.parent.execute_script(
+            "return Array.from(arguments[0].options).map(o => o[arguments[1]]);",
+            select,
+            to_string,
+        )
+    else:
+        labels = [to_string(op) for op in possible_options]
+    match = FuzzyIndex.for_candidates([str(label) for label in labels]).best(str(option))
+    if match:
+        best = possible_options[match.index]
         retry(best.click)
         return True
 
 
 def select_option_value(select, option):
-    select_option(select, option, lambda op: op.get_attribute("value"))
+    select_option(select, option, "value")
 
 
 def select_option_text(select, option):
-    select_option(select, option, lambda op: op.text)
+    select_option(select, option, "text")
 
 
 def select_first_option(select):
@@ -702,13 +1201,26 @@ def select_first_option(select):
     select_option_value(select, value)
 
 
-def find_fuzzy(elements, to_string, target):
-    return sorted(
-        elements,
-        key=lambda op: difflib.SequenceMatcher(
-            None, normalize(to_string(op)), normalize(target)
-        ).ratio(),
-    )[-1]
+def find_fuzzy(elements, to_string, target, min_score=0.0):
+    """
+    Returns the element whose string is most similar to the target, using a
+    cached n-gram index of the candidate strings.
+
+    Args:
+        elements (list): The candidates.
+        to_string (function): Function to convert a candidate to a string.
+        target (str): The text to look for.
+        min_score (float): The minimum similarity (0.0 to 1.0) to accept a match.
+
+    Returns:
+        The best matching element, or None if there is no match above min_score.
+    """
+    match = FuzzyIndex.for_candidates([to_string(op) for op in elements]).best(target, min_score)
+    if match is None:
+        logger.warning(f"No match for '{target}' above {min_score}")
+        return None
+    logger.debug(f"'{target}' matched '{match.value}' with score {match.score:.2f}")
+    return elements[match.index]
 
 
 def page_contains(driver, token, timeout=TIMEOUT):
@@ -729,34 +1241,41 @@ def find_it(driver, elements, timeout=TIMEOUT, label=None):
             return results[0]
         return None
 
-    return wait_for(get, timeout=TIMEOUT, label=label)
+    return wait_for(get, timeout=timeout, label=label, driver=driver)
 
 
-def wait_for(fun, timeout=TIMEOUT, label=None):
+def wait_for(fun, timeout=TIMEOUT, label=None, driver=None):
     """
-    Waits for a function to return a value.
+    Waits for a function to return a value, until an overall deadline.
+
+    Between two calls it waits for the next DOM change of the page when a
+    driver is given (short sleeps otherwise), so it returns as soon as the
+    condition holds. The function is called one last time at the deadline.
 
     Args:
         fun (function): Function to be called.
         timeout (int): Timeout in seconds.
         label (str): Label to be printed in the log.
+        driver (WebDriver): Driver of the page whose DOM changes trigger a new check.
 
     Returns:
-        Any: The result of the function if found.
+        Any: The result of the function if found, None otherwise.
     """
-    t = 0
-    while t < timeout:
-        if label:
-            logger.debug(f"Waiting for {label}")
+    deadline = monotonic() + timeout
+    if label:
+        logger.debug(f"Waiting for {label}")
+    while True:
         res = fun()
-        delta = 0.25
         if res:
             logger.info(f"Found {label}")
             return res
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            return None
+        if driver is not None:
+            wait_for_dom_change(driver, min(remaining, DOM_WAIT_SLICE))
         else:
-            sleep(delta)
-            t = t + delta
-    return fun()
+            sleep(min(remaining, 0.05))
 
 
 def retry(fun, on_fail=lambda: True, sleep_time=1, attempts=RETRYATTEMPTS):